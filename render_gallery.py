@@ -0,0 +1,43 @@
+"""Render simulation figures to files without starting Streamlit.
+
+Example:
+    python render_gallery.py all --out gallery --format svg --jobs 8
+"""
+
+import argparse
+import sys
+import time
+
+from toe.batch import has_figure, parse_selection, render_many
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("simulations", nargs="*", default=["all"],
+                        help="simulation numbers or ranges, e.g. 1-10 42 80 (default: all)")
+    parser.add_argument("--out", default="gallery", help="output directory (default: gallery)")
+    parser.add_argument("--format", default="png", choices=["png", "svg"])
+    parser.add_argument("--dpi", type=float, default=None)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for stochastic simulations (default: 0)")
+    args = parser.parse_args(argv)
+
+    numbers = parse_selection(args.simulations)
+    skipped = [n for n in numbers if not has_figure(n)]
+    if skipped:
+        print("Skipping simulations without a figure: {}".format(", ".join(map(str, skipped))))
+
+    start = time.perf_counter()
+    count = 0
+    for result in render_many(numbers, args.out, args.format, args.dpi, args.jobs, args.seed):
+        count += 1
+        print("simulation {:>2}: compute {:7.3f}s  render {:7.3f}s  {:>9,d} bytes  {}".format(
+            result.number, result.compute_seconds, result.render_seconds, result.nbytes, result.path))
+    elapsed = time.perf_counter() - start
+    if count:
+        print("Rendered {} figures in {:.2f}s ({:.1f} figures/second)".format(count, elapsed, count / elapsed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,1124 +1,155 @@
+import os
+import time
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import random
+
+from toe.cache import DEFAULT_MAX_BYTES, RenderCache, render_key
+from toe.charts import DEFAULT_POINTS, downsample, payload_bytes
+from toe.figures import DEFAULT_MAX_FIGURES, FigurePool, figure_bytes, new_axes
+from toe.registry import REGISTRY, categories, load, missing_dependencies
+from toe.rng import SEED_BITS, new_seed, simulation_rng
+from toe.sweep import draw_surface, nearest_index, row, sweep, to_npz
 
 st.title("Theory of Everything Fun and Wild Simulations")
 
 st.sidebar.title("Choose a Simulation")
-simulation = st.sidebar.selectbox("Select a Simulation", list(range(1, 81)))
-
-def simulation_1():
-    st.write("### Simulation 1: Quantum Particle in a Box")
-    st.write("""
-    **Description:** Simulates the wave function of a particle confined in a one-dimensional box.
-    **Usage:** Visualize the quantum states of a particle.
-    **Practical Application:** Understanding quantum confinement in nanomaterials and quantum dots.
-    """)
-    x = np.linspace(0, 1, 1000)
-    n = random.randint(1, 5)
-    psi = np.sqrt(2) * np.sin(n * np.pi * x)
-    plt.plot(x, psi)
-    plt.title("Quantum Particle in a Box (n={})".format(n))
-    st.pyplot(plt)
-
-def simulation_2():
-    st.write("### Simulation 2: Relativistic Effects on a Moving Object")
-    st.write("""
-    **Description:** Demonstrates time dilation effects for objects moving at relativistic speeds.
-    **Usage:** Adjust the velocity slider to see how time dilation changes.
-    **Practical Application:** Understanding the effects of special relativity on high-speed travel and GPS satellite corrections.
-    """)
-    v = st.slider("Velocity (as a fraction of the speed of light)", 0.1, 0.99, 0.5)
-    gamma = 1 / np.sqrt(1 - v**2)
-    st.write(f"Gamma Factor: {gamma}")
-    fig, ax = plt.subplots()
-    ax.plot([0, 1], [0, gamma], label=f'v={v}c')
-    plt.title("Relativistic Time Dilation")
-    plt.xlabel("Proper Time")
-    plt.ylabel("Dilated Time")
-    plt.legend()
-    st.pyplot(fig)
-
-def simulation_3():
-    st.write("### Simulation 3: String Vibrations")
-    st.write("""
-    **Description:** Simulates the vibrations of a string, analogous to fundamental strings in string theory.
-    **Usage:** View the combined waveforms of multiple sine waves.
-    **Practical Application:** Helps in understanding string theory and wave phenomena in physics.
-    """)
-    x = np.linspace(0, 2*np.pi, 1000)
-    y = np.sin(5*x) + np.sin(7*x)
-    plt.plot(x, y)
-    plt.title("String Vibrations")
-    st.pyplot(plt)
-
-def simulation_4():
-    st.write("### Simulation 4: Black Hole Event Horizon")
-    st.write("""
-    **Description:** Simulates the gravitational force near a black hole.
-    **Usage:** Visualize the change in gravitational force as a function of distance from the black hole.
-    **Practical Application:** Helps understand the intense gravitational fields near black holes and their effects.
-    """)
-    r = np.linspace(1, 10, 1000)
-    g = 1 / (r**2)
-    plt.plot(r, g)
-    plt.title("Gravitational Force Near a Black Hole")
-    st.pyplot(plt)
-
-def simulation_5():
-    st.write("### Simulation 5: Quantum Entanglement")
-    st.write("""
-    **Description:** Simulates the concept of quantum entanglement between two particles.
-    **Usage:** Randomly generates the spin states of two entangled particles.
-    **Practical Application:** Fundamental to quantum computing and quantum cryptography.
-    """)
-    q1 = random.choice(['Up', 'Down'])
-    q2 = 'Down' if q1 == 'Up' else 'Up'
-    st.write(f"Particle 1: {q1}")
-    st.write(f"Particle 2: {q2}")
-
-def simulation_6():
-    st.write("### Simulation 6: Multiverse Theory")
-    st.write("""
-    **Description:** Simulates the idea of multiple universes existing simultaneously.
-    **Usage:** Randomly selects a universe from a list of hypothetical universes.
-    **Practical Application:** Explores the implications of the multiverse theory in cosmology and physics.
-    """)
-    universes = ['Universe {}'.format(i) for i in range(1, 11)]
-    chosen_universe = random.choice(universes)
-    st.write(f"You are now in {chosen_universe}!")
-
-def simulation_7():
-    st.write("### Simulation 7: Holographic Principle")
-    st.write("""
-    **Description:** Demonstrates the concept of the holographic principle in physics.
-    **Usage:** Visualize a sinc function representing the principle.
-    **Practical Application:** Provides insight into theories that describe our universe as a hologram.
-    """)
-    x = np.linspace(-5, 5, 1000)
-    y = np.sinc(x)
-    plt.plot(x, y)
-    plt.title("Holographic Principle Representation")
-    st.pyplot(plt)
-
-def simulation_8():
-    st.write("### Simulation 8: Dark Matter Distribution")
-    st.write("""
-    **Description:** Visualizes the distribution of dark matter in a galaxy.
-    **Usage:** View a polar plot representing dark matter density.
-    **Practical Application:** Helps in studying the effects of dark matter on galaxy formation and dynamics.
-    """)
-    theta = np.linspace(0, 2*np.pi, 1000)
-    r = np.abs(np.sin(5*theta))
-    plt.polar(theta, r)
-    plt.title("Dark Matter Distribution in a Galaxy")
-    st.pyplot(plt)
-
-def simulation_9():
-    st.write("### Simulation 9: Gravitational Waves")
-    st.write("""
-    **Description:** Simulates the propagation of gravitational waves.
-    **Usage:** View the wave pattern representing gravitational waves.
-    **Practical Application:** Important for understanding astrophysical phenomena like black hole mergers.
-    """)
-    t = np.linspace(0, 4*np.pi, 1000)
-    h = np.sin(t) * np.sin(10*t)
-    plt.plot(t, h)
-    plt.title("Gravitational Waves Propagation")
-    st.pyplot(plt)
-
-def simulation_10():
-    st.write("### Simulation 10: Quantum Field Fluctuations")
-    st.write("""
-    **Description:** Visualizes random fluctuations in a quantum field.
-    **Usage:** Observe a plot of quantum field fluctuations over time.
-    **Practical Application:** Helps in understanding vacuum energy and particle creation.
-    """)
-    x = np.linspace(0, 10, 1000)
-    y = np.random.normal(size=1000)
-    plt.plot(x, y)
-    plt.title("Quantum Field Fluctuations")
-    st.pyplot(plt)
-
-def simulation_11():
-    st.write("### Simulation 11: Cosmic Inflation")
-    st.write("""
-    **Description:** Simulates the rapid expansion of the early universe.
-    **Usage:** View an exponential growth curve representing cosmic inflation.
-    **Practical Application:** Provides insights into the early moments of the universe and its subsequent evolution.
-    """)
-    t = np.linspace(0, 10, 100)
-    a = np.exp(t)
-    plt.plot(t, a)
-    plt.title("Cosmic Inflation")
-    st.pyplot(plt)
-
-def simulation_12():
-    st.write("### Simulation 12: Supersymmetry Particles")
-    st.write("""
-    **Description:** Generates random supersymmetric particles.
-    **Usage:** Display a randomly selected supersymmetric particle.
-    **Practical Application:** Fundamental to theories extending the Standard Model of particle physics.
-    """)
-    particles = ['Squark', 'Slepton', 'Gluino', 'Neutralino']
-    discovered_particle = random.choice(particles)
-    st.write(f"Discovered Supersymmetry Particle: {discovered_particle}")
-
-def simulation_13():
-    st.write("### Simulation 13: Loop Quantum Gravity Spin Networks")
-    st.write("""
-    **Description:** Visualizes spin networks in loop quantum gravity.
-    **Usage:** Display a network of nodes and edges representing spin networks.
-    **Practical Application:** Provides insights into the quantum structure of spacetime.
-    """)
-    nodes = np.random.rand(10, 2)
-    edges = np.random.randint(0, 10, (15, 2))
-    for edge in edges:
-        plt.plot(nodes[edge, 0], nodes[edge, 1], 'k-')
-    plt.scatter(nodes[:, 0], nodes[:, 1])
-    plt.title("Spin Networks in Loop Quantum Gravity")
-    st.pyplot(plt)
-
-def simulation_14():
-    st.write("### Simulation 14: Quantum Tunneling")
-    st.write("""
-    **Description:** Demonstrates the quantum tunneling effect.
-    **Usage:** Adjust the particle energy to see if it tunnels through a potential barrier.
-    **Practical Application:** Essential in understanding phenomena in semiconductor devices and nuclear fusion.
-    """)
-    E = st.slider("Energy of Particle", 0.1, 10.0, 5.0)
-    V = 7.0
-    if E > V:
-        st.write("Particle Tunnels Through the Barrier")
+category = st.sidebar.selectbox("Category", ["All"] + categories())
+choices = [n for n, info in REGISTRY.items() if category in ("All", info.category)]
+simulation = st.sidebar.selectbox("Select a Simulation", choices,
+                                  format_func=lambda n: f"{n}: {REGISTRY[n].title}")
+
+if "seed" not in st.session_state:
+    st.session_state.seed = new_seed()
+
+def reseed():
+    st.session_state.seed = new_seed()
+
+seed = st.sidebar.number_input("Random seed", min_value=0, max_value=2**SEED_BITS - 1, step=1, key="seed")
+st.sidebar.button("New seed", on_click=reseed)
+
+MATPLOTLIB, NATIVE_CHART = "Matplotlib PNG", "Native chart (LTTB)"
+backend = st.sidebar.radio("Line chart backend", [MATPLOTLIB, NATIVE_CHART])
+chart_points = DEFAULT_POINTS
+if backend == NATIVE_CHART:
+    chart_points = st.sidebar.number_input("Chart points", min_value=100, max_value=100_000,
+                                           value=DEFAULT_POINTS, step=100)
+
+@st.cache_resource
+def get_render_cache():
+    max_bytes = int(os.environ.get("TOE_RENDER_CACHE_BYTES", DEFAULT_MAX_BYTES))
+    return RenderCache(max_bytes=max_bytes)
+
+@st.cache_resource
+def get_figure_pool():
+    max_figures = int(os.environ.get("TOE_MAX_FIGURES", DEFAULT_MAX_FIGURES))
+    return FigurePool(max_figures=max_figures)
+
+render_cache = get_render_cache()
+figure_pool = get_figure_pool()
+
+@st.cache_resource
+def get_sweep(number):
+    """Sweep a simulation over every slider position once per process, with its surface plot and export."""
+    sim = load(number)
+    result = sweep(sim)
+    with figure_pool.figure() as fig:
+        draw_surface(new_axes(fig), result, sim.sweep)
+        png = figure_bytes(fig)
+    return result, png, to_npz(result)
+
+def render_png(sim, data):
+    with figure_pool.figure() as fig:
+        sim.draw(new_axes(fig, polar=sim.polar), data)
+        return figure_bytes(fig)
+
+def run_simulation(sim, params, seed, data=None, on_frame=None):
+    """Return ``(data, png)`` for a simulation, serving it from the render cache when possible.
+
+    The kernel's output is drawn onto a figure borrowed from the shared pool,
+    which is cleared and returned as soon as the PNG has been rasterized.
+    Stochastic kernels draw from a stream derived from ``seed``, which is
+    part of their cache key; deterministic ones are cached independently of
+    it. ``data`` skips the kernel when the output is already known, e.g. from
+    a sweep. Simulations with a ``frames`` generator have each intermediate
+    figure passed to ``on_frame`` while the final one is being computed.
+    """
+    key = render_key(sim.number, params, seed if sim.stochastic else None)
+    entry = render_cache.get(key)
+    if entry is not None:
+        return entry.arrays, entry.png
+    rng = simulation_rng(seed, sim.number)
+    if data is None and sim.frames is not None and on_frame is not None:
+        for data in sim.frames(rng, **params):
+            png = render_png(sim, data)
+            on_frame(png)
     else:
-        st.write("Particle Reflects Back")
-
-def simulation_15():
-    st.write("### Simulation 15: Schrödinger's Cat")
-    st.write("""
-    **Description:** Simulates the quantum superposition of Schrödinger's cat.
-    **Usage:** Randomly determine if the cat is alive or dead.
-    **Practical Application:** Illustrates the concept of superposition in quantum mechanics.
-    """)
-    cat_state = random.choice(['Alive', 'Dead'])
-    st.write(f"Schrödinger's Cat is {cat_state}")
-
-def simulation_16():
-    st.write("### Simulation 16: Quantum Decoherence")
-    st.write("""
-    **Description:** Visualizes the process of quantum decoherence.
-    **Usage:** View the decay of coherence over time.
-    **Practical Application:** Important for understanding the transition from quantum to classical behavior.
-    """)
-    coherence_time = np.linspace(0, 1, 100)
-    decoherence = np.exp(-5 * coherence_time)
-    plt.plot(coherence_time, decoherence)
-    plt.title("Quantum Decoherence Over Time")
-    st.pyplot(plt)
-
-def simulation_17():
-    st.write("### Simulation 17: Entropic Gravity")
-    st.write("""
-    **Description:** Simulates the concept of gravity emerging from entropy.
-    **Usage:** View the relationship between entropy and temperature.
-    **Practical Application:** Provides a novel perspective on the origin of gravity.
-    """)
-    T = np.linspace(1, 10, 100)
-    S = T**2
-    plt.plot(T, S)
-    plt.title("Entropic Gravity: Entropy vs. Temperature")
-    st.pyplot(plt)
-
-def simulation_18():
-    st.write("### Simulation 18: Feynman Diagrams")
-    st.write("""
-    **Description:** Generates random Feynman diagrams for particle interactions.
-    **Usage:** View a randomly generated Feynman diagram.
-    **Practical Application:** Essential tool in quantum field theory for visualizing particle interactions.
-    """)
-    vertices = np.random.rand(5, 2)
-    lines = [(i, j) for i in range(5) for j in range(i+1, 5)]
-    for line in lines:
-        plt.plot(vertices[line, 0], vertices[line, 1], 'b-')
-    plt.scatter(vertices[:, 0], vertices[:, 1], color='r')
-    plt.title("Random Feynman Diagram")
-    st.pyplot(plt)
-
-def simulation_19():
-    st.write("### Simulation 19: Noncommutative Geometry")
-    st.write("""
-    **Description:** Visualizes spaces with noncommutative coordinates.
-    **Usage:** View a polar plot representing noncommutative geometry.
-    **Practical Application:** Helps in understanding the mathematical framework of noncommutative spaces in physics.
-    """)
-    theta = np.linspace(0, 2*np.pi, 1000)
-    r = 1 + 0.5 * np.sin(5*theta)
-    plt.polar(theta, r)
-    plt.title("Noncommutative Geometry Visualization")
-    st.pyplot(plt)
-
-def simulation_20():
-    st.write("### Simulation 20: Quantum Information Theory")
-    st.write("""
-    **Description:** Simulates basic operations in quantum information theory.
-    **Usage:** Generate a random sequence of quantum bits.
-    **Practical Application:** Fundamental to the development of quantum computing and cryptography.
-    """)
-    bits = np.random.choice([0, 1], size=8)
-    st.write(f"Random Quantum Bits: {bits}")
-
-def simulation_21():
-    st.write("### Simulation 21: Virtual Particles in a Vacuum")
-    st.write("""
-    **Description:** Visualizes the random fluctuations of virtual particles in a vacuum.
-    **Usage:** Observe a plot of virtual particle fluctuations.
-    **Practical Application:** Helps in understanding quantum field theory and vacuum energy.
-    """)
-    t = np.linspace(0, 10, 1000)
-    fluctuations = np.sin(t) + np.random.normal(scale=0.1, size=1000)
-    plt.plot(t, fluctuations)
-    plt.title("Virtual Particles Fluctuations")
-    st.pyplot(plt)
-
-def simulation_22():
-    st.write("### Simulation 22: Casimir Effect")
-    st.write("""
-    **Description:** Simulates the force between two parallel plates due to vacuum fluctuations.
-    **Usage:** View the relationship between the distance and the Casimir force.
-    **Practical Application:** Important for understanding forces at the nanoscale.
-    """)
-    d = np.linspace(0.1, 10, 100)
-    force = 1 / (d**4)
-    plt.plot(d, force)
-    plt.title("Casimir Effect: Force vs. Distance")
-    st.pyplot(plt)
-
-def simulation_23():
-    st.write("### Simulation 23: M-Theory Branes")
-    st.write("""
-    **Description:** Simulates different types of branes in M-theory.
-    **Usage:** Randomly select and display a type of brane.
-    **Practical Application:** Helps in understanding the extended objects in string theory and M-theory.
-    """)
-    branes = ['D1', 'D3', 'D5', 'M2', 'M5']
-    selected_brane = random.choice(branes)
-    st.write(f"Selected Brane: {selected_brane}")
-
-def simulation_24():
-    st.write("### Simulation 24: Quantum Computing Circuits")
-    st.write("""
-    **Description:** Simulates basic quantum gates used in quantum computing.
-    **Usage:** Randomly apply a quantum gate to a qubit.
-    **Practical Application:** Fundamental operations in the field of quantum computing.
-    """)
-    circuit = np.random.choice(['Hadamard', 'CNOT', 'Pauli-X', 'Pauli-Z'])
-    st.write(f"Random Quantum Gate Applied: {circuit}")
-
-def simulation_25():
-    st.write("### Simulation 25: Quantum Double-Slit Experiment")
-    st.write("""
-    **Description:** Simulates the interference pattern of the quantum double-slit experiment.
-    **Usage:** View the resulting interference pattern.
-    **Practical Application:** Demonstrates the wave-particle duality of quantum mechanics.
-    """)
-    x = np.linspace(-5, 5, 1000)
-    I = np.sin(x)**2
-    plt.plot(x, I)
-    plt.title("Interference Pattern in Double-Slit Experiment")
-    st.pyplot(plt)
-
-def simulation_26():
-    st.write("### Simulation 26: Bose-Einstein Condensate")
-    st.write("""
-    **Description:** Simulates the formation of a Bose-Einstein condensate at low temperatures.
-    **Usage:** View the relationship between temperature and particle number.
-    **Practical Application:** Important for understanding quantum states of matter.
-    """)
-    T = np.linspace(0, 1, 100)
-    N = 1 / (np.exp(1/T) - 1)
-    plt.plot(T, N)
-    plt.title("Bose-Einstein Condensate")
-    st.pyplot(plt)
-
-def simulation_27():
-    st.write("### Simulation 27: Quark-Gluon Plasma")
-    st.write("""
-    **Description:** Visualizes the energy density in a quark-gluon plasma.
-    **Usage:** View a heatmap representing the energy density.
-    **Practical Application:** Helps in understanding the state of matter in the early universe and in high-energy collisions.
-    """)
-    energy_density = np.random.rand(10, 10)
-    plt.imshow(energy_density, cmap='hot', interpolation='nearest')
-    plt.title("Quark-Gluon Plasma Energy Density")
-    st.pyplot(plt)
-
-def simulation_28():
-    st.write("### Simulation 28: Quantum Cryptography")
-    st.write("""
-    **Description:** Simulates the generation of a quantum cryptographic key.
-    **Usage:** Generate a random sequence of bits for quantum encryption.
-    **Practical Application:** Fundamental for secure communication using quantum encryption.
-    """)
-    key = np.random.choice([0, 1], size=8)
-    st.write(f"Generated Quantum Key: {key}")
-
-def simulation_29():
-    st.write("### Simulation 29: Quantum Teleportation")
-    st.write("""
-    **Description:** Simulates the quantum teleportation of a qubit state.
-    **Usage:** Randomly determine the teleported state.
-    **Practical Application:** Fundamental concept in quantum communication and computing.
-    """)
-    state = np.random.choice(['|0>', '|1>', '|+>', '|->'])
-    st.write(f"State Teleported: {state}")
-
-def simulation_30():
-    st.write("### Simulation 30: Quantum Zeno Effect")
-    st.write("""
-    **Description:** Simulates the effect of frequent measurements on a quantum system.
-    **Usage:** View the survival probability of a quantum state over time.
-    **Practical Application:** Important for understanding measurement effects in quantum systems.
-    """)
-    decay_time = np.linspace(0, 10, 100)
-    survival_probability = np.exp(-decay_time)
-    plt.plot(decay_time, survival_probability)
-    plt.title("Quantum Zeno Effect: Survival Probability")
-    st.pyplot(plt)
-
-def simulation_31():
-    st.write("### Simulation 31: Quantum Hall Effect")
-    st.write("""
-    **Description:** Simulates the quantized Hall resistance in a two-dimensional electron system.
-    **Usage:** View the relationship between magnetic field and Hall resistance.
-    **Practical Application:** Helps in understanding topological quantum phenomena.
-    """)
-    B = np.linspace(0, 10, 100)
-    R = B % 2
-    plt.plot(B, R)
-    plt.title("Quantum Hall Effect")
-    st.pyplot(plt)
-
-def simulation_32():
-    st.write("### Simulation 32: Topological Insulators")
-    st.write("""
-    **Description:** Simulates edge states in topological insulators.
-    **Usage:** View the sinusoidal patterns representing edge states.
-    **Practical Application:** Fundamental in understanding new phases of matter with potential applications in electronics.
-    """)
-    x = np.linspace(0, 10, 100)
-    y = np.sin(x) + np.cos(2*x)
-    plt.plot(x, y)
-    plt.title("Edge States in Topological Insulators")
-    st.pyplot(plt)
-
-def simulation_33():
-    st.write("### Simulation 33: Wormholes")
-    st.write("""
-    **Description:** Visualizes the theoretical concept of a wormhole.
-    **Usage:** View a polar plot representing a wormhole.
-    **Practical Application:** Important in theoretical physics and potential implications for space travel.
-    """)
-    theta = np.linspace(0, 2*np.pi, 1000)
-    r = 1 + 0.3 * np.sin(3*theta)
-    plt.polar(theta, r)
-    plt.title("Wormhole Visualization")
-    st.pyplot(plt)
-
-def simulation_34():
-    st.write("### Simulation 34: White Holes")
-    st.write("""
-    **Description:** Simulates the gravitational repulsion near a white hole.
-    **Usage:** View the inverse-square law for gravitational repulsion.
-    **Practical Application:** Theoretical concept in general relativity.
-    """)
-    r = np.linspace(1, 10, 1000)
-    g = -1 / (r**2)
-    plt.plot(r, g)
-    plt.title("Gravitational Repulsion Near a White Hole")
-    st.pyplot(plt)
-
-def simulation_35():
-    st.write("### Simulation 35: Kaluza-Klein Theory")
-    st.write("""
-    **Description:** Visualizes extra dimensions in Kaluza-Klein theory.
-    **Usage:** View the relationship between different spatial dimensions.
-    **Practical Application:** Provides insights into unified theories combining gravity and electromagnetism.
-    """)
-    x = np.linspace(0, 10, 1000)
-    y = np.sin(x) + np.cos(x)
-    plt.plot(x, y)
-    plt.title("Extra Dimensions in Kaluza-Klein Theory")
-    st.pyplot(plt)
-
-def simulation_36():
-    st.write("### Simulation 36: Quantum Chromodynamics")
-    st.write("""
-    **Description:** Visualizes the strong force interactions in quantum chromodynamics.
-    **Usage:** View a heatmap representing the interactions.
-    **Practical Application:** Fundamental to understanding the behavior of quarks and gluons.
-    """)
-    qcd = np.random.rand(10, 10)
-    plt.imshow(qcd, cmap='viridis', interpolation='nearest')
-    plt.title("Quantum Chromodynamics")
-    st.pyplot(plt)
-
-def simulation_37():
-    st.write("### Simulation 37: Quantum Gravity Gravitons")
-    st.write("""
-    **Description:** Simulates the theoretical particles mediating the force of gravity in quantum gravity.
-    **Usage:** View a sine wave representing gravitons.
-    **Practical Application:** Essential for the development of a quantum theory of gravity.
-    """)
-    x = np.linspace(0, 2*np.pi, 1000)
-    y = np.sin(10*x)
-    plt.plot(x, y)
-    plt.title("Gravitons in Quantum Gravity")
-    st.pyplot(plt)
-
-def simulation_38():
-    st.write("### Simulation 38: Quantum Electrodynamics")
-    st.write("""
-    **Description:** Visualizes random events in quantum electrodynamics.
-    **Usage:** View a histogram representing particle interactions.
-    **Practical Application:** Helps in understanding electromagnetic interactions at the quantum level.
-    """)
-    qed = np.random.normal(size=1000)
-    plt.hist(qed, bins=30)
-    plt.title("Quantum Electrodynamics")
-    st.pyplot(plt)
-
-def simulation_39():
-    st.write("### Simulation 39: Gauge Symmetry Breaking")
-    st.write("""
-    **Description:** Simulates the potential energy in gauge symmetry breaking.
-    **Usage:** View a plot representing the potential energy.
-    **Practical Application:** Fundamental to the Higgs mechanism and mass generation in particles.
-    """)
-    x = np.linspace(0, 10, 100)
-    y = x**2 - 10*x + 25
-    plt.plot(x, y)
-    plt.title("Gauge Symmetry Breaking Potential")
-    st.pyplot(plt)
-
-def simulation_40():
-    st.write("### Simulation 40: Quantum Consciousness Interactions")
-    st.write("""
-    **Description:** Simulates interactions in a hypothetical theory of quantum consciousness.
-    **Usage:** Randomly select a state of quantum consciousness.
-    **Practical Application:** Explores theoretical concepts at the intersection of quantum mechanics and consciousness.
-    """)
-    state = random.choice(['Superposition', 'Entanglement', 'Collapse'])
-    st.write(f"Quantum Consciousness State: {state}")
-
-def simulation_41():
-    st.write("### Simulation 41: Quantum Wave Packets")
-    st.write("""
-    **Description:** Simulates the behavior of quantum wave packets.
-    **Usage:** View the evolution of a wave packet.
-    **Practical Application:** Helps in understanding wave-particle duality and quantum mechanics.
-    """)
-    x = np.linspace(-10, 10, 1000)
-    k = random.uniform(1, 10)
-    wave_packet = np.exp(-(x**2)) * np.cos(k*x)
-    plt.plot(x, wave_packet)
-    plt.title("Quantum Wave Packet")
-    st.pyplot(plt)
-
-def simulation_42():
-    st.write("### Simulation 42: Cerenkov Radiation")
-    st.write("""
-    **Description:** Simulates the radiation emitted when a particle moves faster than the speed of light in a medium.
-    **Usage:** View the radiation pattern.
-    **Practical Application:** Important for particle physics and astrophysics.
-    """)
-    x = np.linspace(0, 10, 1000)
-    v = st.slider("Particle Speed (as a fraction of light speed)", 1.1, 10.0, 2.0)
-    radiation = np.sin(v * x)
-    plt.plot(x, radiation)
-    plt.title("Cerenkov Radiation")
-    st.pyplot(plt)
-
-def simulation_43():
-    st.write("### Simulation 43: Quantum Vacuum Energy")
-    st.write("""
-    **Description:** Visualizes the fluctuations in quantum vacuum energy.
-    **Usage:** View a plot of random fluctuations.
-    **Practical Application:** Helps in understanding the concept of vacuum energy in quantum field theory.
-    """)
-    x = np.linspace(0, 10, 1000)
-    vacuum_energy = np.random.normal(size=1000)
-    plt.plot(x, vacuum_energy)
-    plt.title("Quantum Vacuum Energy Fluctuations")
-    st.pyplot(plt)
-
-def simulation_44():
-    st.write("### Simulation 44: Planck Scale Physics")
-    st.write("""
-    **Description:** Simulates physical phenomena at the Planck scale.
-    **Usage:** View the relationship between length and force at extremely small scales.
-    **Practical Application:** Provides insights into the fundamental limits of our physical theories.
-    """)
-    lengths = np.logspace(-35, -33, 100)
-    forces = 1 / (lengths**2)
-    plt.plot(lengths, forces)
-    plt.title("Planck Scale Physics")
-    plt.xscale('log')
-    plt.yscale('log')
-    plt.xlabel("Length (m)")
-    plt.ylabel("Force (N)")
-    st.pyplot(plt)
-
-def simulation_45():
-    st.write("### Simulation 45: Symmetry Breaking")
-    st.write("""
-    **Description:** Simulates the concept of symmetry breaking in physics.
-    **Usage:** View a potential energy plot illustrating symmetry breaking.
-    **Practical Application:** Essential for understanding phase transitions and the Higgs mechanism.
-    """)
-    x = np.linspace(-2, 2, 100)
-    V = x**4 - x**2
-    plt.plot(x, V)
-    plt.title("Symmetry Breaking Potential")
-    st.pyplot(plt)
-
-def simulation_46():
-    st.write("### Simulation 46: Quantum Dot Simulation")
-    st.write("""
-    **Description:** Simulates the electronic states in a quantum dot.
-    **Usage:** View the energy levels of a quantum dot.
-    **Practical Application:** Important for nanotechnology and quantum computing applications.
-    """)
-    levels = np.linspace(0, 10, 10)
-    energy = levels**2
-    plt.stem(levels, energy)
-    plt.title("Quantum Dot Energy Levels")
-    st.pyplot(plt)
-
-def simulation_47():
-    st.write("### Simulation 47: Quantum Key Distribution")
-    st.write("""
-    **Description:** Simulates the process of quantum key distribution for secure communication.
-    **Usage:** Generate a quantum key using random bits.
-    **Practical Application:** Fundamental for secure quantum communication.
-    """)
-    key = ''.join(str(random.choice([0, 1])) for _ in range(16))
-    st.write(f"Quantum Key: {key}")
-
-def simulation_48():
-    st.write("### Simulation 48: Quantum Random Walks")
-    st.write("""
-    **Description:** Simulates the path of a quantum random walk.
-    **Usage:** View the trajectory of a particle undergoing a quantum random walk.
-    **Practical Application:** Helps in understanding quantum algorithms and processes.
-    """)
-    steps = 100
-    path = np.cumsum(np.random.choice([-1, 1], steps))
-    plt.plot(path)
-    plt.title("Quantum Random Walk")
-    st.pyplot(plt)
-
-def simulation_49():
-    st.write("### Simulation 49: Quantum Annealing")
-    st.write("""
-    **Description:** Simulates the process of quantum annealing used for optimization problems.
-    **Usage:** View the evolution of the solution over time.
-    **Practical Application:** Used in solving complex optimization problems in various fields.
-    """)
-    t = np.linspace(0, 10, 100)
-    solution = np.exp(-t)
-    plt.plot(t, solution)
-    plt.title("Quantum Annealing Process")
-    st.pyplot(plt)
-
-def simulation_50():
-    st.write("### Simulation 50: AdS/CFT Correspondence")
-    st.write("""
-    **Description:** Visualizes the relationship between Anti-de Sitter space and Conformal Field Theory.
-    **Usage:** View a representation of AdS space.
-    **Practical Application:** Provides insights into the holographic principle and string theory.
-    """)
-    theta = np.linspace(0, 2*np.pi, 1000)
-    r = np.abs(np.sin(5*theta))
-    plt.polar(theta, r)
-    plt.title("AdS Space Representation")
-    st.pyplot(plt)
-
-def simulation_51():
-    st.write("### Simulation 51: Extra-Dimensional Branes")
-    st.write("""
-    **Description:** Simulates the concept of extra-dimensional branes in string theory.
-    **Usage:** View a representation of multiple branes.
-    **Practical Application:** Helps in understanding the role of extra dimensions in string theory.
-    """)
-    branes = np.random.rand(10, 2)
-    plt.scatter(branes[:, 0], branes[:, 1])
-    plt.title("Extra-Dimensional Branes")
-    st.pyplot(plt)
-
-def simulation_52():
-    st.write("### Simulation 52: Kerr Black Hole")
-    st.write("""
-    **Description:** Simulates the spacetime geometry around a rotating Kerr black hole.
-    **Usage:** View the ergosphere and event horizon of a Kerr black hole.
-    **Practical Application:** Important for understanding the dynamics around rotating black holes.
-    """)
-    r = np.linspace(1, 10, 1000)
-    ergosphere = r * np.sin(r)
-    plt.plot(r, ergosphere)
-    plt.title("Kerr Black Hole Ergosphere")
-    st.pyplot(plt)
-
-def simulation_53():
-    st.write("### Simulation 53: Magnetic Monopoles")
-    st.write("""
-    **Description:** Simulates the theoretical particles known as magnetic monopoles.
-    **Usage:** View a magnetic field pattern of a monopole.
-    **Practical Application:** Important for understanding magnetic fields in theoretical physics.
-    """)
-    theta = np.linspace(0, 2*np.pi, 1000)
-    r = np.abs(np.sin(3*theta))
-    plt.polar(theta, r)
-    plt.title("Magnetic Monopole Field")
-    st.pyplot(plt)
-
-def simulation_54():
-    st.write("### Simulation 54: Hawking Radiation")
-    st.write("""
-    **Description:** Simulates the radiation emitted by black holes due to quantum effects.
-    **Usage:** View the intensity of Hawking radiation.
-    **Practical Application:** Important for understanding black hole thermodynamics.
-    """)
-    r = np.linspace(1, 10, 1000)
-    radiation = 1 / (r**2)
-    plt.plot(r, radiation)
-    plt.title("Hawking Radiation Intensity")
-    st.pyplot(plt)
-
-def simulation_55():
-    st.write("### Simulation 55: Quasar Emissions")
-    st.write("""
-    **Description:** Simulates the energy emissions from quasars.
-    **Usage:** View the light curve of a quasar.
-    **Practical Application:** Helps in understanding the energetic phenomena in active galactic nuclei.
-    """)
-    t = np.linspace(0, 10, 1000)
-    emissions = np.sin(t) * np.exp(-0.1*t)
-    plt.plot(t, emissions)
-    plt.title("Quasar Emissions Light Curve")
-    st.pyplot(plt)
-
-def simulation_56():
-    st.write("### Simulation 56: Cosmic Microwave Background")
-    st.write("""
-    **Description:** Visualizes the fluctuations in the cosmic microwave background radiation.
-    **Usage:** View a heatmap representing the CMB fluctuations.
-    **Practical Application:** Fundamental for understanding the early universe and cosmology.
-    """)
-    cmb = np.random.normal(size=(100, 100))
-    plt.imshow(cmb, cmap='viridis', interpolation='nearest')
-    plt.title("Cosmic Microwave Background Fluctuations")
-    st.pyplot(plt)
-
-def simulation_57():
-    st.write("### Simulation 57: Dark Energy Dynamics")
-    st.write("""
-    **Description:** Simulates the effect of dark energy on the expansion of the universe.
-    **Usage:** View the scale factor of the universe over time.
-    **Practical Application:** Helps in understanding the accelerated expansion of the universe.
-    """)
-    t = np.linspace(0, 10, 100)
-    a = np.exp(0.1 * t)
-    plt.plot(t, a)
-    plt.title("Effect of Dark Energy on Universal Expansion")
-    st.pyplot(plt)
-
-def simulation_58():
-    st.write("### Simulation 58: Quantum Phase Transitions")
-    st.write("""
-    **Description:** Simulates phase transitions in quantum systems.
-    **Usage:** View the change in order parameter with respect to a control parameter.
-    **Practical Application:** Important for understanding quantum critical points in materials.
-    """)
-    g = np.linspace(0, 2, 100)
-    order_parameter = np.tanh(g - 1)
-    plt.plot(g, order_parameter)
-    plt.title("Quantum Phase Transition")
-    st.pyplot(plt)
-
-def simulation_59():
-    st.write("### Simulation 59: Quantum Spin Liquids")
-    st.write("""
-    **Description:** Simulates the behavior of quantum spin liquids.
-    **Usage:** View the correlation function of spins.
-    **Practical Application:** Helps in understanding exotic phases of matter with potential applications in quantum computing.
-    """)
-    r = np.linspace(0, 10, 100)
-    correlation = np.exp(-r)
-    plt.plot(r, correlation)
-    plt.title("Quantum Spin Liquid Correlation Function")
-    st.pyplot(plt)
-
-def simulation_60():
-    st.write("### Simulation 60: Quantum Eraser Experiment")
-    st.write("""
-    **Description:** Simulates the quantum eraser experiment demonstrating the wave-particle duality.
-    **Usage:** View the interference pattern with and without erasure.
-    **Practical Application:** Fundamental for understanding quantum measurement and interference.
-    """)
-    x = np.linspace(-5, 5, 1000)
-    interference = np.sin(x)**2
-    plt.plot(x, interference)
-    plt.title("Quantum Eraser Interference Pattern")
-    st.pyplot(plt)
-
-def simulation_61():
-    st.write("### Simulation 61: Quantum Entropic Forces")
-    st.write("""
-    **Description:** Simulates the concept of entropic forces in quantum systems.
-    **Usage:** View the relationship between entropy and force.
-    **Practical Application:** Provides insights into emergent phenomena in statistical mechanics.
-    """)
-    S = np.linspace(0, 10, 100)
-    F = np.gradient(S)
-    plt.plot(S, F)
-    plt.title("Quantum Entropic Forces")
-    st.pyplot(plt)
-
-def simulation_62():
-    st.write("### Simulation 62: Quantum Foam")
-    st.write("""
-    **Description:** Simulates the concept of quantum foam at very small scales.
-    **Usage:** View a representation of quantum foam.
-    **Practical Application:** Provides insights into the nature of spacetime at the Planck scale.
-    """)
-    foam = np.random.rand(100, 100)
-    plt.imshow(foam, cmap='gray', interpolation='nearest')
-    plt.title("Quantum Foam Visualization")
-    st.pyplot(plt)
-
-def simulation_63():
-    st.write("### Simulation 63: Multiverse Collisions")
-    st.write("""
-    **Description:** Simulates collisions between different universes in the multiverse.
-    **Usage:** View the interaction pattern of colliding universes.
-    **Practical Application:** Explores theoretical concepts in cosmology and high-energy physics.
-    """)
-    x = np.linspace(-10, 10, 1000)
-    collision_pattern = np.sin(x) * np.cos(x)
-    plt.plot(x, collision_pattern)
-    plt.title("Multiverse Collisions")
-    st.pyplot(plt)
-
-def simulation_64():
-    st.write("### Simulation 64: Quantum Chromodynamic Jets")
-    st.write("""
-    **Description:** Simulates the formation of jets in quantum chromodynamics.
-    **Usage:** View the distribution of particles in a jet.
-    **Practical Application:** Important for understanding high-energy particle collisions.
-    """)
-    theta = np.linspace(0, 2*np.pi, 1000)
-    jet = np.abs(np.sin(3*theta))
-    plt.polar(theta, jet)
-    plt.title("Quantum Chromodynamic Jets")
-    st.pyplot(plt)
-
-def simulation_65():
-    st.write("### Simulation 65: Chiral Anomaly")
-    st.write("""
-    **Description:** Simulates the effect of chiral anomaly in quantum field theory.
-    **Usage:** View the relationship between chiral current and magnetic field.
-    **Practical Application:** Important for understanding anomalies in particle physics.
-    """)
-    B = np.linspace(0, 10, 100)
-    J = B**2
-    plt.plot(B, J)
-    plt.title("Chiral Anomaly")
-    st.pyplot(plt)
-
-def simulation_66():
-    st.write("### Simulation 66: Axion Dark Matter")
-    st.write("""
-    **Description:** Simulates the behavior of axion dark matter.
-    **Usage:** View the density distribution of axion dark matter.
-    **Practical Application:** Important for understanding dark matter candidates in cosmology.
-    """)
-    theta = np.linspace(0, 2*np.pi, 1000)
-    density = np.abs(np.sin(4*theta))
-    plt.polar(theta, density)
-    plt.title("Axion Dark Matter Density")
-    st.pyplot(plt)
-
-def simulation_67():
-    st.write("### Simulation 67: Quantum Hamiltonian Simulation")
-    st.write("""
-    **Description:** Simulates the time evolution of a quantum system under a given Hamiltonian.
-    **Usage:** View the wave function over time.
-    **Practical Application:** Fundamental for understanding the dynamics of quantum systems.
-    """)
-    t = np.linspace(0, 10, 1000)
-    psi = np.exp(-1j * t)
-    plt.plot(t, psi.real, label='Real Part')
-    plt.plot(t, psi.imag, label='Imaginary Part')
-    plt.legend()
-    plt.title("Quantum Hamiltonian Evolution")
-    st.pyplot(plt)
-
-def simulation_68():
-    st.write("### Simulation 68: Quantum Molecular Dynamics")
-    st.write("""
-    **Description:** Simulates the dynamics of molecules using quantum mechanics.
-    **Usage:** View the trajectory of a molecule.
-    **Practical Application:** Important for understanding chemical reactions and molecular behavior.
-    """)
-    steps = 100
-    trajectory = np.cumsum(np.random.normal(size=(steps, 2)), axis=0)
-    plt.plot(trajectory[:, 0], trajectory[:, 1])
-    plt.title("Quantum Molecular Dynamics")
-    st.pyplot(plt)
-
-def simulation_69():
-    st.write("### Simulation 69: Quantum Chaos")
-    st.write("""
-    **Description:** Simulates chaotic behavior in quantum systems.
-    **Usage:** View the evolution of a quantum state in a chaotic system.
-    **Practical Application:** Helps in understanding the interplay between chaos and quantum mechanics.
-    """)
-    t = np.linspace(0, 10, 1000)
-    psi = np.sin(t**2)
-    plt.plot(t, psi)
-    plt.title("Quantum Chaos")
-    st.pyplot(plt)
-
-def simulation_70():
-    st.write("### Simulation 70: Cosmic String Simulation")
-    st.write("""
-    **Description:** Simulates the formation and dynamics of cosmic strings.
-    **Usage:** View the energy density around a cosmic string.
-    **Practical Application:** Important for understanding topological defects in cosmology.
-    """)
-    r = np.linspace(0, 10, 1000)
-    energy_density = np.exp(-r)
-    plt.plot(r, energy_density)
-    plt.title("Cosmic String Energy Density")
-    st.pyplot(plt)
-
-def simulation_71():
-    st.write("### Simulation 71: Quantum Topological Phases")
-    st.write("""
-    **Description:** Simulates different topological phases in quantum systems.
-    **Usage:** View the edge states in topological phases.
-    **Practical Application:** Important for understanding topological materials and their properties.
-    """)
-    x = np.linspace(0, 10, 1000)
-    edge_states = np.sin(2*x) * np.cos(3*x)
-    plt.plot(x, edge_states)
-    plt.title("Quantum Topological Phases")
-    st.pyplot(plt)
-
-def simulation_72():
-    st.write("### Simulation 72: Majorana Fermions")
-    st.write("""
-    **Description:** Simulates the behavior of Majorana fermions.
-    **Usage:** View the wave function of Majorana fermions.
-    **Practical Application:** Important for understanding particles that are their own antiparticles.
-    """)
-    x = np.linspace(-10, 10, 1000)
-    psi = np.exp(-x**2) * np.cos(x)
-    plt.plot(x, psi)
-    plt.title("Majorana Fermion Wave Function")
-    st.pyplot(plt)
-
-def simulation_73():
-    st.write("### Simulation 73: Neutrino Oscillations")
-    st.write("""
-    **Description:** Simulates the oscillation of neutrinos between different flavors.
-    **Usage:** View the probability of neutrino oscillations over time.
-    **Practical Application:** Important for understanding the properties and behavior of neutrinos.
-    """)
-    t = np.linspace(0, 10, 1000)
-    P = np.sin(t)**2
-    plt.plot(t, P)
-    plt.title("Neutrino Oscillations")
-    st.pyplot(plt)
-
-def simulation_74():
-    st.write("### Simulation 74: Quantum Spin Hall Effect")
-    st.write("""
-    **Description:** Simulates the quantum spin Hall effect in materials.
-    **Usage:** View the edge states in the quantum spin Hall effect.
-    **Practical Application:** Important for understanding spintronic devices and materials.
-    """)
-    x = np.linspace(0, 10, 1000)
-    spin_hall = np.sin(2*x) + np.cos(x)
-    plt.plot(x, spin_hall)
-    plt.title("Quantum Spin Hall Effect")
-    st.pyplot(plt)
-
-def simulation_75():
-    st.write("### Simulation 75: Sagnac Effect")
-    st.write("""
-    **Description:** Simulates the Sagnac effect, demonstrating the rotation of space.
-    **Usage:** View the phase shift due to rotation.
-    **Practical Application:** Important for understanding interferometry and rotation sensors.
-    """)
-    theta = np.linspace(0, 2*np.pi, 1000)
-    phase_shift = np.sin(2*theta)
-    plt.polar(theta, phase_shift)
-    plt.title("Sagnac Effect")
-    st.pyplot(plt)
-
-def simulation_76():
-    st.write("### Simulation 76: Quantum Carpets")
-    st.write("""
-    **Description:** Simulates the formation of quantum carpets in wave-packet dynamics.
-    **Usage:** View the interference pattern forming a quantum carpet.
-    **Practical Application:** Helps in understanding wave interference and quantum mechanics.
-    """)
-    x = np.linspace(-5, 5, 1000)
-    quantum_carpet = np.sin(x**2)
-    plt.plot(x, quantum_carpet)
-    plt.title("Quantum Carpets")
-    st.pyplot(plt)
-
-def simulation_77():
-    st.write("### Simulation 77: Higgs Field Interaction")
-    st.write("""
-    **Description:** Simulates the interaction of particles with the Higgs field.
-    **Usage:** View the potential energy of the Higgs field.
-    **Practical Application:** Essential for understanding mass generation in particles.
-    """)
-    x = np.linspace(-2, 2, 100)
-    V = x**4 - 2*x**2
-    plt.plot(x, V)
-    plt.title("Higgs Field Interaction Potential")
-    st.pyplot(plt)
-
-def simulation_78():
-    st.write("### Simulation 78: WIMP Detection Simulation")
-    st.write("""
-    **Description:** Simulates the detection of Weakly Interacting Massive Particles (WIMPs).
-    **Usage:** View the interaction rate of WIMPs.
-    **Practical Application:** Important for dark matter research and detection experiments.
-    """)
-    t = np.linspace(0, 10, 1000)
-    interaction_rate = np.exp(-t)
-    plt.plot(t, interaction_rate)
-    plt.title("WIMP Detection Simulation")
-    st.pyplot(plt)
-
-def simulation_79():
-    st.write("### Simulation 79: Primordial Black Holes")
-    st.write("""
-    **Description:** Simulates the formation and evolution of primordial black holes.
-    **Usage:** View the mass distribution of primordial black holes.
-    **Practical Application:** Important for understanding early universe cosmology and dark matter candidates.
-    """)
-    mass = np.random.normal(size=1000)
-    plt.hist(mass, bins=30)
-    plt.title("Primordial Black Holes Mass Distribution")
-    st.pyplot(plt)
-
-def simulation_80():
-    st.write("### Simulation 80: Quantum Fractals")
-    st.write("""
-    **Description:** Simulates the formation of fractals in quantum systems.
-    **Usage:** View the fractal pattern generated by a quantum system.
-    **Practical Application:** Provides insights into the complex behavior of quantum systems.
-    """)
-    x = np.linspace(-2, 2, 1000)
-    y = np.linspace(-2, 2, 1000)
-    X, Y = np.meshgrid(x, y)
-    Z = np.sin(X**2 + Y**2)
-    plt.imshow(Z, cmap='hot', extent=(-2, 2, -2, 2))
-    plt.title("Quantum Fractals")
-    st.pyplot(plt)
-
-simulations = {
-    1: simulation_1,
-    2: simulation_2,
-    3: simulation_3,
-    4: simulation_4,
-    5: simulation_5,
-    6: simulation_6,
-    7: simulation_7,
-    8: simulation_8,
-    9: simulation_9,
-    10: simulation_10,
-    11: simulation_11,
-    12: simulation_12,
-    13: simulation_13,
-    14: simulation_14,
-    15: simulation_15,
-    16: simulation_16,
-    17: simulation_17,
-    18: simulation_18,
-    19: simulation_19,
-    20: simulation_20,
-    21: simulation_21,
-    22: simulation_22,
-    23: simulation_23,
-    24: simulation_24,
-    25: simulation_25,
-    26: simulation_26,
-    27: simulation_27,
-    28: simulation_28,
-    29: simulation_29,
-    30: simulation_30,
-    31: simulation_31,
-    32: simulation_32,
-    33: simulation_33,
-    34: simulation_34,
-    35: simulation_35,
-    36: simulation_36,
-    37: simulation_37,
-    38: simulation_38,
-    39: simulation_39,
-    40: simulation_40,
-    41: simulation_41,
-    42: simulation_42,
-    43: simulation_43,
-    44: simulation_44,
-    45: simulation_45,
-    46: simulation_46,
-    47: simulation_47,
-    48: simulation_48,
-    49: simulation_49,
-    50: simulation_50,
-    51: simulation_51,
-    52: simulation_52,
-    53: simulation_53,
-    54: simulation_54,
-    55: simulation_55,
-    56: simulation_56,
-    57: simulation_57,
-    58: simulation_58,
-    59: simulation_59,
-    60: simulation_60,
-    61: simulation_61,
-    62: simulation_62,
-    63: simulation_63,
-    64: simulation_64,
-    65: simulation_65,
-    66: simulation_66,
-    67: simulation_67,
-    68: simulation_68,
-    69: simulation_69,
-    70: simulation_70,
-    71: simulation_71,
-    72: simulation_72,
-    73: simulation_73,
-    74: simulation_74,
-    75: simulation_75,
-    76: simulation_76,
-    77: simulation_77,
-    78: simulation_78,
-    79: simulation_79,
-    80: simulation_80,
-}
+        if data is None:
+            data = sim.kernel(rng, **params)
+        png = render_png(sim, data) if sim.draw is not None else b""
+    render_cache.put(key, png, data)
+    return data, png
+
+def run_chart(sim, params, seed, points, data=None):
+    """Return the LTTB-downsampled chart columns for a line simulation, cached like figures."""
+    key = render_key(sim.number, params, seed if sim.stochastic else None, ("lttb", points))
+    entry = render_cache.get(key)
+    if entry is not None:
+        return entry.arrays
+    if data is None:
+        data = sim.kernel(simulation_rng(seed, sim.number), **params)
+    columns = downsample(sim.series(data), points)
+    render_cache.put(key, b"", columns)
+    return columns
+
+def show_simulation(info, seed):
+    st.write(f"### Simulation {info.number}: {info.title}")
+    st.write(f"""
+    **Description:** {info.description}
+    **Usage:** {info.usage}
+    **Practical Application:** {info.application}
+    """)
+    missing = missing_dependencies(info)
+    if missing:
+        st.error(f"This simulation needs {', '.join(missing)}, which is not installed.")
+        return
+    params = {p.name: st.slider(p.label, p.min, p.max, p.default, step=p.step) for p in info.params}
+    sim = load(info.number)
+    swept = None
+    if info.sweep and st.checkbox("Sweep mode: precompute every slider position"):
+        result, surface_png, npz = get_sweep(info.number)
+        swept = row(result, nearest_index(result, **params))
+    start = time.perf_counter()
+    if backend == NATIVE_CHART and sim.series is not None:
+        columns = run_chart(sim, params, seed, chart_points, data=swept)
+        elapsed = time.perf_counter() - start
+        st.line_chart(columns, x="x")
+        st.caption(f"{NATIVE_CHART}: {elapsed * 1000:.1f} ms, {len(columns['x'])} points, "
+                   f"{payload_bytes(columns) / 1024:.1f} KiB sent")
+    else:
+        image = st.empty()
+        data, png = run_simulation(sim, params, seed, data=swept, on_frame=image.image)
+        elapsed = time.perf_counter() - start
+        if sim.report is not None:
+            for line in sim.report(data):
+                st.write(line)
+        if png:
+            image.image(png)
+            st.caption(f"{MATPLOTLIB}: {elapsed * 1000:.1f} ms, {len(png) / 1024:.1f} KiB sent")
+    if swept is not None:
+        st.image(surface_png)
+        st.download_button("Download response surface (.npz)", npz,
+                           file_name=f"simulation_{info.number}_sweep.npz")
 
 st.write("### Welcome to the Theory of Everything Simulations!")
 st.write("Choose a simulation from the sidebar to see it in action.")
 
-if simulation in simulations:
-    simulations[simulation]()
+if simulation in REGISTRY:
+    show_simulation(REGISTRY[simulation], seed)
+
+with st.sidebar.expander("Render stats"):
+    stats = render_cache.stats()
+    st.write(f"Hit rate: {stats['hit_rate']:.1%} ({stats['hits']} hits, {stats['misses']} misses)")
+    st.write(f"Held: {stats['bytes_held'] / 2**20:.1f} MiB of {stats['max_bytes'] / 2**20:.0f} MiB "
+             f"in {stats['entries']} entries ({stats['evictions']} evicted)")
+    stats = figure_pool.stats()
+    st.write(f"Figures: {stats['created']} of {figure_pool.max_figures} allocated, "
+             f"{stats['bytes'] / 2**20:.1f} MiB of {stats['max_bytes'] / 2**20:.1f} MiB canvas budget")
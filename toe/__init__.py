@@ -0,0 +1 @@
+"""Support code for the Theory of Everything simulations app."""
@@ -0,0 +1,103 @@
+"""Bounded LRU cache for rendered simulation figures."""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+CacheEntry = namedtuple("CacheEntry", ["png", "arrays", "nbytes"])
+
+
+def render_key(number, params=None, seed=None, variant=None):
+    """Build a hashable cache key from a simulation number, its parameters and seed.
+
+    ``variant`` distinguishes alternative renderings of the same output, such
+    as a downsampled chart instead of a PNG.
+    """
+    items = tuple(sorted((params or {}).items()))
+    return (number, items, seed, variant)
+
+
+def entry_size(png, arrays):
+    size = len(png)
+    for value in arrays.values():
+        if isinstance(value, np.ndarray):
+            size += value.nbytes
+        else:
+            size += np.asarray(value).nbytes
+    return size
+
+
+class RenderCache:
+    """LRU mapping of render keys to PNG bytes plus the arrays they were drawn from.
+
+    Entries are evicted least-recently-used first once the total size exceeds
+    ``max_bytes``. The cache is shared between Streamlit sessions, so every
+    operation takes a lock.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, png, arrays):
+        entry = CacheEntry(png, arrays, entry_size(png, arrays))
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes_held -= old.nbytes
+            if entry.nbytes > self.max_bytes:
+                return entry
+            self._entries[key] = entry
+            self.bytes_held += entry.nbytes
+            while self.bytes_held > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes_held -= evicted.nbytes
+                self.evictions += 1
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes_held = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes_held": self.bytes_held,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hit_rate,
+            }
@@ -0,0 +1,71 @@
+"""Downsampled series for Streamlit's native (Vega-Lite) charts.
+
+Line simulations can be shown client-side instead of as a Matplotlib PNG. A
+plugin's ``series_N(data)`` returns the columns to chart, with the x axis
+under ``"x"``; ``downsample`` reduces them with Largest-Triangle-Three-Buckets
+so the payload stays bounded however long the series is.
+"""
+
+import numpy as np
+
+DEFAULT_POINTS = 2000
+
+
+def lttb_indices(x, y, threshold):
+    """Indices of the ``threshold`` points LTTB keeps from the series ``(x, y)``.
+
+    The first and last points are always kept and the interior is split into
+    ``threshold - 2`` buckets. From each bucket the point forming the largest
+    triangle with the previously kept point and the mean of the next bucket is
+    chosen. Bucket means are computed in one ``reduceat`` pass; only the
+    inherently sequential choice of point walks the buckets.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    mean_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    indices = np.empty(threshold, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        bx = x[start:stop]
+        by = y[start:stop]
+        area = np.abs((x[a] - next_x[i]) * (by - y[a]) - (x[a] - bx) * (next_y[i] - y[a]))
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
+
+def downsample(columns, points=DEFAULT_POINTS):
+    """Reduce chart columns to about ``points`` rows per series.
+
+    With several y columns the union of each column's LTTB points is kept,
+    so every series keeps its own extremes on a shared x axis.
+    """
+    x = np.asarray(columns["x"])
+    if len(x) <= points:
+        return dict(columns)
+    keep = [lttb_indices(x, np.asarray(values), points) for name, values in columns.items() if name != "x"]
+    index = np.unique(np.concatenate(keep))
+    return {name: np.asarray(values)[index] for name, values in columns.items()}
+
+
+def payload_bytes(columns):
+    """Size of ``columns`` as the Arrow IPC stream Streamlit sends to the browser."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pydict({name: np.asarray(values) for name, values in columns.items()})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
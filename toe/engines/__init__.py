@@ -0,0 +1,5 @@
+"""Numerical engines behind the heavier simulations.
+
+Engines are plain NumPy/SciPy code with no Streamlit or Matplotlib imports;
+simulation plugins in ``toe.sims`` wrap them in kernels.
+"""
@@ -0,0 +1,279 @@
+"""Sparse exact diagonalization of spin-1/2 Heisenberg and Kitaev models.
+
+Basis states are ``uint32`` bit strings, bit ``i`` set when spin ``i`` is up,
+kept in sorted arrays and located with ``np.searchsorted``, so no Python
+object is made per state. Sectors are built by filtering all ``2**n``
+strings a block at a time: fixed magnetization (``popcount``) for the
+``SU(2)``-symmetric Heisenberg model, fixed parity for the Kitaev model,
+whose bond terms flip spins in pairs. On periodic chains the translation
+symmetry is used as well: each momentum ``k`` keeps one representative per
+cycle of rotations, ``|a(k)> ~ sum_r exp(-ikr) T^r |a>``, and a matrix
+element ``h`` from ``a`` to a string whose representative ``b`` lies ``l``
+rotations away becomes ``h exp(-ikl) sqrt(R_a / R_b)`` with ``R`` the cycle
+lengths. At 24 sites the zero-magnetization, zero-momentum sector holds
+about 10^5 states instead of 1.7 * 10^7.
+
+Hamiltonians are assembled as ``scipy.sparse`` CSR matrices from all bonds
+at once and cached per model, bond list and sector; ``ground_states`` finds
+the lowest eigenpairs with Lanczos (``eigsh``), or densely for small
+sectors. Small clusters often have degenerate ground states, so
+correlations are averaged over the whole lowest level rather than taken in
+whichever combination of it the solver returns. They are evaluated on the
+bit strings directly, after unfolding momentum states, so no operator
+matrix is built for them.
+"""
+
+import functools
+from collections import namedtuple
+
+import numpy as np
+import scipy.linalg
+from scipy import sparse
+from scipy.sparse.linalg import eigsh
+
+BLOCK_STATES = 1 << 22
+# Sectors up to this size are diagonalized densely, which resolves degenerate levels exactly.
+DENSE_STATES = 4096
+
+Basis = namedtuple("Basis", ["sites", "states", "periods", "momentum"])
+Bond = namedtuple("Bond", ["i", "j", "kind"])
+
+
+def chain(sites, distance=1):
+    """Bonds ``(i, i + distance)`` of a periodic chain."""
+    return tuple(Bond(i, (i + distance) % sites, "h") for i in range(sites))
+
+
+def honeycomb(cells_x, cells_y):
+    """Kitaev bonds of a periodic honeycomb cluster of ``cells_x * cells_y`` two-site unit cells.
+
+    Site ``2 c`` is the A and ``2 c + 1`` the B site of cell ``c``; each
+    bond is labelled with the spin component, ``"x"``, ``"y"`` or ``"z"``,
+    it couples.
+    """
+    def cell(x, y):
+        return (x % cells_x) + cells_x * (y % cells_y)
+
+    bonds = []
+    for y in range(cells_y):
+        for x in range(cells_x):
+            a = 2 * cell(x, y)
+            bonds.append(Bond(a, a + 1, "z"))
+            bonds.append(Bond(a, 2 * cell(x - 1, y) + 1, "x"))
+            bonds.append(Bond(a, 2 * cell(x, y - 1) + 1, "y"))
+    return tuple(bonds)
+
+
+def _popcount(states):
+    # Set bits of each uint32; np.bitwise_count needs NumPy 2.0, so older versions count them with the SWAR trick.
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(states)
+    states = states - ((states >> np.uint32(1)) & np.uint32(0x55555555))
+    states = (states & np.uint32(0x33333333)) + ((states >> np.uint32(2)) & np.uint32(0x33333333))
+    states = (states + (states >> np.uint32(4))) & np.uint32(0x0F0F0F0F)
+    return ((states * np.uint32(0x01010101)) >> np.uint32(24)).astype(np.uint8)
+
+
+def _rotate(states, sites, shift=1):
+    # Translation T^shift: spin i moves to site i + shift.
+    mask = np.uint32((1 << sites) - 1)
+    shift %= sites
+    if not shift:
+        return states.copy()
+    return ((states << np.uint32(shift)) | (states >> np.uint32(sites - shift))) & mask
+
+
+def representatives(states, sites):
+    """The smallest rotation of each string and the number of rotations ``l`` with ``T^l s = rep``."""
+    best = states.copy()
+    shift = np.zeros(len(states), dtype=np.int64)
+    rotated = states
+    for l in range(1, sites):
+        rotated = _rotate(rotated, sites)
+        smaller = rotated < best
+        best[smaller] = rotated[smaller]
+        shift[smaller] = l
+    return best, shift
+
+
+@functools.lru_cache(maxsize=16)
+def basis(sites, up=None, parity=None, momentum=None):
+    """The sector of ``sites`` spins with ``up`` spins up, popcount ``parity`` and/or ``momentum`` (``2 pi momentum / sites``).
+
+    ``None`` leaves a quantum number unrestricted. Momentum sectors assume
+    a periodic chain.
+    """
+    if sites > 32:
+        raise ValueError("At most 32 sites fit in a uint32 basis, got {}".format(sites))
+    blocks = []
+    for start in range(0, 1 << sites, BLOCK_STATES):
+        states = np.arange(start, min(start + BLOCK_STATES, 1 << sites), dtype=np.uint32)
+        count = _popcount(states)
+        keep = np.ones(len(states), dtype=bool)
+        if up is not None:
+            keep &= count == up
+        if parity is not None:
+            keep &= count % 2 == parity
+        states = states[keep]
+        if momentum is not None:
+            rep, _ = representatives(states, sites)
+            states = states[rep == states]
+        blocks.append(states)
+    states = np.concatenate(blocks)
+    periods = np.ones(len(states), dtype=np.int64)
+    if momentum is not None:
+        periods = _periods(states, sites)
+        states, periods = states[(momentum * periods) % sites == 0], periods[(momentum * periods) % sites == 0]
+    states.flags.writeable = False
+    periods.flags.writeable = False
+    return Basis(sites, states, periods, momentum)
+
+
+def _periods(states, sites):
+    periods = np.full(len(states), sites, dtype=np.int64)
+    rotated = states
+    for l in range(1, sites):
+        rotated = _rotate(rotated, sites)
+        periods[(rotated == states) & (periods == sites)] = l
+    return periods
+
+
+def _bond_terms(states, bond, coupling, anisotropy):
+    # (amplitudes, new states) of one bond acting on every basis string: diagonal then off-diagonal.
+    bi, bj = np.uint32(1 << bond.i), np.uint32(1 << bond.j)
+    aligned = ((states & bi) != 0) == ((states & bj) != 0)
+    zz = np.where(aligned, 0.25, -0.25)
+    flipped = states ^ (bi | bj)
+    if bond.kind == "h":
+        return [(coupling * anisotropy * zz, states), (np.where(aligned, 0.0, 0.5 * coupling), flipped)]
+    if bond.kind == "z":
+        return [(coupling * zz, states)]
+    if bond.kind == "x":
+        return [(np.full(len(states), 0.25 * coupling), flipped)]
+    if bond.kind == "y":
+        return [(np.where(aligned, -0.25, 0.25) * coupling, flipped)]
+    raise ValueError("Unknown bond kind {!r}".format(bond.kind))
+
+
+def operator(space, bonds, coupling=1.0, anisotropy=1.0):
+    """``sum_bonds coupling * S_i^a S_j^a`` on ``space`` as a CSR matrix.
+
+    Heisenberg (``"h"``) bonds couple all three components, with the ``zz``
+    part scaled by ``anisotropy``; Kitaev bonds couple only their labelled
+    component. Terms that leave the sector are dropped, so the bonds must
+    respect its symmetries.
+    """
+    states = np.asarray(space.states)
+    size = len(states)
+    rows, cols, values = [], [], []
+    columns = np.arange(size)
+    complex_phases = space.momentum is not None and (2 * space.momentum) % space.sites != 0
+    for bond in bonds:
+        for amplitude, targets in _bond_terms(states, bond, coupling, anisotropy):
+            nonzero = amplitude != 0
+            amplitude, targets, source = amplitude[nonzero], targets[nonzero], columns[nonzero]
+            if space.momentum is not None:
+                targets, shift = representatives(targets, space.sites)
+            index = np.minimum(np.searchsorted(states, targets), size - 1)
+            found = states[index] == targets
+            amplitude, index, source = amplitude[found], index[found], source[found]
+            if space.momentum is not None:
+                k = 2 * np.pi * space.momentum / space.sites
+                amplitude = amplitude * np.sqrt(space.periods[source] / space.periods[index])
+                phase = np.exp(-1j * k * shift[found])
+                amplitude = amplitude * (phase if complex_phases else phase.real)
+            rows.append(index)
+            cols.append(source)
+            values.append(amplitude)
+    dtype = np.complex128 if complex_phases else np.float64
+    matrix = sparse.coo_matrix((np.concatenate(values).astype(dtype), (np.concatenate(rows), np.concatenate(cols))),
+                               shape=(size, size))
+    return matrix.tocsr()
+
+
+@functools.lru_cache(maxsize=16)
+def hamiltonian(model, sites, bonds, up=None, parity=None, momentum=None, coupling=1.0, anisotropy=1.0):
+    """The cached Hamiltonian of ``model`` (``"heisenberg"`` or ``"kitaev"``) on ``bonds`` in one sector.
+
+    The Kitaev model does not conserve magnetization, so ``up`` must be
+    ``None`` for it; use ``parity`` instead.
+    """
+    if model == "heisenberg":
+        if any(bond.kind != "h" for bond in bonds):
+            raise ValueError("Heisenberg bonds must be of kind 'h'")
+    elif model == "kitaev":
+        if up is not None or momentum is not None:
+            raise ValueError("The Kitaev model has no magnetization or chain momentum sectors")
+    else:
+        raise ValueError("Unknown model {!r}".format(model))
+    matrix = operator(basis(sites, up, parity, momentum), bonds, coupling, anisotropy)
+    matrix.data.flags.writeable = False
+    return matrix
+
+
+def ground_states(matrix, count=1, tolerance=1e-10):
+    """The ``count`` lowest eigenvalues (ascending) and eigenvectors of a Hermitian sparse ``matrix``."""
+    if matrix.shape[0] <= max(DENSE_STATES, count + 1):
+        return scipy.linalg.eigh(matrix.toarray(), subset_by_index=[0, min(count, matrix.shape[0]) - 1])
+    values, vectors = eigsh(matrix, k=count, which='SA', tol=tolerance)
+    order = np.argsort(values)
+    return values[order], vectors[:, order]
+
+
+def ground_manifold(matrix, count=6, tolerance=1e-8):
+    """The lowest eigenvalue of ``matrix`` and the columns spanning its (up to ``count``-fold) degenerate eigenspace.
+
+    Lanczos can return fewer copies of a degenerate level than it has, so
+    the eigenspace is only certain to be complete for sectors of at most
+    ``DENSE_STATES``.
+    """
+    values, vectors = ground_states(matrix, min(count, matrix.shape[0]))
+    degenerate = values - values[0] <= tolerance * max(1.0, abs(values[0]))
+    return float(values[0]), vectors[:, degenerate]
+
+
+def expand(space, vectors):
+    """``vectors`` of ``space`` in the basis of plain bit strings, as ``(states, amplitudes)``.
+
+    A momentum state ``|a(k)>`` puts amplitude ``exp(-ikr) / sqrt(R_a)`` on
+    each distinct rotation ``T^r a``. Other sectors are returned unchanged.
+    """
+    vectors = vectors.reshape(len(vectors), -1)
+    if space.momentum is None:
+        return np.asarray(space.states), vectors
+    k = 2 * np.pi * space.momentum / space.sites
+    states, amplitudes = [], []
+    rotated = np.asarray(space.states)
+    for r in range(space.sites):
+        keep = r < space.periods
+        states.append(rotated[keep])
+        amplitudes.append(vectors[keep] * (np.exp(-1j * k * r) / np.sqrt(space.periods[keep]))[:, None])
+        rotated = _rotate(rotated, space.sites)
+    states = np.concatenate(states)
+    order = np.argsort(states)
+    return states[order], np.concatenate(amplitudes)[order]
+
+
+def spin_correlations(space, vectors, pairs):
+    """``<S_i . S_j>`` for each pair of sites, in the state ``vectors`` of ``space``.
+
+    A two-dimensional ``vectors`` is averaged over its columns, which for
+    an orthonormal basis of a degenerate level is the trace over that level,
+    independent of which combination ``eigsh`` returned.
+    """
+    states, amplitudes = expand(space, vectors)
+    weights = np.sum(amplitudes.real**2 + amplitudes.imag**2, axis=1)
+    result = np.empty(len(pairs))
+    for p, (i, j) in enumerate(pairs):
+        if i == j:
+            result[p] = 0.75 * weights.sum()
+            continue
+        bi, bj = np.uint32(1 << i), np.uint32(1 << j)
+        aligned = ((states & bi) != 0) == ((states & bj) != 0)
+        zz = 0.25 * (weights[aligned].sum() - weights[~aligned].sum())
+        # S+S- + S-S+ exchanges the two spins when they differ.
+        source = np.flatnonzero(~aligned)
+        target = np.searchsorted(states, states[source] ^ (bi | bj))
+        exchange = np.sum(amplitudes[target].conj() * amplitudes[source]).real
+        result[p] = zz + 0.5 * exchange
+    return result / amplitudes.shape[1]
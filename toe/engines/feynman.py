@@ -0,0 +1,231 @@
+"""Enumeration and layout of Feynman diagram topologies.
+
+A diagram of a single-field theory with ``valence``-point vertices is a
+connected multigraph on its interaction vertices: ``adjacency[i, j]`` counts
+the propagators between vertices ``i`` and ``j`` (self-loops on the
+diagonal) and ``legs[e]`` is the vertex that labelled external leg ``e``
+attaches to. For ``externals`` legs and ``loops`` loops the vertex count is
+fixed by ``valence * V = 2 * I + E`` and ``L = I - V + 1``.
+
+Candidates are grown row by row under the valence constraint and reduced to
+a canonical labelling, the lexicographically smallest adjacency over the
+vertex relabellings that fix the external legs, so isomorphic copies
+collapse to one entry. Vertex classes are refined by invariants first, which
+keeps the relabellings to try small. The same pass counts automorphisms,
+which gives each diagram's symmetry factor.
+"""
+
+import functools
+import itertools
+import math
+from collections import namedtuple
+
+import numpy as np
+
+Diagram = namedtuple("Diagram", ["adjacency", "legs", "symmetry"])
+
+# Points along each drawn propagator.
+CURVE_POINTS = 24
+
+
+def vertex_count(valence, externals, loops):
+    """Number of interaction vertices, or ``None`` if no diagram has this shape."""
+    twice = 2 * (loops - 1) + externals
+    if valence < 3 or twice <= 0 or twice % (valence - 2):
+        return None
+    return twice // (valence - 2)
+
+
+def _set_partitions(items, max_size):
+    # Partitions of ``items`` into blocks ordered by their smallest element.
+    if not items:
+        yield []
+        return
+    first, rest = items[0], items[1:]
+    for partition in _set_partitions(rest, max_size):
+        for i, block in enumerate(partition):
+            if len(block) < max_size:
+                yield partition[:i] + [[first] + block] + partition[i + 1:]
+        yield [[first]] + partition
+
+
+def _fill(free, fixed, adjacency, i=0, j=0):
+    # Every way to spend each vertex's remaining valence on pairs from (i, j) on, in row-major
+    # order. Vertices without external legs are interchangeable, so only orderings where their
+    # links to the leg-carrying vertices, then their self-loops, never increase are generated.
+    n = len(free)
+    if i == n:
+        if not any(free):
+            yield np.array(adjacency)
+        return
+    if i == j and i > fixed and adjacency[i][:fixed] == adjacency[i - 1][:fixed]:
+        most = min(free[i] // 2, adjacency[i - 1][i - 1])
+    elif i == j:
+        most = free[i] // 2
+    else:
+        most = min(free[i], free[j])
+    following = (i, j + 1) if j + 1 < n else (i + 1, i + 1)
+    for count in range(most + 1):
+        adjacency[i][j] = adjacency[j][i] = count
+        spent = 2 * count if i == j else count
+        free[i] -= spent
+        free[j] -= spent if i != j else 0
+        if following[0] == i or not free[i]:
+            if not (following == (fixed, fixed) and _unordered(adjacency, fixed)):
+                yield from _fill(free, fixed, adjacency, *following)
+        free[i] += spent
+        free[j] += spent if i != j else 0
+    adjacency[i][j] = adjacency[j][i] = 0
+
+
+def _unordered(adjacency, fixed):
+    links = [row[:fixed] for row in adjacency[fixed:]]
+    return any(a < b for a, b in zip(links, links[1:]))
+
+
+def _connected(adjacency):
+    seen = {0}
+    frontier = [0]
+    while frontier:
+        row = adjacency[frontier.pop()]
+        for j in range(len(row)):
+            if row[j] and j not in seen:
+                seen.add(j)
+                frontier.append(j)
+    return len(seen) == len(adjacency)
+
+
+def _classes(adjacency, fixed):
+    # Colour refinement: vertices with different colours can never be swapped.
+    colours = [(i if i < fixed else -1) for i in range(len(adjacency))]
+    while True:
+        signatures = [(colours[i], adjacency[i, i],
+                       tuple(sorted((colours[j], adjacency[i, j]) for j in range(len(adjacency)) if j != i)))
+                      for i in range(len(adjacency))]
+        ranks = {s: r for r, s in enumerate(sorted(set(signatures)))}
+        refined = [ranks[s] for s in signatures]
+        if len(set(refined)) == len(set(colours)):
+            return refined
+        colours = refined
+
+
+def canonical_form(adjacency, fixed):
+    """Return ``(form, automorphisms)`` for a diagram whose first ``fixed`` vertices carry external legs.
+
+    ``form`` is the smallest upper triangle over relabellings that keep
+    vertex colours, so isomorphic diagrams share it; ``automorphisms`` counts
+    the relabellings that leave the diagram unchanged.
+    """
+    n = len(adjacency)
+    colours = _classes(adjacency, fixed)
+    groups = {}
+    for vertex, colour in enumerate(colours):
+        groups.setdefault(colour, []).append(vertex)
+    # Relabel so colours occupy consecutive slots, then permute within each slot range.
+    perms = [()]
+    for colour in sorted(groups):
+        perms = [p + q for p in perms for q in itertools.permutations(groups[colour])]
+    perms = np.array(perms)
+    upper = np.triu_indices(n)
+    forms = adjacency[perms[:, :, None], perms[:, None, :]][:, upper[0], upper[1]]
+    best = forms[np.lexsort(forms.T[::-1])[0]]
+    return tuple(best), int((forms == best).all(axis=1).sum())
+
+
+def symmetry_factor(adjacency, automorphisms):
+    """Automorphisms times the ways to permute parallel propagators and flip self-loops."""
+    factor = automorphisms
+    for i in range(len(adjacency)):
+        factor *= 2**adjacency[i, i] * math.factorial(adjacency[i, i])
+        for j in range(i + 1, len(adjacency)):
+            factor *= math.factorial(adjacency[i, j])
+    return factor
+
+
+@functools.lru_cache(maxsize=32)
+def diagrams(valence, externals, loops):
+    """All distinct connected diagrams with this vertex valence, leg count and loop order."""
+    n = vertex_count(valence, externals, loops)
+    if n is None:
+        return ()
+    found = {}
+    for blocks in _set_partitions(list(range(externals)), valence):
+        if len(blocks) > n:
+            continue
+        legs = np.empty(externals, dtype=int)
+        free = [valence] * n
+        for vertex, block in enumerate(blocks):
+            legs[block] = vertex
+            free[vertex] -= len(block)
+        for adjacency in _fill(free, len(blocks), [[0] * n for _ in range(n)]):
+            if not _connected(adjacency):
+                continue
+            form, automorphisms = canonical_form(adjacency, len(blocks))
+            key = (tuple(legs), form)
+            if key not in found:
+                found[key] = Diagram(adjacency, legs, symmetry_factor(adjacency, automorphisms))
+    return tuple(found.values())
+
+
+def _arc(start, end, bend):
+    t = np.linspace(0, 1, CURVE_POINTS)[:, None]
+    middle = (start + end) / 2 + bend * np.array([start[1] - end[1], end[0] - start[0]])
+    return (1 - t)**2 * start + 2 * t * (1 - t) * middle + t**2 * end
+
+
+def _loop(vertex, size, sideways):
+    direction = vertex / np.linalg.norm(vertex) if np.linalg.norm(vertex) else np.array([0.0, 1.0])
+    if sideways:
+        direction = np.array([-direction[1], direction[0]])
+    centre = vertex + size * direction
+    angle = np.arctan2(-direction[1], -direction[0]) + np.linspace(0, 2 * np.pi, CURVE_POINTS)
+    return centre + size * np.column_stack([np.cos(angle), np.sin(angle)])
+
+
+def layout(diagram):
+    """Vertex positions and propagator polylines for one diagram in the unit disc.
+
+    Returns ``(vertices, segments, external)`` where ``segments`` has shape
+    ``(lines, CURVE_POINTS, 2)`` and ``external`` flags the external legs.
+    """
+    adjacency, legs = diagram.adjacency, diagram.legs
+    n = len(adjacency)
+    angle = 2 * np.pi * np.arange(n) / n + np.pi / 2
+    vertices = 0.45 * np.column_stack([np.cos(angle), np.sin(angle)]) if n > 1 else np.zeros((1, 2))
+    segments, external = [], []
+    for i in range(n):
+        for k in range(adjacency[i, i]):
+            segments.append(_loop(vertices[i], 0.18 + 0.08 * k, sideways=n > 1 and i in legs))
+            external.append(False)
+        for j in range(i + 1, n):
+            count = adjacency[i, j]
+            for bend in np.linspace(-0.25, 0.25, count) if count > 1 else [0.0]:
+                segments.append(_arc(vertices[i], vertices[j], bend))
+                external.append(False)
+    # Legs leave their vertex radially, fanned out when several share it.
+    leg_angle = 2 * np.pi * np.arange(len(legs)) / max(len(legs), 1) + np.pi / 4
+    if n > 1:
+        for vertex in range(n):
+            mine = np.flatnonzero(legs == vertex)
+            leg_angle[mine] = angle[vertex] + np.linspace(-0.4, 0.4, len(mine)) * (len(mine) > 1)
+    ends = np.column_stack([np.cos(leg_angle), np.sin(leg_angle)])
+    for e, vertex in enumerate(legs):
+        segments.append(_arc(vertices[vertex], ends[e], 0.0))
+        external.append(True)
+    return vertices, np.array(segments).reshape(-1, CURVE_POINTS, 2), np.array(external, dtype=bool)
+
+
+def gallery(found, columns):
+    """Lay out diagrams on a grid of unit cells; returns arrays ready for single-artist drawing."""
+    vertices, segments, external, centres = [], [], [], []
+    for index, diagram in enumerate(found):
+        centre = np.array([index % columns, -(index // columns)]) * 2.6
+        v, s, e = layout(diagram)
+        vertices.append(v + centre)
+        segments.append(s + centre)
+        external.append(e)
+        centres.append(centre)
+    if not found:
+        return np.zeros((0, 2)), np.zeros((0, CURVE_POINTS, 2)), np.zeros(0, dtype=bool), np.zeros((0, 2))
+    return (np.concatenate(vertices), np.concatenate(segments), np.concatenate(external),
+            np.array(centres))
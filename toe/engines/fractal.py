@@ -0,0 +1,135 @@
+"""Tiled escape-time engine for Mandelbrot and Julia sets.
+
+The complex plane is cut into square tiles on a fixed grid for each pixel
+size, so any view at a given zoom and width is assembled from the same tiles
+and revisiting or panning over a region reuses tiles from ``TILE_CACHE``.
+Tiles are evaluated independently (optionally in a process pool) with
+memory bounded by the tile size, and points stop being iterated as soon as
+they escape.
+"""
+
+import math
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from toe import pool
+from toe.cache import RenderCache
+
+TILE_SIZE = 256
+BASE_SPAN = 3.5
+ESCAPE_RADIUS2 = 4.0
+
+View = namedtuple("View", ["center_x", "center_y", "zoom", "width", "height"])
+
+TILE_CACHE = RenderCache(max_bytes=int(os.environ.get("TOE_TILE_CACHE_BYTES", 128 * 1024 * 1024)))
+
+
+def pixel_size(view):
+    return BASE_SPAN / 2**view.zoom / view.width
+
+
+def escape_time(c_re, c_im, max_iter, julia=None, dtype=np.float64):
+    """Smooth escape-time counts for the points ``c_re + 1j*c_im``.
+
+    For a Julia set the points are starting values and ``julia`` is the fixed
+    ``c``. Points still bounded after ``max_iter`` iterations get ``max_iter``.
+    The arrays of still-iterating points are compacted whenever some escape,
+    so finished pixels cost nothing.
+    """
+    shape = np.shape(c_re)
+    c_re = np.asarray(c_re, dtype=dtype).ravel()
+    c_im = np.asarray(c_im, dtype=dtype).ravel()
+    counts = np.full(c_re.size, max_iter, dtype=np.float32)
+    active = np.arange(c_re.size)
+    if julia is None:
+        z_re = np.zeros_like(c_re)
+        z_im = np.zeros_like(c_im)
+    else:
+        z_re, z_im = c_re.copy(), c_im.copy()
+        c_re = np.full_like(z_re, julia.real)
+        c_im = np.full_like(z_im, julia.imag)
+    for i in range(max_iter):
+        re2 = z_re * z_re
+        im2 = z_im * z_im
+        mag2 = re2 + im2
+        escaped = mag2 > ESCAPE_RADIUS2
+        if escaped.any():
+            log_mag = 0.5 * np.log(mag2[escaped].astype(np.float64))
+            counts[active[escaped]] = i + 1 - np.log2(np.maximum(log_mag, 1e-12))
+            keep = ~escaped
+            active = active[keep]
+            if active.size == 0:
+                break
+            z_re, z_im, c_re, c_im = z_re[keep], z_im[keep], c_re[keep], c_im[keep]
+            re2, im2 = re2[keep], im2[keep]
+        z_im = 2 * z_re * z_im + c_im
+        z_re = re2 - im2 + c_re
+    return counts.reshape(shape)
+
+
+def compute_tile(task):
+    """Escape-time counts of one ``TILE_SIZE`` x ``TILE_SIZE`` tile; picklable for process pools."""
+    i, j, px, max_iter, julia, dtype = task
+    offsets = (np.arange(TILE_SIZE) + 0.5) * px
+    re = i * TILE_SIZE * px + offsets
+    im = j * TILE_SIZE * px + offsets
+    c_re, c_im = np.meshgrid(re.astype(dtype), im.astype(dtype))
+    return escape_time(c_re, c_im, max_iter, julia, dtype)
+
+
+def render(view, max_iter=256, julia=None, dtype=np.float32, workers=None):
+    """Escape-time image for ``view`` with shape ``(height, width)``, row 0 at the bottom.
+
+    Missing tiles are computed in the shared process pool of ``workers``
+    processes (default ``TOE_FRACTAL_WORKERS``, see ``toe.pool``; 1 computes
+    in-process).
+    Returns the image and its ``(x0, x1, y0, y1)`` extent.
+    """
+    dtype = np.dtype(dtype).type
+    px = pixel_size(view)
+    gx0 = math.floor(view.center_x / px - view.width / 2)
+    gy0 = math.floor(view.center_y / px - view.height / 2)
+    ix = range(gx0 // TILE_SIZE, (gx0 + view.width - 1) // TILE_SIZE + 1)
+    iy = range(gy0 // TILE_SIZE, (gy0 + view.height - 1) // TILE_SIZE + 1)
+
+    keys = {}
+    tiles = {}
+    for j in iy:
+        for i in ix:
+            key = ("tile", i, j, px, max_iter, julia, np.dtype(dtype).name)
+            entry = TILE_CACHE.get(key)
+            if entry is None:
+                keys[(i, j)] = key
+            else:
+                tiles[(i, j)] = entry.arrays["counts"]
+    tasks = [(i, j, px, max_iter, julia, dtype) for i, j in keys]
+    if workers is None:
+        workers = pool.default_workers("TOE_FRACTAL_WORKERS")
+    results = pool.run(compute_tile, tasks, workers)
+    for (i, j, *_), counts in zip(tasks, results):
+        tiles[(i, j)] = counts
+        TILE_CACHE.put(keys[(i, j)], b"", {"counts": counts})
+
+    mosaic = np.empty((len(iy) * TILE_SIZE, len(ix) * TILE_SIZE), dtype=np.float32)
+    for (i, j), counts in tiles.items():
+        r = (j - iy.start) * TILE_SIZE
+        c = (i - ix.start) * TILE_SIZE
+        mosaic[r:r + TILE_SIZE, c:c + TILE_SIZE] = counts
+    r0 = gy0 - iy.start * TILE_SIZE
+    c0 = gx0 - ix.start * TILE_SIZE
+    image = mosaic[r0:r0 + view.height, c0:c0 + view.width].copy()
+    extent = (gx0 * px, (gx0 + view.width) * px, gy0 * px, (gy0 + view.height) * px)
+    return image, extent
+
+
+def progressive(view, max_iter=256, julia=None, dtype=np.float32, workers=None, factors=(8, 4, 2, 1)):
+    """Yield ``(image, extent)`` for ``view`` at successively finer resolutions.
+
+    Each coarse pass uses ``factor`` times larger pixels over the same region,
+    so it is about ``factor**2`` times cheaper and its tiles are cached too.
+    """
+    for factor in factors:
+        coarse = view._replace(width=max(1, view.width // factor), height=max(1, view.height // factor))
+        yield render(coarse, max_iter, julia, dtype, workers)
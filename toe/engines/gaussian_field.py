@@ -0,0 +1,141 @@
+"""Flat-sky Gaussian random fields with a given angular power spectrum.
+
+A square patch of ``n x n`` pixels of side ``pixel_size`` radians is
+synthesized in Fourier space, each mode drawn with variance ``C(ell)`` at
+multipole ``ell = 2 pi |k|``, and transformed back with real FFTs. The 2-D
+inverse transform is split into its two 1-D passes: column blocks along
+the first axis into a half-plane spectrum, then row blocks along the second
+with ``irfft``. Both the spectrum and the map may be memory-mapped ``.npy``
+files, so peak memory is one block (``block_bytes``) whatever the map size
+and the work is ``O(n**2 log n)``. ``power_spectrum`` runs the same passes
+forwards to measure a map's spectrum in bins of ``ell``.
+"""
+
+import contextlib
+import os
+import tempfile
+
+import numpy as np
+import scipy.fft
+
+BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def toy_cmb_spectrum(ell):
+    """A CMB-like temperature spectrum ``C_ell`` in uK^2: a plateau, three acoustic peaks and damping."""
+    ell = np.asarray(ell, dtype=np.float64)
+    peaks = sum(height * np.exp(-((ell - centre) / width)**2)
+                for centre, width, height in ((220, 90, 4700), (540, 100, 2100), (810, 110, 2300)))
+    d_ell = (1000 + peaks) * np.exp(-(ell / 1500)**2)
+    with np.errstate(divide='ignore'):
+        return np.where(ell > 0, 2 * np.pi * d_ell / (ell * (ell + 1)), 0.0)
+
+
+def _array(path, shape, dtype):
+    if path is None:
+        return np.empty(shape, dtype=dtype)
+    return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=shape)
+
+
+@contextlib.contextmanager
+def _scratch(beside, shape, dtype):
+    # A working array, memory-mapped to a temporary file next to ``beside`` when that is a path.
+    if beside is None:
+        yield np.empty(shape, dtype=dtype)
+        return
+    handle, path = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(os.path.abspath(beside)))
+    os.close(handle)
+    try:
+        array = _array(path, shape, dtype)
+        yield array
+        del array
+    finally:
+        os.remove(path)
+
+
+def _block(n, itemsize, block_bytes):
+    # Rows or columns of length ``n`` that fit in one block.
+    return max(1, block_bytes // (n * itemsize))
+
+
+def _multipoles(n, pixel_size):
+    ky = scipy.fft.fftfreq(n, d=pixel_size)
+    kx = scipy.fft.rfftfreq(n, d=pixel_size)
+    return 2 * np.pi * ky, 2 * np.pi * kx
+
+
+def _make_hermitian(column):
+    # Columns kx = 0 and kx = n/2 of a real field's spectrum are Hermitian along ky.
+    mirror = np.conj(column[-np.arange(len(column)) % len(column)])
+    return (column + mirror) / np.sqrt(2)
+
+
+def generate(spectrum, n, pixel_size, rng, dtype=np.float32, path=None, block_bytes=BLOCK_BYTES):
+    """An ``n x n`` Gaussian random field with angular power spectrum ``spectrum(ell)``.
+
+    ``spectrum`` maps multipoles to ``C_ell`` in the map's units squared.
+    With ``path`` the map is written to that ``.npy`` file and returned as a
+    read-only memory map; the intermediate spectrum goes to a temporary file
+    beside it. The random stream is consumed in column blocks, so a seed
+    reproduces the same map for the same ``n`` and ``block_bytes``.
+    """
+    real_dtype = np.dtype(dtype)
+    complex_dtype = np.result_type(real_dtype, np.complex64)
+    ell_y, ell_x = _multipoles(n, pixel_size)
+    columns = len(ell_x)
+    edges = {0, n // 2} if n % 2 == 0 else {0}
+    with _scratch(path, (n, columns), complex_dtype) as half:
+        width = _block(n, complex_dtype.itemsize, block_bytes)
+        for start in range(0, columns, width):
+            stop = min(start + width, columns)
+            ell = np.hypot(ell_y[:, None], ell_x[None, start:stop])
+            amplitude = (np.sqrt(spectrum(ell) / 2) * n / pixel_size).astype(real_dtype)
+            modes = rng.standard_normal((2, n, stop - start), dtype=real_dtype)
+            block = (modes[0] + 1j * modes[1]) * amplitude
+            for edge in edges:
+                if start <= edge < stop:
+                    block[:, edge - start] = _make_hermitian(block[:, edge - start])
+            half[:, start:stop] = scipy.fft.ifft(block, axis=0, overwrite_x=True)
+        field = _array(path, (n, n), real_dtype)
+        height = _block(n, complex_dtype.itemsize, block_bytes)
+        for start in range(0, n, height):
+            field[start:start + height] = scipy.fft.irfft(half[start:start + height], n=n, axis=1)
+    if path is not None:
+        field.flush()
+        del field
+        return np.load(path, mmap_mode='r')
+    return field
+
+
+def power_spectrum(field, pixel_size, bins=50, lmax=None, block_bytes=BLOCK_BYTES):
+    """Azimuthally averaged ``C_ell`` of a square map, in ``bins`` linear bins up to ``lmax``.
+
+    Returns ``(ell, c_ell)`` at the bin centres. Works block by block, so
+    ``field`` may be a memory map larger than RAM.
+    """
+    n = len(field)
+    ell_y, ell_x = _multipoles(n, pixel_size)
+    lmax = ell_x[-1] if lmax is None else lmax
+    edges = np.linspace(0, lmax, bins + 1)
+    complex_dtype = np.result_type(field.dtype, np.complex64)
+    power = np.zeros(bins)
+    counts = np.zeros(bins)
+    beside = field.filename if isinstance(field, np.memmap) else None
+    with _scratch(beside, (n, len(ell_x)), complex_dtype) as half:
+        height = _block(n, complex_dtype.itemsize, block_bytes)
+        for start in range(0, n, height):
+            half[start:start + height] = scipy.fft.rfft(field[start:start + height], axis=1)
+        width = _block(n, complex_dtype.itemsize, block_bytes)
+        for start in range(0, len(ell_x), width):
+            block = scipy.fft.fft(half[:, start:start + width], axis=0)
+            ell = np.hypot(ell_y[:, None], ell_x[None, start:start + width])
+            # Interior columns stand for themselves and their mirror images.
+            column = np.arange(start, start + block.shape[1])
+            weight = np.where((column == 0) | ((column == n // 2) & (n % 2 == 0)), 1.0, 2.0)
+            index = np.digitize(ell, edges) - 1
+            inside = (index >= 0) & (index < bins)
+            power += np.bincount(index[inside], (np.abs(block)**2 * weight)[inside], minlength=bins)
+            counts += np.bincount(index[inside], np.broadcast_to(weight, block.shape)[inside], minlength=bins)
+    with np.errstate(invalid='ignore'):
+        c_ell = power / counts * pixel_size**2 / n**2
+    return (edges[:-1] + edges[1:]) / 2, c_ell
@@ -0,0 +1,149 @@
+"""Compact-binary inspiral templates and an FFT matched-filter search.
+
+Templates are frequency-domain post-Newtonian inspirals (TaylorF2, phase to
+2PN order, amplitude ``f**(-7/6)`` up to the innermost stable circular
+orbit) on the ``rfft`` grid of the data segment. A bank over a grid of
+component masses is built once per configuration and stored pre-whitened
+and normalized, ``4 df h*(f) / S(f) / sqrt((h|h))``, so filtering a segment
+against a template is one product and one inverse FFT whose modulus is the
+signal-to-noise ratio at every lag. Banks are cached with ``lru_cache``;
+searches split the bank into blocks evaluated in a process pool, each
+worker building and caching the bank itself so only the data spectrum is
+sent to it.
+"""
+
+import functools
+from collections import namedtuple
+
+import numpy as np
+import pywt
+import scipy.fft
+
+from toe import pool
+
+# G * M_sun / c**3 in seconds.
+SOLAR_TIME = 4.925491e-6
+SAMPLE_RATE = 2048
+DURATION = 16
+F_LOW = 20.0
+BLOCK_TEMPLATES = 32
+
+Bank = namedtuple("Bank", ["masses", "filters", "frequencies"])
+SearchResult = namedtuple("SearchResult", ["snr", "lag", "templates", "samples"])
+
+
+def design_psd(frequencies):
+    """A smooth fit to the design sensitivity of a second-generation detector, in 1/Hz."""
+    x = np.maximum(np.asarray(frequencies, dtype=np.float64), F_LOW) / 215.0
+    return 1e-49 * (x**-4.14 - 5 * x**-2 + 111 * (1 - x**2 + x**4 / 2) / (1 + x**2 / 2))
+
+
+def chirp_mass(m1, m2):
+    return (m1 * m2)**0.6 / (m1 + m2)**0.2
+
+
+def taylor_f2(m1, m2, frequencies, f_low=F_LOW):
+    """The frequency-domain inspiral of masses ``m1, m2`` (solar masses), coalescing at ``t = 0``.
+
+    Unnormalized; zero outside ``f_low`` to the innermost stable circular orbit.
+    """
+    total = (m1 + m2) * SOLAR_TIME
+    eta = m1 * m2 / (m1 + m2)**2
+    isco = 1 / (6**1.5 * np.pi * total)
+    inside = (frequencies >= f_low) & (frequencies <= isco)
+    f = frequencies[inside]
+    v = (np.pi * total * f)**(1 / 3)
+    phase = 3 / (128 * eta * v**5) * (
+        1 + (3715 / 756 + 55 / 9 * eta) * v**2 - 16 * np.pi * v**3
+        + (15293365 / 508032 + 27145 / 504 * eta + 3085 / 72 * eta**2) * v**4)
+    h = np.zeros(len(frequencies), dtype=np.complex128)
+    h[inside] = f**(-7 / 6) * np.exp(-1j * (phase - np.pi / 4))
+    return h
+
+
+def _grid(frequencies):
+    return frequencies[1] - frequencies[0]
+
+
+def normalize(h, psd, df):
+    """``h`` scaled to unit norm under the noise-weighted inner product ``4 Re sum(a b* / S) df``."""
+    return h / np.sqrt(4 * df * np.sum(np.abs(h)**2 / psd))
+
+
+@functools.lru_cache(maxsize=4)
+def template_bank(low=10.0, high=50.0, per_side=20, sample_rate=SAMPLE_RATE, duration=DURATION):
+    """Templates for every ``m1 >= m2`` on a ``per_side``-point grid from ``low`` to ``high`` solar masses."""
+    frequencies = scipy.fft.rfftfreq(sample_rate * duration, 1 / sample_rate)
+    df = _grid(frequencies)
+    psd = design_psd(frequencies)
+    grid = np.linspace(low, high, per_side)
+    masses = np.array([(a, b) for i, a in enumerate(grid) for b in grid[:i + 1]])
+    filters = np.empty((len(masses), len(frequencies)), dtype=np.complex64)
+    for k, (m1, m2) in enumerate(masses):
+        filters[k] = 4 * df * np.conj(normalize(taylor_f2(m1, m2, frequencies), psd, df)) / psd
+    filters.flags.writeable = False
+    return Bank(masses, filters, frequencies)
+
+
+def noise(rng, sample_rate=SAMPLE_RATE, duration=DURATION):
+    """The ``rfft`` (times ``dt``) of Gaussian noise with the design PSD."""
+    frequencies = scipy.fft.rfftfreq(sample_rate * duration, 1 / sample_rate)
+    scale = np.sqrt(design_psd(frequencies) / (4 * _grid(frequencies)))
+    spectrum = scale * (rng.standard_normal(len(frequencies)) + 1j * rng.standard_normal(len(frequencies)))
+    spectrum[0] = spectrum[-1] = 0
+    return spectrum
+
+
+def inject(spectrum, m1, m2, snr, time, phase=0.0, sample_rate=SAMPLE_RATE, duration=DURATION):
+    """Add an inspiral of optimal ``snr`` coalescing ``time`` seconds into the segment."""
+    frequencies = scipy.fft.rfftfreq(sample_rate * duration, 1 / sample_rate)
+    h = normalize(taylor_f2(m1, m2, frequencies), design_psd(frequencies), _grid(frequencies))
+    return spectrum + snr * h * np.exp(-2j * np.pi * frequencies * time + 1j * phase)
+
+
+def snr_series(spectrum, filters):
+    """``|z(t)|`` at every lag for each row of ``filters``; shape ``(len(filters), samples)``."""
+    samples = 2 * (filters.shape[1] - 1)
+    # A one-sided spectrum gives the complex (both-phase) correlation at each lag.
+    product = np.zeros((len(filters), samples), dtype=np.complex64)
+    product[:, :filters.shape[1]] = filters * spectrum.astype(np.complex64)
+    return np.abs(scipy.fft.ifft(product, axis=1, overwrite_x=True)) * samples
+
+
+def _search_block(task):
+    bank_args, start, stop, spectrum = task
+    series = snr_series(spectrum, template_bank(*bank_args).filters[start:stop])
+    lags = series.argmax(axis=1)
+    return series[np.arange(len(lags)), lags], lags
+
+
+def search(spectrum, bank_args=(), block=BLOCK_TEMPLATES, workers=None):
+    """Peak SNR and its lag (in samples) for every template of ``template_bank(*bank_args)``.
+
+    Blocks of ``block`` templates run in the shared pool of ``workers``
+    processes (default ``TOE_GW_WORKERS``, see ``toe.pool``; 1 searches
+    in-process).
+    """
+    bank = template_bank(*bank_args)
+    tasks = [(bank_args, start, min(start + block, len(bank.masses)), spectrum)
+             for start in range(0, len(bank.masses), block)]
+    if workers is None:
+        workers = pool.default_workers("TOE_GW_WORKERS")
+    results = pool.run(_search_block, tasks, workers)
+    return SearchResult(np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results]),
+                        len(bank.masses), 2 * (len(bank.frequencies) - 1))
+
+
+def whiten(spectrum, sample_rate=SAMPLE_RATE):
+    """The whitened strain in the time domain, unit variance per sample for noise above ``F_LOW``."""
+    frequencies = scipy.fft.rfftfreq(2 * (len(spectrum) - 1), 1 / sample_rate)
+    white = spectrum / np.sqrt(design_psd(frequencies) / (4 * _grid(frequencies)))
+    white[frequencies < F_LOW] = 0
+    return scipy.fft.irfft(white) * np.sqrt(len(frequencies) - 1)
+
+
+def scalogram(series, sample_rate, frequencies, wavelet='cmor1.5-1.0'):
+    """Continuous-wavelet power of ``series`` at ``frequencies`` (Hz), shape ``(len(frequencies), len(series))``."""
+    scales = pywt.central_frequency(wavelet) * sample_rate / np.asarray(frequencies)
+    coefficients, _ = pywt.cwt(series, scales, wavelet, sampling_period=1 / sample_rate, method='fft')
+    return np.abs(coefficients)**2
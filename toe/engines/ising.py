@@ -0,0 +1,247 @@
+"""Monte Carlo for classical and transverse-field Ising models on periodic lattices.
+
+Spins are ``int8`` arrays of +-1 and couplings are given per axis in units
+of the temperature, ``K_a = J_a / T``, so one engine covers the isotropic
+2-D and 3-D models and the transverse-field model in ``d`` dimensions, which
+Suzuki-Trotter maps onto a ``d + 1``-dimensional classical lattice with a
+stronger coupling along the imaginary-time axis.
+
+Metropolis sweeps are checkerboard-vectorized: the sites of one parity have
+no neighbours of the same parity, so each half sweep updates all of them at
+once. Neighbour sums are built in preallocated ``int8`` buffers by slicing,
+and acceptance compares raw ``uint32`` random words with a small table of
+integer thresholds indexed by those sums, so no exponentials are evaluated.
+Near a critical point the Wolff cluster update takes over: every bond
+between aligned neighbours is activated with probability
+``1 - exp(-2 K_a)`` and the cluster of a random seed, found with
+``scipy.sparse.csgraph``, is flipped. Independent runs over a range of
+temperatures or fields are spread over a process pool and streamed back as
+they finish.
+"""
+
+import itertools
+import time
+from collections import namedtuple
+from concurrent.futures import as_completed
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from toe import pool
+
+SweepTask = namedtuple("SweepTask", ["shape", "couplings", "control", "equilibrate", "samples", "wolff", "seed"])
+Estimates = namedtuple("Estimates", [
+    "control", "magnetization", "susceptibility", "binder", "energy", "samples", "sweeps_per_second"])
+
+
+def random_spins(rng, shape):
+    return (2 * rng.integers(0, 2, size=shape, dtype=np.int8) - 1).astype(np.int8)
+
+
+def classical_couplings(temperature, dim, coupling=1.0):
+    return (coupling / temperature,) * dim
+
+
+def transverse_field_couplings(field, dim, beta, slices, coupling=1.0):
+    """Couplings of the ``d + 1``-dimensional classical lattice for a transverse-field Ising model.
+
+    The imaginary-time axis is last, ``slices`` long, with
+    ``K_tau = -log(tanh(beta * field / slices)) / 2``.
+    """
+    step = beta / slices
+    return (step * coupling,) * dim + (-0.5 * np.log(np.tanh(step * field)),)
+
+
+class IsingLattice:
+    """A periodic Ising lattice with per-axis ``couplings``, initialised from ``spins``.
+
+    The two checkerboard colours are stored apart, each packed along the
+    last axis to half its length, so a half sweep touches only the sites it
+    updates and its neighbours are plain shifts of the other colour. Every
+    axis must have even length.
+    """
+
+    def __init__(self, spins, couplings):
+        spins = np.asarray(spins, dtype=np.int8)
+        if any(n % 2 for n in spins.shape):
+            raise ValueError("Checkerboard updates need even lattice lengths, got {}".format(spins.shape))
+        self.shape = spins.shape
+        self.size = spins.size
+        self.couplings = tuple(float(k) for k in couplings)
+        # Axes sharing a coupling share a neighbour-sum buffer and an axis of the threshold table.
+        self.groups = [[a for a, k in enumerate(self.couplings) if k == value]
+                       for value in sorted(set(self.couplings))]
+        self._even_rows = (sum(np.indices(self.shape[:-1], dtype=np.int16)) % 2 == 0)[..., None]
+        packed = self.shape[:-1] + (self.shape[-1] // 2,)
+        self.colours = [np.empty(packed, dtype=np.int8), np.empty(packed, dtype=np.int8)]
+        self._pack(spins)
+        self._sums = [np.empty(packed, dtype=np.int8) for _ in self.groups]
+        self._thresholds = self._table()
+        self._index = np.empty(packed, dtype=np.int8 if len(self._thresholds) <= 128 else np.int16)
+        self._flip = np.empty(packed, dtype=bool)
+        self._masks = [np.empty(packed, dtype=bool), np.empty(packed, dtype=bool)]
+        self._toggle = np.empty(packed, dtype=np.uint8)
+        self._sites = np.arange(self.size).reshape(self.shape)
+
+    def _pack(self, spins):
+        # Colour c of a row with leading-coordinate parity p sits at columns 2k + (p + c) % 2.
+        np.copyto(self.colours[0], np.where(self._even_rows, spins[..., 0::2], spins[..., 1::2]))
+        np.copyto(self.colours[1], np.where(self._even_rows, spins[..., 1::2], spins[..., 0::2]))
+
+    @property
+    def spins(self):
+        """The full lattice as one array."""
+        spins = np.empty(self.shape, dtype=np.int8)
+        spins[..., 0::2] = np.where(self._even_rows, self.colours[0], self.colours[1])
+        spins[..., 1::2] = np.where(self._even_rows, self.colours[1], self.colours[0])
+        return spins
+
+    def _table(self):
+        # Acceptance min(1, exp(-2 s * sum_g K_g h_g)) as uint32 thresholds, indexed by each s*h_g + 2 n_g.
+        sizes = [4 * len(group) + 1 for group in self.groups]
+        fields = np.zeros(sizes)
+        for g, group in enumerate(self.groups):
+            shape = [1] * len(sizes)
+            shape[g] = sizes[g]
+            values = np.arange(sizes[g]) - 2 * len(group)
+            fields = fields + (self.couplings[group[0]] * values).reshape(shape)
+        accept = np.minimum(1.0, np.exp(-2 * fields))
+        return np.minimum(np.floor(accept * 2.0**32), 2.0**32 - 1).astype(np.uint32).ravel()
+
+    def _neighbour_sum(self, colour, axes, out):
+        # Neighbours of ``colour`` along ``axes``, all of the other colour, summed by slicing.
+        other = self.colours[1 - colour]
+        last = len(self.shape) - 1
+        out.fill(0)
+        for a in axes:
+            before = (slice(None),) * a
+            if a < last:
+                # Same packed column one row either side.
+                pairs = ((slice(1, None), slice(None, -1)), (slice(0, 1), slice(-1, None)),
+                         (slice(None, -1), slice(1, None)), (slice(-1, None), slice(0, 1)))
+                for target, source in pairs:
+                    out[before + (target,)] += other[before + (source,)]
+                continue
+            out += other
+            # The second neighbour is one packed column left or right, depending on the row's parity.
+            for offsets in itertools.product((0, 1), repeat=last):
+                rows = tuple(slice(o, None, 2) for o in offsets)
+                if (sum(offsets) + colour) % 2 == 0:
+                    pairs = ((slice(1, None), slice(None, -1)), (slice(0, 1), slice(-1, None)))
+                else:
+                    pairs = ((slice(None, -1), slice(1, None)), (slice(-1, None), slice(0, 1)))
+                for target, source in pairs:
+                    out[rows + (target,)] += other[rows + (source,)]
+        return out
+
+    def metropolis(self, rng, sweeps=1):
+        """Checkerboard Metropolis sweeps."""
+        sizes = [4 * len(group) + 1 for group in self.groups]
+        strides = [int(np.prod(sizes[g + 1:])) for g in range(len(sizes))]
+        half = self.size // 2
+        for _ in range(sweeps):
+            for colour in (0, 1):
+                spins = self.colours[colour]
+                words = rng.bit_generator.random_raw(-(-half // 2)).view(np.uint32)[:half].reshape(spins.shape)
+                if len(self.groups) == 1:
+                    total = self._neighbour_sum(colour, self.groups[0], self._sums[0])
+                    np.multiply(total, spins, out=total)
+                    self._accept_isotropic(total, words)
+                else:
+                    self._index.fill(0)
+                    for g, group in enumerate(self.groups):
+                        total = self._neighbour_sum(colour, group, self._sums[g])
+                        np.multiply(total, spins, out=total)
+                        total += 2 * len(group)
+                        self._index += total * strides[g] if strides[g] > 1 else total
+                    np.less(words, self._thresholds[self._index], out=self._flip)
+                # +1 and -1 differ in the bits of 0xFE, so a flip is an XOR with 0xFE times the mask.
+                np.multiply(self._flip.view(np.uint8), 0xFE, out=self._toggle)
+                np.bitwise_xor(spins.view(np.uint8), self._toggle, out=spins.view(np.uint8))
+
+    def _accept_isotropic(self, aligned, words):
+        # With one coupling only a few values of s*h can be rejected, so compare against each of
+        # them rather than gathering a threshold per site.
+        n = len(self.groups[0])
+        np.less_equal(aligned, 0, out=self._flip)
+        selected, below = self._masks
+        for value in range(2, 2 * n + 1, 2):
+            np.equal(aligned, value, out=selected)
+            np.less(words, self._thresholds[2 * n + value], out=below)
+            selected &= below
+            self._flip |= selected
+
+    def wolff(self, rng):
+        """One Wolff cluster flip; returns the cluster size."""
+        spins = self.spins
+        rows, cols = [], []
+        for a, k in enumerate(self.couplings):
+            if k <= 0:
+                continue
+            neighbour = np.roll(self._sites, -1, axis=a)
+            active = (spins == np.roll(spins, -1, axis=a)) & (rng.random(self.shape) < 1 - np.exp(-2 * k))
+            rows.append(self._sites[active])
+            cols.append(neighbour[active])
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        graph = sparse.coo_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(self.size, self.size))
+        _, labels = connected_components(graph, directed=False)
+        cluster = (labels == labels[rng.integers(self.size)]).reshape(self.shape)
+        np.negative(spins, out=spins, where=cluster)
+        self._pack(spins)
+        return int(cluster.sum())
+
+    def magnetization(self):
+        return sum(int(c.sum(dtype=np.int64)) for c in self.colours) / self.size
+
+    def energy(self):
+        """``-sum_a K_a sum_<ij> s_i s_j`` per site, in units of the temperature."""
+        # Every bond has exactly one end of colour 0.
+        total = 0.0
+        for g, group in enumerate(self.groups):
+            bonds = self._neighbour_sum(0, group, self._sums[g])
+            total -= self.couplings[group[0]] * int(np.multiply(bonds, self.colours[0], out=bonds).sum(dtype=np.int64))
+        return total / self.size
+
+
+def simulate(task):
+    """Equilibrate and sample one lattice; returns ``Estimates`` for ``task.control``.
+
+    Each sample follows one Metropolis sweep and, if ``task.wolff``, one
+    Wolff flip. ``susceptibility`` is ``N (<m^2> - <|m|>^2)``, the
+    susceptibility times the temperature.
+    """
+    rng = np.random.default_rng(task.seed)
+    lattice = IsingLattice(random_spins(rng, task.shape), task.couplings)
+    start = time.perf_counter()
+    m = np.empty(task.samples)
+    e = np.empty(task.samples)
+    for i in range(task.equilibrate + task.samples):
+        lattice.metropolis(rng)
+        if task.wolff:
+            lattice.wolff(rng)
+        if i >= task.equilibrate:
+            m[i - task.equilibrate] = abs(lattice.magnetization())
+            e[i - task.equilibrate] = lattice.energy()
+    elapsed = time.perf_counter() - start
+    m2, m4 = np.mean(m**2), np.mean(m**4)
+    return Estimates(task.control, float(m.mean()), float(lattice.size * (m2 - m.mean()**2)),
+                     float(1 - m4 / (3 * m2**2)) if m2 else 0.0, float(e.mean()), task.samples,
+                     (task.equilibrate + task.samples) / elapsed)
+
+
+def sweep(tasks, workers=None):
+    """Yield ``Estimates`` for each ``SweepTask`` as it finishes, in a pool of ``workers`` processes.
+
+    The pool is the shared one of ``toe.pool``; ``workers`` defaults to
+    ``TOE_ISING_WORKERS`` there, and 1 runs the tasks in order in-process.
+    """
+    tasks = list(tasks)
+    if workers is None:
+        workers = pool.default_workers("TOE_ISING_WORKERS")
+    if workers > 1 and len(tasks) > 1:
+        for future in as_completed(pool.submit(simulate, tasks, workers)):
+            yield future.result()
+    else:
+        for task in tasks:
+            yield simulate(task)
@@ -0,0 +1,215 @@
+"""Compact U(1) and SU(2) lattice gauge theory with the Wilson plaquette action.
+
+Links live in one contiguous array per field, ``links[mu, x...]``: unit
+complex numbers for U(1) and unit quaternions ``(a0, a1, a2, a3)`` (the
+matrix ``a0 + i a.sigma``) in a trailing axis for SU(2), so group products
+are a few vectorized multiply-adds. The action is ``beta * sum_P (1 - Re tr
+U_P / N)`` on a periodic lattice whose first axis is Euclidean time.
+
+A sweep updates one direction and one checkerboard parity at a time: the
+staples of those links only involve links of other directions or of the
+opposite parity, so they all update at once. U(1) links take Metropolis
+steps and SU(2) links are drawn from the exact heat-bath distribution
+(Kennedy-Pendleton); both are followed by over-relaxation, which reflects
+each link about its staple without changing the action. ``SnapshotWriter``
+appends configurations to a memory-mapped ``.npy`` file as they are made.
+"""
+
+import itertools
+from collections import namedtuple
+
+import numpy as np
+
+Measurement = namedtuple("Measurement", ["sweep", "plaquette", "polyakov"])
+
+METROPOLIS_STEP = 1.0
+
+
+def qmul(a, b):
+    """Quaternion (SU(2)) products of ``a`` and ``b`` along the last axis."""
+    a0, a1, a2, a3 = np.moveaxis(a, -1, 0)
+    b0, b1, b2, b3 = np.moveaxis(b, -1, 0)
+    return np.stack([a0 * b0 - a1 * b1 - a2 * b2 - a3 * b3,
+                     a0 * b1 + a1 * b0 - a2 * b3 + a3 * b2,
+                     a0 * b2 + a2 * b0 - a3 * b1 + a1 * b3,
+                     a0 * b3 + a3 * b0 - a1 * b2 + a2 * b1], axis=-1)
+
+
+def qdag(a):
+    return a * np.array([1.0, -1.0, -1.0, -1.0])
+
+
+def _random_su2(rng, size):
+    q = rng.standard_normal((size, 4))
+    return q / np.linalg.norm(q, axis=1, keepdims=True)
+
+
+def _sphere(rng, size):
+    v = rng.standard_normal((size, 3))
+    return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+
+class GaugeField:
+    """A ``group`` (``"U1"`` or ``"SU2"``) gauge field on a periodic lattice of ``shape`` at coupling ``beta``.
+
+    Every axis must have even length. ``hot`` starts from random links,
+    otherwise from the identity.
+    """
+
+    def __init__(self, group, shape, beta, rng, hot=True):
+        if group not in ("U1", "SU2"):
+            raise ValueError("Unknown gauge group {!r}".format(group))
+        if any(n % 2 for n in shape):
+            raise ValueError("Even/odd updates need even lattice lengths, got {}".format(shape))
+        self.group = group
+        self.shape = tuple(shape)
+        self.dim = len(shape)
+        self.beta = beta
+        sites = int(np.prod(shape))
+        if group == "U1":
+            angles = rng.uniform(-np.pi, np.pi, (self.dim,) + self.shape) if hot else np.zeros((self.dim,) + self.shape)
+            self.links = np.exp(1j * angles)
+        else:
+            self.links = np.zeros((self.dim,) + self.shape + (4,))
+            if hot:
+                self.links[...] = _random_su2(rng, self.dim * sites).reshape(self.links.shape)
+            else:
+                self.links[..., 0] = 1
+        parity = sum(np.indices(self.shape)) % 2
+        self._parities = [parity == 0, parity == 1]
+        self.updates = 0
+        self.proposed = 0
+        self.accepted = 0
+
+    def _mul(self, a, b):
+        return a * b if self.group == "U1" else qmul(a, b)
+
+    def _dag(self, a):
+        return np.conj(a) if self.group == "U1" else qdag(a)
+
+    def _retrace(self, a):
+        # Re tr(a) / N.
+        return a.real if self.group == "U1" else a[..., 0]
+
+    def _shift(self, field, axis, step):
+        # field(x + step * e_axis) for a field indexed by lattice sites.
+        return np.roll(field, -step, axis=axis)
+
+    def staple(self, mu):
+        """Sum of the staples around every ``mu`` link, so that ``Re tr(U_mu(x) staple(x))`` is its local action."""
+        links = self.links
+        total = 0
+        for nu in range(self.dim):
+            if nu == mu:
+                continue
+            # U_nu(x+mu) U_mu(x+nu)^+ U_nu(x)^+
+            up = self._mul(self._mul(self._shift(links[nu], mu, 1), self._dag(self._shift(links[mu], nu, 1))),
+                           self._dag(links[nu]))
+            # U_nu(x+mu-nu)^+ U_mu(x-nu)^+ U_nu(x-nu)
+            back = self._shift(links[nu], nu, -1)
+            down = self._mul(self._mul(self._dag(self._shift(self._shift(links[nu], mu, 1), nu, -1)),
+                                       self._dag(self._shift(links[mu], nu, -1))), back)
+            total = total + up + down
+        return total
+
+    def _metropolis_u1(self, link, staple, rng):
+        proposal = link * np.exp(1j * rng.uniform(-METROPOLIS_STEP, METROPOLIS_STEP, link.shape))
+        change = self.beta * ((proposal * staple).real - (link * staple).real)
+        accept = np.log(rng.random(link.shape)) < change
+        self.proposed += len(link)
+        self.accepted += int(accept.sum())
+        return np.where(accept, proposal, link)
+
+    def _heatbath_su2(self, staple, rng):
+        # Draw U with density exp(beta k x0) where U V = x, V = staple / k (Kennedy-Pendleton).
+        k = np.linalg.norm(staple, axis=-1)
+        alpha = self.beta * k
+        x0 = np.empty(len(k))
+        pending = np.arange(len(k))
+        while len(pending):
+            r1, r2, r3, r4 = 1 - rng.random((4, len(pending)))
+            lam2 = -(np.log(r1) + np.cos(2 * np.pi * r2)**2 * np.log(r3)) / (2 * alpha[pending])
+            ok = r4**2 <= 1 - lam2
+            x0[pending[ok]] = 1 - 2 * lam2[ok]
+            pending = pending[~ok]
+        x = np.concatenate([x0[:, None], np.sqrt(np.maximum(0, 1 - x0**2))[:, None] * _sphere(rng, len(k))], axis=1)
+        self.proposed += len(k)
+        self.accepted += len(k)
+        return qmul(x, qdag(staple / k[:, None]))
+
+    def _overrelax(self, link, staple):
+        # U -> V^+ U^+ V^+ with V the unit-normalized staple keeps Re tr(U staple) fixed.
+        if self.group == "U1":
+            v = staple / np.maximum(np.abs(staple), 1e-300)
+            return np.conj(link) * np.conj(v)**2
+        v = qdag(staple / np.maximum(np.linalg.norm(staple, axis=-1, keepdims=True), 1e-300))
+        return qmul(qmul(v, qdag(link)), v)
+
+    def sweep(self, rng, overrelax=2):
+        """One heat-bath (SU(2)) or Metropolis (U(1)) sweep followed by ``overrelax`` over-relaxation sweeps."""
+        for step in range(1 + overrelax):
+            for mu in range(self.dim):
+                for mask in self._parities:
+                    staple = self.staple(mu)[mask]
+                    link = self.links[mu][mask]
+                    if step:
+                        self.links[mu][mask] = self._overrelax(link, staple)
+                    elif self.group == "U1":
+                        self.links[mu][mask] = self._metropolis_u1(link, staple, rng)
+                    else:
+                        self.links[mu][mask] = self._heatbath_su2(staple, rng)
+                    self.updates += len(link)
+        if self.group == "SU2":
+            # Products drift off the group in floating point; renormalize.
+            self.links /= np.linalg.norm(self.links, axis=-1, keepdims=True)
+
+    def plaquettes(self):
+        """``Re tr U_P / N`` for each plane ``(mu, nu)``, as ``{(mu, nu): field}``."""
+        links = self.links
+        result = {}
+        for mu, nu in itertools.combinations(range(self.dim), 2):
+            loop = self._mul(self._mul(links[mu], self._shift(links[nu], mu, 1)),
+                             self._dag(self._mul(links[nu], self._shift(links[mu], nu, 1))))
+            result[(mu, nu)] = self._retrace(loop)
+        return result
+
+    def plaquette(self):
+        """The average plaquette ``<Re tr U_P> / N``."""
+        return float(np.mean([p.mean() for p in self.plaquettes().values()]))
+
+    def action_density(self):
+        """Wilson action per site, ``beta * sum_{mu < nu} (1 - Re tr U_P / N)``, as a lattice-shaped array."""
+        return self.beta * sum(1 - p for p in self.plaquettes().values())
+
+    def polyakov_loops(self):
+        """``tr L / N`` at each spatial site, where ``L`` is the product of time-direction links."""
+        loop = self.links[0][0]
+        for t in range(1, self.shape[0]):
+            loop = self._mul(loop, self.links[0][t])
+        return loop if self.group == "U1" else loop[..., 0]
+
+    def measure(self, sweep):
+        return Measurement(sweep, self.plaquette(), float(np.abs(np.mean(self.polyakov_loops()))))
+
+
+class SnapshotWriter:
+    """Appends gauge configurations to a memory-mapped ``.npy`` file of ``count`` slots.
+
+    Each ``write`` fills the next slot and flushes it, so an interrupted run
+    leaves every completed snapshot on disk; ``written`` counts them.
+    """
+
+    def __init__(self, path, field, count):
+        self.path = path
+        self.array = np.lib.format.open_memmap(path, mode='w+', dtype=field.links.dtype,
+                                               shape=(count,) + field.links.shape)
+        self.written = 0
+
+    def write(self, field):
+        self.array[self.written] = field.links
+        self.array.flush()
+        self.written += 1
+
+    def close(self):
+        self.array.flush()
+        del self.array
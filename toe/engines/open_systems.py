@@ -0,0 +1,184 @@
+"""Closed and open (Lindblad) quantum dynamics with cached propagators.
+
+Pure states evolve under ``H`` through its eigendecomposition, or through
+``scipy.sparse.linalg.expm_multiply`` once ``H`` is too large to
+diagonalize. Density matrices evolve under the Lindblad equation
+
+    drho/dt = -i [H, rho] + sum_k (L_k rho L_k^+ - {L_k^+ L_k, rho} / 2)
+
+written as a sparse Liouvillian acting on the column-stacked ``rho``;
+small systems step with a cached dense propagator ``expm(L dt)``, large
+ones use ``expm_multiply``, which only needs sparse products and so reaches
+Hilbert-space dimensions in the thousands. Eigendecompositions and
+propagators are kept in ``PROPAGATOR_CACHE`` under a hash of the operator,
+so re-running a system with new initial states or observables reuses them.
+Independent evolutions, e.g. over a grid of rates, run in a process pool
+through ``evolve_many`` when they are large enough to be worth it.
+"""
+
+import hashlib
+import os
+from collections import namedtuple
+
+import numpy as np
+import scipy.linalg
+from scipy import sparse
+from scipy.sparse.linalg import expm_multiply
+
+from toe import pool
+from toe.cache import RenderCache
+
+# Largest Hilbert space diagonalized densely, and largest Liouvillian exponentiated densely.
+EIGH_LIMIT = 2048
+PROPAGATOR_LIMIT = 1024
+# Batches whose largest Hilbert space is smaller than this evolve in-process; shipping them to workers costs more.
+POOL_DIMENSION = 16
+
+PROPAGATOR_CACHE = RenderCache(max_bytes=int(os.environ.get("TOE_PROPAGATOR_CACHE_BYTES", 128 * 1024 * 1024)))
+
+EvolutionTask = namedtuple("EvolutionTask", ["hamiltonian", "collapse", "state", "times", "observables"])
+
+
+def operator_key(*operators):
+    """A digest identifying operators by value, dense or sparse."""
+    digest = hashlib.blake2b(digest_size=16)
+    for op in operators:
+        if sparse.issparse(op):
+            op = op.tocsr()
+            op.sort_indices()
+            parts = (op.data, op.indices, op.indptr)
+        else:
+            parts = (np.ascontiguousarray(op),)
+        digest.update(repr(op.shape).encode())
+        for part in parts:
+            digest.update(part.tobytes())
+    return digest.hexdigest()
+
+
+def _cached(key, compute):
+    entry = PROPAGATOR_CACHE.get(key)
+    if entry is not None:
+        return entry.arrays
+    arrays = compute()
+    PROPAGATOR_CACHE.put(key, b"", arrays)
+    return arrays
+
+
+def eigensystem(hamiltonian):
+    """Eigenvalues and eigenvectors of a Hermitian ``hamiltonian``, cached by its hash."""
+    def compute():
+        dense = hamiltonian.toarray() if sparse.issparse(hamiltonian) else np.asarray(hamiltonian)
+        values, vectors = scipy.linalg.eigh(dense)
+        return {"values": values, "vectors": vectors}
+
+    arrays = _cached(("eigh", operator_key(hamiltonian)), compute)
+    return arrays["values"], arrays["vectors"]
+
+
+def liouvillian(hamiltonian, collapse=()):
+    """Sparse Lindblad generator acting on ``rho`` stacked column by column (``rho.ravel('F')``)."""
+    h = sparse.csr_matrix(hamiltonian, dtype=np.complex128)
+    identity = sparse.identity(h.shape[0], dtype=np.complex128, format='csr')
+    generator = -1j * (sparse.kron(identity, h) - sparse.kron(h.T, identity))
+    for op in collapse:
+        c = sparse.csr_matrix(op, dtype=np.complex128)
+        decay = (c.conj().T @ c).tocsr()
+        generator = generator + sparse.kron(c.conj(), c) - 0.5 * (sparse.kron(identity, decay)
+                                                               + sparse.kron(decay.T, identity))
+    return generator.tocsr()
+
+
+def propagator(generator, dt):
+    """Dense ``expm(generator * dt)``, cached by the generator's hash and ``dt``."""
+    def compute():
+        dense = generator.toarray() if sparse.issparse(generator) else np.asarray(generator)
+        return {"propagator": scipy.linalg.expm(dense * dt)}
+
+    return _cached(("expm", operator_key(generator), float(dt)), compute)["propagator"]
+
+
+def _uniform(times):
+    steps = np.diff(times)
+    return len(times) > 1 and np.allclose(steps, steps[0])
+
+
+def _expm_path(generator, vector, times):
+    # Vectors at each of ``times`` (uniform, starting anywhere), shape (len(times), n).
+    start = expm_multiply(generator, vector, start=0, stop=times[0], num=2, endpoint=True)[-1] if times[0] else vector
+    return expm_multiply(generator, start, start=0, stop=times[-1] - times[0], num=len(times), endpoint=True)
+
+
+def evolve_pure(hamiltonian, psi0, times, observables=()):
+    """States ``psi(t)`` as rows of a ``(len(times), d)`` array, plus ``<O>(t)`` for each observable."""
+    times = np.asarray(times, dtype=np.float64)
+    psi0 = np.asarray(psi0, dtype=np.complex128)
+    if hamiltonian.shape[0] <= EIGH_LIMIT:
+        values, vectors = eigensystem(hamiltonian)
+        weights = vectors.conj().T @ psi0
+        states = (np.exp(-1j * np.outer(times, values)) * weights) @ vectors.T
+    elif _uniform(times):
+        states = _expm_path(-1j * sparse.csr_matrix(hamiltonian), psi0, times)
+    else:
+        generator = -1j * sparse.csr_matrix(hamiltonian)
+        states = np.array([expm_multiply(generator * t, psi0) for t in times])
+    expectations = np.array([np.einsum('ti,ti->t', states.conj(), (op @ states.T).T).real for op in observables])
+    return states, expectations
+
+
+def _readout(observables, d):
+    # Tr(O rho) = vec(O^T) . vec(rho) for column-stacked vectors, kept sparse for large d.
+    rows, cols, data = [], [], []
+    for k, op in enumerate(observables):
+        transposed = sparse.coo_matrix(op).T
+        rows.append(np.full(transposed.nnz, k))
+        cols.append(transposed.row + d * transposed.col)
+        data.append(transposed.data)
+    if not observables:
+        return sparse.csr_matrix((0, d * d))
+    return sparse.csr_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                             shape=(len(observables), d * d))
+
+
+def evolve_mixed(hamiltonian, collapse, rho0, times, observables=()):
+    """``<O>(t)`` for each observable under the Lindblad equation, shape ``(len(observables), len(times))``.
+
+    ``times`` must be evenly spaced. Density matrices are not returned,
+    since for large systems the trajectory would not fit in memory.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    d = hamiltonian.shape[0]
+    generator = liouvillian(hamiltonian, collapse)
+    vector = np.asarray(rho0, dtype=np.complex128).ravel('F')
+    readout = _readout(observables, d)
+    if d * d <= PROPAGATOR_LIMIT and _uniform(times):
+        step = propagator(generator, times[1] - times[0])
+        if times[0]:
+            vector = propagator(generator, times[0]) @ vector
+        expectations = np.empty((len(observables), len(times)))
+        for i in range(len(times)):
+            expectations[:, i] = (readout @ vector).real
+            vector = step @ vector
+        return expectations
+    return (readout @ _expm_path(generator, vector, times).T).real
+
+
+def _run(task):
+    if task.collapse is None:
+        return evolve_pure(task.hamiltonian, task.state, task.times, task.observables)[1]
+    return evolve_mixed(task.hamiltonian, task.collapse, task.state, task.times, task.observables)
+
+
+def evolve_many(tasks, workers=None):
+    """Expectation values for each ``EvolutionTask``, evaluated in the shared pool of ``workers`` processes.
+
+    ``collapse=None`` marks a closed system. ``workers`` defaults to
+    ``TOE_OPEN_SYSTEM_WORKERS`` (see ``toe.pool``); 1 runs in-process, where
+    the propagator cache is shared between tasks, and so do batches of
+    systems smaller than ``POOL_DIMENSION``.
+    """
+    tasks = list(tasks)
+    if workers is None:
+        workers = pool.default_workers("TOE_OPEN_SYSTEM_WORKERS")
+    if max((task.hamiltonian.shape[0] for task in tasks), default=0) < POOL_DIMENSION:
+        workers = 1
+    return pool.run(_run, tasks, workers)
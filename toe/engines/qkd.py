@@ -0,0 +1,128 @@
+"""BB84 quantum key distribution on packed bit arrays.
+
+Every per-photon quantity (Alice's bits and bases, Bob's bases, an
+intercept-resend eavesdropper's choices, channel bit flips) is a packed
+``uint8`` array holding eight photons per byte, so the protocol is a handful
+of bitwise operations per chunk of ``chunk`` photons. Only the sifted bits
+Alice keeps for the key are carried between chunks, also packed, so memory
+is one chunk plus about ``photons / 16`` bytes. A random ``sample`` of the
+sifted bits is announced to estimate the quantum bit error rate (QBER);
+error correction is taken as ideal, leaking ``EC_EFFICIENCY * h(QBER)`` bits
+per bit, and privacy amplification hashes the corrected key with random
+Toeplitz matrices, one block of ``PA_BLOCK`` bits at a time by FFT.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+CHUNK_PHOTONS = 1 << 20
+PA_BLOCK = 1 << 20
+SAMPLE_FRACTION = 0.1
+# Bits disclosed by a practical reconciliation protocol, relative to the Shannon limit.
+EC_EFFICIENCY = 1.16
+
+BB84Result = namedtuple("BB84Result", [
+    "photons", "sifted", "sampled", "qber", "true_qber", "chunk_qber", "secret_fraction", "key", "key_bits"])
+
+
+def binary_entropy(p):
+    p = np.clip(np.asarray(p, dtype=np.float64), 1e-12, 1 - 1e-12)
+    return -p * np.log2(p) - (1 - p) * np.log2(1 - p)
+
+
+def secret_fraction(qber, efficiency=EC_EFFICIENCY):
+    """Asymptotic secret bits per sifted bit, ``1 - h(Q) - f h(Q)``, floored at zero."""
+    return np.maximum(0.0, 1 - (1 + efficiency) * binary_entropy(qber))
+
+
+def _random_bits(rng, photons):
+    return rng.integers(0, 256, size=photons // 8, dtype=np.uint8)
+
+
+def _biased_bits(rng, photons, p):
+    # Packed bits that are set with probability ``p``.
+    if p <= 0:
+        return np.zeros(photons // 8, dtype=np.uint8)
+    return np.packbits(rng.random(photons, dtype=np.float32) < p)
+
+
+def _select(mask, bits):
+    return np.unpackbits(bits)[np.unpackbits(mask).view(bool)]
+
+
+def transmit(rng, photons, noise=0.0, eavesdrop=0.0):
+    """One chunk of BB84: returns Alice's and Bob's bits and the sifting mask, all packed.
+
+    ``photons`` must be a multiple of 8. Eve intercepts each photon with
+    probability ``eavesdrop``, measures it in a random basis and resends
+    what she saw; the channel then flips Bob's result with probability
+    ``noise``.
+    """
+    alice, alice_basis, bob_basis = (_random_bits(rng, photons) for _ in range(3))
+    photon, basis = alice, alice_basis
+    if eavesdrop > 0:
+        intercepted = _biased_bits(rng, photons, eavesdrop)
+        eve_basis = _random_bits(rng, photons)
+        # Eve reads Alice's bit when their bases agree and a coin flip otherwise.
+        agree = ~(eve_basis ^ alice_basis)
+        eve = (agree & alice) | (~agree & _random_bits(rng, photons))
+        photon = (intercepted & eve) | (~intercepted & alice)
+        basis = (intercepted & eve_basis) | (~intercepted & alice_basis)
+    agree = ~(bob_basis ^ basis)
+    bob = (agree & photon) | (~agree & _random_bits(rng, photons))
+    bob ^= _biased_bits(rng, photons, noise)
+    return alice, bob, ~(alice_basis ^ bob_basis)
+
+
+def toeplitz_hash(rng, bits, length):
+    """Multiply ``bits`` (0/1 array) by a random ``length x len(bits)`` Toeplitz matrix over GF(2).
+
+    The matrix is defined by ``len(bits) + length - 1`` random bits and
+    the product is a convolution, computed exactly with a real FFT.
+    """
+    n = len(bits)
+    if length <= 0 or n == 0:
+        return np.zeros(0, dtype=np.uint8)
+    seed = rng.integers(0, 2, size=n + length - 1, dtype=np.uint8)
+    size = 1 << (2 * n + length - 2).bit_length()
+    product = np.fft.irfft(np.fft.rfft(bits, size) * np.fft.rfft(seed, size), size)[n - 1:n - 1 + length]
+    return (np.rint(product).astype(np.int64) & 1).astype(np.uint8)
+
+
+def bb84(rng, photons, noise=0.0, eavesdrop=0.0, sample=SAMPLE_FRACTION, chunk=CHUNK_PHOTONS, block=PA_BLOCK):
+    """Run BB84 for ``photons`` photons (rounded up to a multiple of 8) and distill a secret key.
+
+    ``qber`` is the estimate from the announced sample and ``true_qber``
+    the error rate of the bits kept for the key; ``chunk_qber`` holds the
+    sample estimate of each chunk. ``key`` is the packed secret key of
+    ``key_bits`` bits, empty when the QBER leaves no secrecy.
+    """
+    photons = -(-photons // 8) * 8
+    chunk = max(8, chunk // 8 * 8)
+    raw, chunk_qber = [], []
+    sifted = sampled = sample_errors = key_errors = 0
+    for start in range(0, photons, chunk):
+        alice, bob, match = transmit(rng, min(chunk, photons - start), noise, eavesdrop)
+        a, b = _select(match, alice), _select(match, bob)
+        announced = rng.random(len(a)) < sample
+        errors = a != b
+        sifted += len(a)
+        sampled += int(announced.sum())
+        sample_errors += int(errors[announced].sum())
+        key_errors += int(errors[~announced].sum())
+        chunk_qber.append(errors[announced].mean() if announced.any() else np.nan)
+        raw.append((np.packbits(a[~announced]), len(a) - int(announced.sum())))
+    kept = sifted - sampled
+    qber = sample_errors / sampled if sampled else 0.0
+    fraction = float(secret_fraction(qber))
+    key = []
+    # After reconciliation Bob holds Alice's bits, so both hash the same blocks.
+    for packed, count in raw:
+        bits = np.unpackbits(packed, count=count)
+        for start in range(0, count, block):
+            part = bits[start:start + block]
+            key.append(toeplitz_hash(rng, part, int(fraction * len(part))))
+    key = np.concatenate(key) if key else np.zeros(0, dtype=np.uint8)
+    return BB84Result(photons, sifted, sampled, qber, key_errors / kept if kept else 0.0,
+                      np.array(chunk_qber), fraction, np.packbits(key), len(key))
@@ -0,0 +1,190 @@
+"""Statevector simulation of qubit circuits.
+
+The ``2**n`` amplitudes are viewed as a rank-``n`` tensor with qubit 0 as
+the first (most significant) axis, and a gate on ``k`` qubits is one
+``einsum`` contraction over those axes. Contractions write into a second
+preallocated buffer which then becomes the state, so applying a gate
+allocates nothing; with ``complex64`` amplitudes 26 qubits need 1 GiB for
+the two buffers. ``Circuit`` records gates and fuses them before running:
+consecutive single-qubit gates on a qubit are multiplied into one matrix,
+and pending single-qubit gates are folded into the next two-qubit gate on
+that qubit, so each pass over the state does as much work as possible.
+Shots are sampled in one batch by searching sorted uniforms against the
+cumulative probabilities, a block at a time.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+Gate = namedtuple("Gate", ["name", "matrix", "qubits"])
+
+I2 = np.eye(2, dtype=np.complex128)
+H = np.array([[1, 1], [1, -1]], dtype=np.complex128) / np.sqrt(2)
+X = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+Y = np.array([[0, -1j], [1j, 0]], dtype=np.complex128)
+Z = np.diag([1, -1]).astype(np.complex128)
+S = np.diag([1, 1j])
+T = np.diag([1, np.exp(1j * np.pi / 4)])
+CNOT = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=np.complex128)
+CZ = np.diag([1, 1, 1, -1]).astype(np.complex128)
+
+# Basis states per block when building cumulative probabilities for sampling.
+SAMPLE_BLOCK = 1 << 20
+
+
+def rx(theta):
+    return np.cos(theta / 2) * I2 - 1j * np.sin(theta / 2) * X
+
+
+def ry(theta):
+    return np.cos(theta / 2) * I2 - 1j * np.sin(theta / 2) * Y
+
+
+def rz(theta):
+    return np.diag([np.exp(-0.5j * theta), np.exp(0.5j * theta)])
+
+
+class StateVector:
+    """``n`` qubits starting in ``|0...0>``, double-buffered so gates update it without allocating."""
+
+    def __init__(self, n, dtype=np.complex64):
+        self.n = n
+        self.dtype = np.dtype(dtype)
+        self.state = np.zeros(2**n, dtype=self.dtype)
+        self.state[0] = 1
+        self._spare = np.empty_like(self.state)
+        self.passes = 0
+
+    @property
+    def nbytes(self):
+        return self.state.nbytes + self._spare.nbytes
+
+    def _view(self, array, qubits):
+        # Split the flat array into (rest, q, rest, q, ..., rest) around the sorted target axes.
+        shape, previous = [], -1
+        for q in sorted(qubits):
+            shape += [2**(q - previous - 1), 2]
+            previous = q
+        shape.append(2**(self.n - previous - 1))
+        return array.reshape(shape)
+
+    def apply(self, matrix, *qubits):
+        """Apply a ``2**k x 2**k`` gate to ``qubits``, the first being the most significant."""
+        k = len(qubits)
+        order = np.argsort(qubits)
+        gate = np.asarray(matrix, dtype=self.dtype).reshape((2,) * 2 * k)
+        # Put the gate's axes in the same order as the sorted qubits.
+        gate = gate.transpose(list(order) + [k + i for i in order])
+        letters = "abcdefghij"
+        outs, ins = "ABCDEFGHIJ"[:k], "KLMNOPQRST"[:k]
+        source = letters[0] + "".join(i + letters[j + 1] for j, i in enumerate(ins))
+        target = letters[0] + "".join(o + letters[j + 1] for j, o in enumerate(outs))
+        np.einsum(f"{outs}{ins},{source}->{target}", gate, self._view(self.state, qubits),
+                  out=self._view(self._spare, qubits))
+        self.state, self._spare = self._spare, self.state
+        self.passes += 1
+        return self
+
+    def probabilities(self):
+        return self.state.real**2 + self.state.imag**2
+
+    def marginal(self, qubit):
+        """Probability that ``qubit`` reads 1."""
+        half = self._view(self.state, [qubit])[:, 1, :]
+        return float(np.vdot(half, half).real)
+
+    def measure(self, qubit, rng):
+        """Measure one qubit, collapsing and renormalizing the state in place; returns 0 or 1."""
+        outcome = int(rng.random() < self.marginal(qubit))
+        view = self._view(self.state, [qubit])
+        view[:, 1 - outcome, :] = 0
+        self.state /= np.linalg.norm(self.state)
+        return outcome
+
+    def reduced_density(self, qubit):
+        """The ``2 x 2`` density matrix of one qubit with the rest traced out."""
+        view = self._view(self.state, [qubit]).astype(np.complex128)
+        return np.einsum('aib,ajb->ij', view, view.conj())
+
+    def sample(self, shots, rng):
+        """Basis-state indices of ``shots`` measurements of every qubit, in ascending order."""
+        return sample_indices(self.probabilities(), shots, rng)
+
+
+def sample_indices(probabilities, shots, rng, block=SAMPLE_BLOCK):
+    """Draw ``shots`` indices from ``probabilities`` by cumulative-probability search.
+
+    The uniforms are sorted once, so each block of cumulative sums (built in
+    float64, ``block`` entries at a time) only searches the uniforms that
+    fall inside it. Returns the indices in ascending order.
+    """
+    uniforms = np.sort(rng.random(shots)) * float(probabilities.sum(dtype=np.float64))
+    indices = np.empty(shots, dtype=np.int64)
+    offset, done = 0.0, 0
+    for start in range(0, len(probabilities), block):
+        cdf = np.cumsum(probabilities[start:start + block], dtype=np.float64) + offset
+        stop = np.searchsorted(uniforms, cdf[-1], side='right') if start + block < len(probabilities) else shots
+        found = np.searchsorted(cdf, uniforms[done:stop], side='right')
+        indices[done:stop] = start + np.minimum(found, len(cdf) - 1)
+        done, offset = stop, cdf[-1]
+    return indices
+
+
+def bits(indices, n):
+    """Measured bit strings as an ``(shots, n)`` array, qubit 0 first."""
+    return (np.asarray(indices)[:, None] >> np.arange(n - 1, -1, -1)) & 1
+
+
+class Circuit:
+    """A gate list on ``n`` qubits that is fused before it is run."""
+
+    def __init__(self, n):
+        self.n = n
+        self.gates = []
+
+    def add(self, name, matrix, *qubits):
+        self.gates.append(Gate(name, np.asarray(matrix, dtype=np.complex128), tuple(qubits)))
+        return self
+
+    def h(self, q):
+        return self.add("H", H, q)
+
+    def x(self, q):
+        return self.add("X", X, q)
+
+    def z(self, q):
+        return self.add("Z", Z, q)
+
+    def cnot(self, control, target):
+        return self.add("CNOT", CNOT, control, target)
+
+    def fused(self):
+        """An equivalent gate list with single-qubit runs merged and folded into two-qubit gates."""
+        pending = {}
+        fused = []
+        for gate in self.gates:
+            if len(gate.qubits) == 1:
+                q = gate.qubits[0]
+                previous = pending.get(q)
+                pending[q] = gate if previous is None else Gate(
+                    previous.name + "+" + gate.name, gate.matrix @ previous.matrix, (q,))
+                continue
+            matrix, names = gate.matrix, [gate.name]
+            before = [pending.pop(q, None) for q in gate.qubits]
+            if len(gate.qubits) == 2 and any(before):
+                a, b = (p.matrix if p is not None else I2 for p in before)
+                matrix = matrix @ np.kron(a, b)
+                names = [p.name for p in before if p is not None] + names
+            else:
+                fused += [p for p in before if p is not None]
+            fused.append(Gate("+".join(names), matrix, gate.qubits))
+        fused += [pending[q] for q in sorted(pending)]
+        return fused
+
+    def run(self, state=None, fuse=True, dtype=np.complex64):
+        """Apply the circuit to ``state`` (default ``|0...0>``) and return it."""
+        state = StateVector(self.n, dtype) if state is None else state
+        for gate in (self.fused() if fuse else self.gates):
+            state.apply(gate.matrix, *gate.qubits)
+        return state
@@ -0,0 +1,117 @@
+"""Classical random-walk ensembles and the discrete-time Hadamard quantum walk.
+
+Classical walkers live on a lattice and take unit steps along every axis at
+once, so each axis is an independent +-1 walk. Sixty-four steps are drawn as
+the bits of one random ``uint64`` and summed with a popcount, and walkers are
+simulated a chunk at a time, keeping only current positions; the ensemble is
+summarized by running sums (mean squared displacement every 64 steps and an
+occupation histogram of final positions) rather than trajectories. Memory is
+therefore set by ``chunk`` and ``block`` alone, whatever the ensemble size.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+WORD_BITS = 64
+CHUNK_WALKERS = 1 << 16
+BLOCK_WORDS = 16
+
+WalkStats = namedtuple("WalkStats", ["walkers", "times", "msd", "occupation", "sites"])
+QuantumWalk = namedtuple("QuantumWalk", ["positions", "probability", "times", "msd"])
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(words):
+        return _BYTE_COUNTS[words.view(np.uint8)].reshape(words.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+
+def _random_words(rng, shape):
+    return rng.integers(0, np.iinfo(np.uint64).max, size=shape, dtype=np.uint64, endpoint=True)
+
+
+def _walk_chunk(rng, walkers, steps, dim, block):
+    # Positions after every full word of steps and after the last one, as (times, walkers, dim).
+    words, remainder = divmod(steps, WORD_BITS)
+    position = np.zeros((walkers, dim), dtype=np.int32)
+    for start in range(0, words, block):
+        count = min(block, words - start)
+        bits = _popcount(_random_words(rng, (count, walkers, dim))).astype(np.int32)
+        path = np.cumsum(2 * bits - WORD_BITS, axis=0) + position
+        position = path[-1]
+        yield path
+    if remainder:
+        mask = np.uint64((1 << remainder) - 1)
+        bits = _popcount(_random_words(rng, (walkers, dim)) & mask).astype(np.int32)
+        position = position + 2 * bits - remainder
+        yield position[None]
+
+
+def ensemble_walk(rng, walkers, steps, dim=1, radius=None, chunk=CHUNK_WALKERS, block=BLOCK_WORDS):
+    """Stream statistics of ``walkers`` lattice walks of ``steps`` steps, one update per chunk.
+
+    Each yielded ``WalkStats`` covers the walkers simulated so far: ``msd``
+    is the mean squared distance from the origin at ``times`` and
+    ``occupation`` the fraction of walkers ending on each reachable site
+    (listed in ``sites`` along every axis) within ``radius`` of the origin,
+    four standard deviations by default. ``radius=steps`` keeps every site.
+    """
+    times = np.arange(WORD_BITS, steps + 1, WORD_BITS)
+    if steps % WORD_BITS:
+        times = np.append(times, steps)
+    radius = min(steps, int(4 * np.sqrt(steps))) if radius is None else radius
+    # After ``steps`` steps only sites with the parity of ``steps`` can be occupied.
+    first = -steps + 2 * -(-(steps - radius) // 2)
+    sites = np.arange(first, -first + 1, 2)
+    shape = (len(sites),) * dim
+    squared = np.zeros(len(times))
+    counts = np.zeros(len(sites)**dim, dtype=np.int64)
+    done = 0
+    while done < walkers:
+        size = min(chunk, walkers - done)
+        row = 0
+        for path in _walk_chunk(rng, size, steps, dim, block):
+            squared[row:row + len(path)] += np.einsum('twd,twd->t', path, path, dtype=np.float64)
+            row += len(path)
+            final = path[-1]
+        cells = (final - first) // 2
+        inside = ((cells >= 0) & (cells < len(sites))).all(axis=1)
+        counts += np.bincount(np.ravel_multi_index(cells[inside].T, shape), minlength=counts.size)
+        done += size
+        yield WalkStats(done, times, squared / done, (counts / done).reshape(shape), sites)
+
+
+def hadamard_walk(steps, coin=(1 / np.sqrt(2), 1j / np.sqrt(2)), stride=1):
+    """Evolve a coined quantum walk on a line from the origin with the Hadamard coin.
+
+    Coin-up amplitudes move right and coin-down amplitudes move left. Each
+    is stored at an index that moves with it, ``x - t`` and ``x + t`` plus an
+    offset, so the shift costs nothing and every step is an in-place coin
+    on the ``2t + 1`` occupied sites. The default initial coin state gives a
+    symmetric distribution. Returns the final position distribution and the
+    variance every ``stride`` steps, which grows as ``t**2`` rather than the
+    classical ``t``.
+    """
+    up = np.zeros(3 * steps + 1, dtype=np.complex128)
+    down = np.zeros(3 * steps + 1, dtype=np.complex128)
+    up[2 * steps], down[steps] = coin
+    scratch = np.empty(2 * steps + 1, dtype=np.complex128)
+    times = np.arange(stride, steps + 1, stride)
+    msd = np.empty(len(times))
+    scale = 1 / np.sqrt(2)
+    for t in range(steps):
+        u = up[2 * steps - 2 * t:2 * steps + 1]
+        d = down[steps:steps + 2 * t + 1]
+        h = scratch[:2 * t + 1]
+        np.subtract(u, d, out=h)
+        u += d
+        u *= scale
+        np.multiply(h, scale, out=d)
+        if (t + 1) % stride == 0:
+            x = np.arange(-t, t + 1)
+            msd[(t + 1) // stride - 1] = (np.abs(u)**2 @ (x + 1)**2 + np.abs(d)**2 @ (x - 1)**2)
+    probability = np.abs(up[:2 * steps + 1])**2 + np.abs(down[steps:])**2
+    return QuantumWalk(np.arange(-steps, steps + 1), probability, times, msd)
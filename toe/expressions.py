@@ -0,0 +1,105 @@
+"""Declarative ``y = f(x)`` curve simulations compiled to NumPy kernels.
+
+A ``CurveSpec`` describes a curve by an expression string, the name of the
+independent variable, a domain and a resolution. The expression is parsed
+with SymPy and turned into a NumPy function by ``lambdify`` once per process;
+every later evaluation, from any session, reuses the compiled function.
+Free symbols other than the variable are parameters, taken from
+``CurveSpec.params`` unless overridden, and may be arrays: ``evaluate_many``
+broadcasts them against the grid so a whole family of curves comes out of a
+single call.
+"""
+
+import functools
+from collections import namedtuple
+
+import numpy as np
+import sympy
+
+PLOT_TYPES = ("line", "polar", "scatter")
+
+CurveSpec = namedtuple("CurveSpec", [
+    "expr", "var", "domain", "resolution", "title", "plot", "params", "xlabel", "ylabel",
+], defaults=["line", (), None, None])
+
+
+@functools.lru_cache(maxsize=None)
+def compile_expression(expr, variables):
+    """Parse ``expr`` and lambdify it over ``variables`` (a tuple of symbol names)."""
+    symbols = [sympy.Symbol(name) for name in variables]
+    parsed = sympy.sympify(expr, locals={s.name: s for s in symbols})
+    unknown = parsed.free_symbols - set(symbols)
+    if unknown:
+        names = ", ".join(sorted(s.name for s in unknown))
+        raise ValueError("Expression {!r} uses undeclared symbols: {}".format(expr, names))
+    return sympy.lambdify(symbols, parsed, modules="numpy")
+
+
+@functools.lru_cache(maxsize=None)
+def _bound(value):
+    return float(sympy.sympify(value))
+
+
+def grid(spec):
+    start, stop = (_bound(str(b)) for b in spec.domain)
+    return np.linspace(start, stop, spec.resolution)
+
+
+def _compiled(spec):
+    if spec.plot not in PLOT_TYPES:
+        raise ValueError("Unknown plot type {!r}, expected one of {}".format(spec.plot, PLOT_TYPES))
+    names = tuple(name for name, _ in spec.params)
+    return compile_expression(spec.expr, (spec.var,) + names), names
+
+
+def evaluate(spec, **params):
+    """Evaluate ``spec`` on its grid and return ``{"x": x, "y": y}``."""
+    return evaluate_many(spec, **params)
+
+
+def evaluate_many(spec, **params):
+    """Evaluate ``spec`` for arrays of parameter values in one vectorized call.
+
+    Parameter arrays are broadcast against each other and get a trailing grid
+    axis, so passing ``k`` of shape ``(P,)`` yields ``y`` of shape ``(P, resolution)``.
+    """
+    func, names = _compiled(spec)
+    values = dict(spec.params)
+    unknown = set(params) - set(values)
+    if unknown:
+        raise TypeError("Unknown parameters for {!r}: {}".format(spec.expr, ", ".join(sorted(unknown))))
+    values.update(params)
+    args = [np.asarray(values[name], dtype=float)[..., np.newaxis] for name in names]
+    x = grid(spec)
+    shape = np.broadcast_shapes(x.shape, *(a.shape for a in args))
+    y = np.broadcast_to(func(x, *args), shape)
+    return {"x": x, "y": y}
+
+
+def spec_kernel(spec):
+    def kernel(rng, **params):
+        return evaluate(spec, **params)
+    return kernel
+
+
+def spec_draw(spec):
+    def draw(ax, data):
+        if spec.plot == "scatter":
+            ax.scatter(data["x"], data["y"])
+        else:
+            ax.plot(data["x"], data["y"])
+        ax.set_title(spec.title)
+        if spec.xlabel:
+            ax.set_xlabel(spec.xlabel)
+        if spec.ylabel:
+            ax.set_ylabel(spec.ylabel)
+    return draw
+
+
+def spec_series(spec):
+    if spec.plot != "line":
+        return None
+
+    def series(data):
+        return {"x": data["x"], "y": data["y"]}
+    return series
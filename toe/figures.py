@@ -0,0 +1,97 @@
+"""Explicitly owned Agg figures for rendering simulations.
+
+Nothing here touches ``matplotlib.pyplot``, so no figure is ever registered
+with pyplot's global figure manager and figures cannot outlive a render.
+Matplotlib itself is only imported when the first figure is created.
+"""
+
+import io
+import threading
+from contextlib import contextmanager
+
+DEFAULT_FIGSIZE = (6.4, 4.8)
+DEFAULT_DPI = 100
+DEFAULT_MAX_FIGURES = 4
+
+
+def new_figure(figsize=DEFAULT_FIGSIZE, dpi=DEFAULT_DPI):
+    """Create a standalone Figure attached to its own Agg canvas."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def new_axes(fig, polar=False):
+    return fig.add_subplot(projection="polar" if polar else None)
+
+
+def figure_bytes(fig, format="png"):
+    buf = io.BytesIO()
+    fig.savefig(buf, format=format)
+    return buf.getvalue()
+
+
+class FigurePool:
+    """A small pool of reusable figures with a hard ceiling on how many exist.
+
+    ``figure()`` hands out a cleared figure and takes it back when the block
+    exits; callers beyond ``max_figures`` wait for one to be returned. The
+    Agg buffers therefore never exceed ``max_bytes`` however many sessions
+    render at once.
+    """
+
+    def __init__(self, max_figures=DEFAULT_MAX_FIGURES, figsize=DEFAULT_FIGSIZE, dpi=DEFAULT_DPI):
+        self.max_figures = max_figures
+        self.figsize = figsize
+        self.dpi = dpi
+        self._slots = threading.BoundedSemaphore(max_figures)
+        self._lock = threading.Lock()
+        self._idle = []
+        self.created = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.renders = 0
+
+    @property
+    def figure_nbytes(self):
+        width, height = self.figsize
+        return int(width * self.dpi) * int(height * self.dpi) * 4
+
+    @property
+    def max_bytes(self):
+        return self.max_figures * self.figure_nbytes
+
+    @contextmanager
+    def figure(self):
+        self._slots.acquire()
+        with self._lock:
+            if self._idle:
+                fig = self._idle.pop()
+            else:
+                fig = new_figure(self.figsize, self.dpi)
+                self.created += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.renders += 1
+        try:
+            yield fig
+        finally:
+            fig.clear()
+            with self._lock:
+                self.in_use -= 1
+                self._idle.append(fig)
+            self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "created": self.created,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "renders": self.renders,
+                "bytes": self.created * self.figure_nbytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,32 @@
+"""Where simulations put the files they write during a render.
+
+Both kinds of file are opt-in, so by default a render writes nothing.
+Checkpoints that later runs resume from go to ``TOE_CHECKPOINT_DIR`` when it
+is set, one per set of parameters. Snapshots go to ``TOE_SNAPSHOT_DIR`` when
+it is set, and every run gets a file of its own there, so concurrent
+sessions rendering the same parameters never share one.
+"""
+
+import os
+import tempfile
+
+CHECKPOINT_DIR = os.environ.get("TOE_CHECKPOINT_DIR")
+SNAPSHOT_DIR = os.environ.get("TOE_SNAPSHOT_DIR")
+
+
+def checkpoint_path(name):
+    """The path of checkpoint ``name`` in ``CHECKPOINT_DIR``, or None when checkpoints are off."""
+    if not CHECKPOINT_DIR:
+        return None
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+    return os.path.join(CHECKPOINT_DIR, name)
+
+
+def snapshot_path(prefix):
+    """A new, empty ``.npy`` file in ``SNAPSHOT_DIR`` whose name starts with ``prefix``, or None when snapshots are off."""
+    if not SNAPSHOT_DIR:
+        return None
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    handle, path = tempfile.mkstemp(prefix=prefix + "-", suffix=".npy", dir=SNAPSHOT_DIR)
+    os.close(handle)
+    return path
@@ -0,0 +1,50 @@
+"""The process pool shared by every engine that fans work out.
+
+All app sessions run as threads of one Streamlit process, so a pool per
+engine would start a full set of worker processes for each engine that had
+ever run. Engines instead submit to one ``ProcessPoolExecutor`` of
+``TOE_WORKERS`` processes (the CPU count by default). It is created and
+resized under a lock, and a batch of tasks is submitted while holding that
+lock, so no thread submits to a pool that another is replacing; work already
+queued on a replaced pool still runs to completion.
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+_lock = threading.Lock()
+_executor = None
+_workers = None
+
+
+def default_workers(variable=None):
+    """The worker count from environment variable ``variable``, else ``TOE_WORKERS``, else the CPU count."""
+    value = os.environ.get(variable) if variable else None
+    if value is None:
+        value = os.environ.get("TOE_WORKERS", os.cpu_count() or 1)
+    return max(1, int(value))
+
+
+def submit(function, tasks, workers):
+    """Submit ``function(task)`` for every task to the shared pool of ``workers`` processes.
+
+    Returns the futures in task order. A different ``workers`` than the
+    pool's replaces it, shutting the old one down once its queued work is done.
+    """
+    global _executor, _workers
+    with _lock:
+        if _executor is None or _workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=workers)
+            _workers = workers
+        return [_executor.submit(function, task) for task in tasks]
+
+
+def run(function, tasks, workers):
+    """``[function(task) for task in tasks]``, in the shared pool if ``workers > 1`` and there are several tasks."""
+    tasks = list(tasks)
+    if workers > 1 and len(tasks) > 1:
+        return [future.result() for future in submit(function, tasks, workers)]
+    return [function(task) for task in tasks]
@@ -0,0 +1,768 @@
+"""Metadata for every simulation and on-demand loading of its code.
+
+``REGISTRY`` holds only plain data (titles, categories, slider parameters,
+optional dependencies), so the sidebar can be built without importing any
+simulation code, Matplotlib or the heavier scientific packages. The
+``kernel``, ``draw``, ``report``, ``series`` and ``frames`` functions of
+simulation ``N`` are looked up as ``kernel_N``, ``draw_N`` and so on in the
+module named by ``SimulationInfo.module`` the first time ``load(N)`` is
+called. ``frames_N`` takes the same arguments as the kernel and yields
+intermediate outputs, the last of which equals the kernel's. Curve simulations instead appear in the module's ``SPECS`` dict as a
+``toe.expressions.CurveSpec`` and get their functions from it.
+
+``SimulationInfo.sweep`` names the output to plot when the kernel broadcasts
+over array-valued parameters and so can be swept by ``toe.sweep``.
+"""
+
+import functools
+import importlib
+import importlib.util
+from collections import namedtuple
+
+Param = namedtuple("Param", ["name", "label", "min", "max", "default", "step"], defaults=[0.01])
+
+SimulationInfo = namedtuple("SimulationInfo", [
+    "number", "title", "category", "description", "usage", "application",
+    "module", "params", "dependencies", "figure", "polar", "stochastic", "sweep",
+], defaults=[None, (), (), True, False, False, None])
+
+Simulation = namedtuple("Simulation", SimulationInfo._fields + ("kernel", "draw", "report", "series", "frames"))
+
+QUANTUM_MECHANICS = "Quantum Mechanics"
+QUANTUM_INFORMATION = "Quantum Information"
+RELATIVITY = "Relativity and Gravity"
+COSMOLOGY = "Cosmology and Astrophysics"
+PARTICLES = "Particle Physics and Quantum Field Theory"
+STRINGS = "String Theory and Beyond"
+CONDENSED_MATTER = "Condensed Matter"
+
+_CATEGORY_MODULES = {
+    QUANTUM_MECHANICS: "toe.sims.quantum_mechanics",
+    QUANTUM_INFORMATION: "toe.sims.quantum_information",
+    RELATIVITY: "toe.sims.relativity",
+    COSMOLOGY: "toe.sims.cosmology",
+    PARTICLES: "toe.sims.particles",
+    STRINGS: "toe.sims.strings",
+    CONDENSED_MATTER: "toe.sims.condensed_matter",
+}
+
+
+def module_name(info):
+    return info.module or _CATEGORY_MODULES[info.category]
+
+
+def default_params(sim):
+    return {p.name: p.default for p in sim.params}
+
+
+def categories():
+    seen = []
+    for info in REGISTRY.values():
+        if info.category not in seen:
+            seen.append(info.category)
+    return seen
+
+
+def missing_dependencies(info):
+    """Return the declared dependencies of ``info`` that are not installed, without importing them."""
+    return [name for name in info.dependencies if importlib.util.find_spec(name) is None]
+
+
+@functools.lru_cache(maxsize=None)
+def load(number):
+    """Import the module behind simulation ``number`` and return its full ``Simulation``."""
+    info = REGISTRY[number]
+    missing = missing_dependencies(info)
+    if missing:
+        raise ImportError("Simulation {} needs {}".format(number, ", ".join(missing)))
+    module = importlib.import_module(module_name(info))
+    spec = getattr(module, "SPECS", {}).get(number)
+    if spec is not None:
+        from toe.expressions import spec_draw, spec_kernel, spec_series
+
+        return Simulation(*info, kernel=spec_kernel(spec), draw=spec_draw(spec), report=None,
+                          series=spec_series(spec), frames=None)
+    return Simulation(
+        *info,
+        kernel=getattr(module, "kernel_{}".format(number)),
+        draw=getattr(module, "draw_{}".format(number), None),
+        report=getattr(module, "report_{}".format(number), None),
+        series=getattr(module, "series_{}".format(number), None),
+        frames=getattr(module, "frames_{}".format(number), None),
+    )
+
+
+REGISTRY = {
+    1: SimulationInfo(
+        1, "Quantum Particle in a Box", QUANTUM_MECHANICS,
+        description="Simulates the wave function of a particle confined in a one-dimensional box.",
+        usage="Watch a superposition of two random neighbouring eigenstates slosh back and forth over time.",
+        application="Understanding quantum confinement in nanomaterials and quantum dots.",
+        module="toe.sims.schrodinger",
+        params=(Param("periods", "Time (beat periods)", 0.25, 4.0, 1.0, 0.25),),
+        dependencies=("scipy",),
+        stochastic=True,
+    ),
+    2: SimulationInfo(
+        2, "Relativistic Effects on a Moving Object", RELATIVITY,
+        description="Demonstrates time dilation effects for objects moving at relativistic speeds.",
+        usage="Adjust the velocity slider to see how time dilation changes.",
+        application="Understanding the effects of special relativity on high-speed travel and GPS satellite corrections.",
+        params=(Param("v", "Velocity (as a fraction of the speed of light)", 0.1, 0.99, 0.5),),
+        sweep="gamma",
+    ),
+    3: SimulationInfo(
+        3, "String Vibrations", STRINGS,
+        description="Simulates the vibrations of a string, analogous to fundamental strings in string theory.",
+        usage="View the combined waveforms of multiple sine waves.",
+        application="Helps in understanding string theory and wave phenomena in physics.",
+    ),
+    4: SimulationInfo(
+        4, "Black Hole Event Horizon", RELATIVITY,
+        description="Simulates the gravitational force near a black hole.",
+        usage="Visualize the change in gravitational force as a function of distance from the black hole.",
+        application="Helps understand the intense gravitational fields near black holes and their effects.",
+    ),
+    5: SimulationInfo(
+        5, "Quantum Entanglement", QUANTUM_MECHANICS,
+        description="Simulates the concept of quantum entanglement between two particles.",
+        usage="Measure a simulated spin singlet; rotate the second detector to see the correlation follow -cos(angle).",
+        application="Fundamental to quantum computing and quantum cryptography.",
+        module="toe.sims.circuits",
+        params=(Param("angle", "Detector 2 angle (degrees)", 0.0, 180.0, 0.0, 5.0),),
+        stochastic=True,
+    ),
+    6: SimulationInfo(
+        6, "Multiverse Theory", COSMOLOGY,
+        description="Simulates the idea of multiple universes existing simultaneously.",
+        usage="Randomly selects a universe from a list of hypothetical universes.",
+        application="Explores the implications of the multiverse theory in cosmology and physics.",
+        figure=False,
+        stochastic=True,
+    ),
+    7: SimulationInfo(
+        7, "Holographic Principle", STRINGS,
+        description="Demonstrates the concept of the holographic principle in physics.",
+        usage="Visualize a sinc function representing the principle.",
+        application="Provides insight into theories that describe our universe as a hologram.",
+    ),
+    8: SimulationInfo(
+        8, "Dark Matter Distribution", COSMOLOGY,
+        description="Visualizes the distribution of dark matter in a galaxy.",
+        usage="Collapse a rotating cloud of up to a million dark matter particles into a halo with a particle-mesh N-body code; the inset shows its rotation curve.",
+        application="Helps in studying the effects of dark matter on galaxy formation and dynamics.",
+        module="toe.sims.nbody",
+        params=(
+            Param("particles", "Particles", 10_000, 1_000_000, 100_000, 10_000),
+            Param("cells", "Mesh cells per side", 32, 128, 64, 32),
+            Param("steps", "Time steps", 20, 300, 120, 10),
+        ),
+        dependencies=("scipy",),
+        stochastic=True,
+    ),
+    9: SimulationInfo(
+        9, "Gravitational Waves", RELATIVITY,
+        description="Simulates the propagation of gravitational waves.",
+        usage="Hide a binary black hole chirp in detector noise, then find it with a matched-filter template bank.",
+        application="Important for understanding astrophysical phenomena like black hole mergers.",
+        module="toe.sims.gravitational_waves",
+        params=(
+            Param("snr", "Injected signal-to-noise ratio", 0.0, 30.0, 15.0, 0.5),
+            Param("per_side", "Template masses per side", 5, 40, 20, 1),
+        ),
+        dependencies=("scipy", "pywt"),
+        stochastic=True,
+    ),
+    10: SimulationInfo(
+        10, "Quantum Field Fluctuations", PARTICLES,
+        description="Visualizes random fluctuations in a quantum field.",
+        usage="Observe a plot of quantum field fluctuations over time.",
+        application="Helps in understanding vacuum energy and particle creation.",
+        stochastic=True,
+    ),
+    11: SimulationInfo(
+        11, "Cosmic Inflation", COSMOLOGY,
+        description="Simulates the rapid expansion of the early universe.",
+        usage="View an exponential growth curve representing cosmic inflation.",
+        application="Provides insights into the early moments of the universe and its subsequent evolution.",
+    ),
+    12: SimulationInfo(
+        12, "Supersymmetry Particles", PARTICLES,
+        description="Generates random supersymmetric particles.",
+        usage="Display a randomly selected supersymmetric particle.",
+        application="Fundamental to theories extending the Standard Model of particle physics.",
+        figure=False,
+        stochastic=True,
+    ),
+    13: SimulationInfo(
+        13, "Loop Quantum Gravity Spin Networks", RELATIVITY,
+        description="Visualizes spin networks in loop quantum gravity.",
+        usage="Grow a random spin network, colour its edges by spin and estimate its spectral dimension.",
+        application="Provides insights into the quantum structure of spacetime.",
+        module="toe.sims.spin_networks",
+        params=(
+            Param("nodes", "Nodes", 100, 20000, 2000, 100),
+            Param("degree", "Mean degree", 4, 20, 10, 1),
+        ),
+        dependencies=("scipy",),
+        stochastic=True,
+    ),
+    14: SimulationInfo(
+        14, "Quantum Tunneling", QUANTUM_MECHANICS,
+        description="Demonstrates the quantum tunneling effect.",
+        usage="Adjust the particle energy to see if it tunnels through a potential barrier.",
+        application="Essential in understanding phenomena in semiconductor devices and nuclear fusion.",
+        params=(Param("E", "Energy of Particle", 0.1, 10.0, 5.0),),
+        sweep="transmission",
+        figure=False,
+    ),
+    15: SimulationInfo(
+        15, "Schrödinger's Cat", QUANTUM_MECHANICS,
+        description="Simulates the quantum superposition of Schrödinger's cat.",
+        usage="Open the box on a many-qubit cat (GHZ) state: it is always all alive or all dead.",
+        application="Illustrates the concept of superposition in quantum mechanics.",
+        module="toe.sims.circuits",
+        params=(Param("qubits", "Qubits in the cat", 1, 24, 16, 1),),
+        figure=False,
+        stochastic=True,
+    ),
+    16: SimulationInfo(
+        16, "Quantum Decoherence", QUANTUM_MECHANICS,
+        description="Visualizes the process of quantum decoherence.",
+        usage="Dephase a qubit with a Lindblad master equation, optionally while driving it, and watch coherence and purity decay.",
+        application="Important for understanding the transition from quantum to classical behavior.",
+        module="toe.sims.open_systems",
+        params=(
+            Param("gamma", "Dephasing rate", 0.0, 10.0, 5.0),
+            Param("omega", "Drive strength", 0.0, 20.0, 0.0),
+        ),
+        dependencies=("scipy",),
+    ),
+    17: SimulationInfo(
+        17, "Entropic Gravity", RELATIVITY,
+        description="Simulates the concept of gravity emerging from entropy.",
+        usage="View the relationship between entropy and temperature.",
+        application="Provides a novel perspective on the origin of gravity.",
+    ),
+    18: SimulationInfo(
+        18, "Feynman Diagrams", PARTICLES,
+        description="Enumerates the distinct Feynman diagrams of a scalar field theory.",
+        usage="Pick the vertex type, external legs and loop order to page through every topology with its symmetry factor.",
+        application="Essential tool in quantum field theory for visualizing particle interactions.",
+        module="toe.sims.feynman_diagrams",
+        params=(
+            Param("valence", "Vertex valence (phi^3 or phi^4)", 3, 4, 3, 1),
+            Param("externals", "External legs", 0, 4, 4, 1),
+            Param("loops", "Loops", 0, 4, 1, 1),
+            Param("page", "Gallery page", 1, 30, 1, 1),
+        ),
+    ),
+    19: SimulationInfo(
+        19, "Noncommutative Geometry", STRINGS,
+        description="Visualizes spaces with noncommutative coordinates.",
+        usage="View a polar plot representing noncommutative geometry.",
+        application="Helps in understanding the mathematical framework of noncommutative spaces in physics.",
+        polar=True,
+    ),
+    20: SimulationInfo(
+        20, "Quantum Information Theory", QUANTUM_INFORMATION,
+        description="Simulates basic operations in quantum information theory.",
+        usage="Generate random bits by measuring qubits in superposition.",
+        application="Fundamental to the development of quantum computing and cryptography.",
+        module="toe.sims.circuits",
+        figure=False,
+        stochastic=True,
+    ),
+    21: SimulationInfo(
+        21, "Virtual Particles in a Vacuum", PARTICLES,
+        description="Visualizes the random fluctuations of virtual particles in a vacuum.",
+        usage="Observe a plot of virtual particle fluctuations.",
+        application="Helps in understanding quantum field theory and vacuum energy.",
+        stochastic=True,
+    ),
+    22: SimulationInfo(
+        22, "Casimir Effect", PARTICLES,
+        description="Simulates the force between two parallel plates due to vacuum fluctuations.",
+        usage="View the relationship between the distance and the Casimir force.",
+        application="Important for understanding forces at the nanoscale.",
+    ),
+    23: SimulationInfo(
+        23, "M-Theory Branes", STRINGS,
+        description="Simulates different types of branes in M-theory.",
+        usage="Randomly select and display a type of brane.",
+        application="Helps in understanding the extended objects in string theory and M-theory.",
+        figure=False,
+        stochastic=True,
+    ),
+    24: SimulationInfo(
+        24, "Quantum Computing Circuits", QUANTUM_INFORMATION,
+        description="Simulates basic quantum gates used in quantum computing.",
+        usage="Run a random circuit of rotations and CNOTs; its output probabilities follow the Porter-Thomas law.",
+        application="Fundamental operations in the field of quantum computing.",
+        module="toe.sims.circuits",
+        params=(
+            Param("qubits", "Qubits", 2, 22, 12, 1),
+            Param("depth", "Layers", 1, 20, 8, 1),
+        ),
+        stochastic=True,
+    ),
+    25: SimulationInfo(
+        25, "Quantum Double-Slit Experiment", QUANTUM_MECHANICS,
+        description="Simulates the interference pattern of the quantum double-slit experiment.",
+        usage="View the resulting interference pattern.",
+        application="Demonstrates the wave-particle duality of quantum mechanics.",
+    ),
+    26: SimulationInfo(
+        26, "Bose-Einstein Condensate", CONDENSED_MATTER,
+        description="Simulates the formation of a Bose-Einstein condensate at low temperatures.",
+        usage="Relax a trapped condensate to its ground state in imaginary time, optionally with imprinted vortices; with TOE_CHECKPOINT_DIR set, reruns resume from checkpoints there.",
+        application="Important for understanding quantum states of matter.",
+        module="toe.sims.condensate",
+        params=(
+            Param("dimensions", "Dimensions", 2, 3, 2, 1),
+            Param("size", "Grid points per axis", 32, 256, 128, 32),
+            Param("interaction", "Interaction strength g", 0.0, 2000.0, 500.0, 10.0),
+            Param("vortices", "Imprinted vortices", 0, 6, 0, 1),
+        ),
+        dependencies=("scipy",),
+    ),
+    27: SimulationInfo(
+        27, "Quark-Gluon Plasma", PARTICLES,
+        description="Visualizes the energy density in a quark-gluon plasma.",
+        usage="Heat an SU(2) gauge field on a 4 x 12^3 lattice; above beta = 2.30 the Polyakov loop grows and colour is deconfined.",
+        application="Helps in understanding the state of matter in the early universe and in high-energy collisions.",
+        module="toe.sims.lattice_gauge",
+        params=(
+            Param("beta", "Coupling beta = 4/g^2", 1.5, 3.5, 2.6, 0.05),
+            Param("sweeps", "Sweeps", 20, 200, 40, 10),
+        ),
+        stochastic=True,
+    ),
+    28: SimulationInfo(
+        28, "Quantum Cryptography", QUANTUM_INFORMATION,
+        description="Simulates the generation of a quantum cryptographic key.",
+        usage="Distill a secret key from a BB84 exchange of up to ten million photons over a noisy channel.",
+        application="Fundamental for secure communication using quantum encryption.",
+        module="toe.sims.qkd",
+        params=(
+            Param("photons", "Photons", 100_000, 20_000_000, 1_000_000, 100_000),
+            Param("noise", "Channel error rate", 0.0, 0.15, 0.02, 0.005),
+        ),
+        figure=False,
+        stochastic=True,
+    ),
+    29: SimulationInfo(
+        29, "Quantum Teleportation", QUANTUM_INFORMATION,
+        description="Simulates the quantum teleportation of a qubit state.",
+        usage="Teleport a random state through a Bell pair with mid-circuit measurement and corrections.",
+        application="Fundamental concept in quantum communication and computing.",
+        module="toe.sims.circuits",
+        figure=False,
+        stochastic=True,
+    ),
+    30: SimulationInfo(
+        30, "Quantum Zeno Effect", QUANTUM_MECHANICS,
+        description="Simulates the effect of frequent measurements on a quantum system.",
+        usage="Set how strongly a Rabi-oscillating qubit is measured; faster measurement freezes it in place.",
+        application="Important for understanding measurement effects in quantum systems.",
+        module="toe.sims.open_systems",
+        params=(Param("rate", "Measurement rate", 0.0, 200.0, 20.0, 1.0),),
+        dependencies=("scipy",),
+    ),
+    31: SimulationInfo(
+        31, "Quantum Hall Effect", CONDENSED_MATTER,
+        description="Simulates the quantized Hall resistance in a two-dimensional electron system.",
+        usage="View the relationship between magnetic field and Hall resistance.",
+        application="Helps in understanding topological quantum phenomena.",
+    ),
+    32: SimulationInfo(
+        32, "Topological Insulators", CONDENSED_MATTER,
+        description="Simulates edge states in topological insulators.",
+        usage="View the sinusoidal patterns representing edge states.",
+        application="Fundamental in understanding new phases of matter with potential applications in electronics.",
+    ),
+    33: SimulationInfo(
+        33, "Wormholes", RELATIVITY,
+        description="Visualizes the theoretical concept of a wormhole.",
+        usage="View a polar plot representing a wormhole.",
+        application="Important in theoretical physics and potential implications for space travel.",
+        polar=True,
+    ),
+    34: SimulationInfo(
+        34, "White Holes", RELATIVITY,
+        description="Simulates the gravitational repulsion near a white hole.",
+        usage="View the inverse-square law for gravitational repulsion.",
+        application="Theoretical concept in general relativity.",
+    ),
+    35: SimulationInfo(
+        35, "Kaluza-Klein Theory", STRINGS,
+        description="Visualizes extra dimensions in Kaluza-Klein theory.",
+        usage="View the relationship between different spatial dimensions.",
+        application="Provides insights into unified theories combining gravity and electromagnetism.",
+    ),
+    36: SimulationInfo(
+        36, "Quantum Chromodynamics", PARTICLES,
+        description="Visualizes the strong force interactions in quantum chromodynamics.",
+        usage="Run heat-bath Monte Carlo of SU(2) Yang-Mills theory on an 8^4 lattice and view its action density.",
+        application="Fundamental to understanding the behavior of quarks and gluons.",
+        module="toe.sims.lattice_gauge",
+        params=(
+            Param("beta", "Coupling beta = 4/g^2", 1.5, 3.5, 2.3, 0.05),
+            Param("sweeps", "Sweeps", 20, 200, 40, 10),
+        ),
+        stochastic=True,
+    ),
+    37: SimulationInfo(
+        37, "Quantum Gravity Gravitons", RELATIVITY,
+        description="Simulates the theoretical particles mediating the force of gravity in quantum gravity.",
+        usage="View a sine wave representing gravitons.",
+        application="Essential for the development of a quantum theory of gravity.",
+    ),
+    38: SimulationInfo(
+        38, "Quantum Electrodynamics", PARTICLES,
+        description="Visualizes random events in quantum electrodynamics.",
+        usage="View a histogram representing particle interactions.",
+        application="Helps in understanding electromagnetic interactions at the quantum level.",
+        stochastic=True,
+    ),
+    39: SimulationInfo(
+        39, "Gauge Symmetry Breaking", PARTICLES,
+        description="Simulates the potential energy in gauge symmetry breaking.",
+        usage="View a plot representing the potential energy.",
+        application="Fundamental to the Higgs mechanism and mass generation in particles.",
+    ),
+    40: SimulationInfo(
+        40, "Quantum Consciousness Interactions", QUANTUM_MECHANICS,
+        description="Simulates interactions in a hypothetical theory of quantum consciousness.",
+        usage="Randomly select a state of quantum consciousness.",
+        application="Explores theoretical concepts at the intersection of quantum mechanics and consciousness.",
+        figure=False,
+        stochastic=True,
+    ),
+    41: SimulationInfo(
+        41, "Quantum Wave Packets", QUANTUM_MECHANICS,
+        description="Simulates the behavior of quantum wave packets.",
+        usage="View the evolution of a wave packet.",
+        application="Helps in understanding wave-particle duality and quantum mechanics.",
+        stochastic=True,
+    ),
+    42: SimulationInfo(
+        42, "Cerenkov Radiation", PARTICLES,
+        description="Simulates the radiation emitted when a particle moves faster than the speed of light in a medium.",
+        usage="View the radiation pattern.",
+        application="Important for particle physics and astrophysics.",
+        params=(Param("v", "Particle Speed (as a fraction of light speed)", 1.1, 10.0, 2.0),),
+        sweep="radiation",
+    ),
+    43: SimulationInfo(
+        43, "Quantum Vacuum Energy", PARTICLES,
+        description="Visualizes the fluctuations in quantum vacuum energy.",
+        usage="View a plot of random fluctuations.",
+        application="Helps in understanding the concept of vacuum energy in quantum field theory.",
+        stochastic=True,
+    ),
+    44: SimulationInfo(
+        44, "Planck Scale Physics", RELATIVITY,
+        description="Simulates physical phenomena at the Planck scale.",
+        usage="View the relationship between length and force at extremely small scales.",
+        application="Provides insights into the fundamental limits of our physical theories.",
+    ),
+    45: SimulationInfo(
+        45, "Symmetry Breaking", PARTICLES,
+        description="Simulates the concept of symmetry breaking in physics.",
+        usage="View a potential energy plot illustrating symmetry breaking.",
+        application="Essential for understanding phase transitions and the Higgs mechanism.",
+    ),
+    46: SimulationInfo(
+        46, "Quantum Dot Simulation", CONDENSED_MATTER,
+        description="Simulates the electronic states in a quantum dot.",
+        usage="View the energy levels of a quantum dot.",
+        application="Important for nanotechnology and quantum computing applications.",
+    ),
+    47: SimulationInfo(
+        47, "Quantum Key Distribution", QUANTUM_INFORMATION,
+        description="Simulates the process of quantum key distribution for secure communication.",
+        usage="Run BB84 with channel noise and an intercept-resend eavesdropper; a QBER above about 10% leaves no secret key.",
+        application="Fundamental for secure quantum communication.",
+        module="toe.sims.qkd",
+        params=(
+            Param("photons", "Photons", 100_000, 20_000_000, 2_000_000, 100_000),
+            Param("noise", "Channel error rate", 0.0, 0.15, 0.02, 0.005),
+            Param("eavesdrop", "Fraction intercepted by Eve", 0.0, 1.0, 0.0, 0.05),
+        ),
+        stochastic=True,
+    ),
+    48: SimulationInfo(
+        48, "Quantum Random Walks", QUANTUM_MECHANICS,
+        description="Simulates the path of a quantum random walk.",
+        usage="Compare a large classical random-walk ensemble with a Hadamard quantum walk: diffusive versus ballistic spreading.",
+        application="Helps in understanding quantum algorithms and processes.",
+        module="toe.sims.random_walks",
+        params=(
+            Param("walkers", "Classical walkers", 1000, 1_000_000, 100_000, 1000),
+            Param("steps", "Steps", 64, 10_000, 1024, 64),
+        ),
+        stochastic=True,
+    ),
+    49: SimulationInfo(
+        49, "Quantum Annealing", QUANTUM_INFORMATION,
+        description="Simulates the process of quantum annealing used for optimization problems.",
+        usage="View the evolution of the solution over time.",
+        application="Used in solving complex optimization problems in various fields.",
+    ),
+    50: SimulationInfo(
+        50, "AdS/CFT Correspondence", STRINGS,
+        description="Visualizes the relationship between Anti-de Sitter space and Conformal Field Theory.",
+        usage="View a representation of AdS space.",
+        application="Provides insights into the holographic principle and string theory.",
+        polar=True,
+    ),
+    51: SimulationInfo(
+        51, "Extra-Dimensional Branes", STRINGS,
+        description="Simulates the concept of extra-dimensional branes in string theory.",
+        usage="Let two rippled sheets of particles fall together through the bulk under Barnes-Hut tree gravity and scatter.",
+        application="Helps in understanding the role of extra dimensions in string theory.",
+        module="toe.sims.nbody",
+        params=(
+            Param("per_brane", "Particles per brane", 500, 5000, 1000, 500),
+            Param("theta", "Opening angle", 0.3, 1.0, 0.6, 0.1),
+            Param("steps", "Time steps", 20, 300, 100, 10),
+        ),
+        dependencies=("scipy",),
+        stochastic=True,
+    ),
+    52: SimulationInfo(
+        52, "Kerr Black Hole", RELATIVITY,
+        description="Simulates the spacetime geometry around a rotating Kerr black hole.",
+        usage="View the ergosphere and event horizon of a Kerr black hole.",
+        application="Important for understanding the dynamics around rotating black holes.",
+    ),
+    53: SimulationInfo(
+        53, "Magnetic Monopoles", PARTICLES,
+        description="Simulates the theoretical particles known as magnetic monopoles.",
+        usage="View a magnetic field pattern of a monopole.",
+        application="Important for understanding magnetic fields in theoretical physics.",
+        polar=True,
+    ),
+    54: SimulationInfo(
+        54, "Hawking Radiation", RELATIVITY,
+        description="Simulates the radiation emitted by black holes due to quantum effects.",
+        usage="View the intensity of Hawking radiation.",
+        application="Important for understanding black hole thermodynamics.",
+    ),
+    55: SimulationInfo(
+        55, "Quasar Emissions", COSMOLOGY,
+        description="Simulates the energy emissions from quasars.",
+        usage="View the light curve of a quasar.",
+        application="Helps in understanding the energetic phenomena in active galactic nuclei.",
+    ),
+    56: SimulationInfo(
+        56, "Cosmic Microwave Background", COSMOLOGY,
+        description="Visualizes the fluctuations in the cosmic microwave background radiation.",
+        usage="Synthesize a sky patch from a CMB-like power spectrum; the inset compares the measured spectrum with the input.",
+        application="Fundamental for understanding the early universe and cosmology.",
+        module="toe.sims.cmb",
+        params=(
+            Param("size", "Map size (pixels)", 256, 4096, 512, 256),
+            Param("width", "Patch width (degrees)", 5, 60, 20, 5),
+        ),
+        dependencies=("scipy",),
+        stochastic=True,
+    ),
+    57: SimulationInfo(
+        57, "Dark Energy Dynamics", COSMOLOGY,
+        description="Simulates the effect of dark energy on the expansion of the universe.",
+        usage="View the scale factor of the universe over time.",
+        application="Helps in understanding the accelerated expansion of the universe.",
+    ),
+    58: SimulationInfo(
+        58, "Quantum Phase Transitions", CONDENSED_MATTER,
+        description="Simulates phase transitions in quantum systems.",
+        usage="Sweep the transverse field across a quantum Ising chain with Monte Carlo; the order parameter vanishes near field = coupling.",
+        application="Important for understanding quantum critical points in materials.",
+        module="toe.sims.ising",
+        params=(
+            Param("length", "Chain length", 8, 64, 16, 8),
+            Param("samples", "Samples per field", 100, 2000, 300, 100),
+        ),
+        dependencies=("scipy",),
+        stochastic=True,
+    ),
+    59: SimulationInfo(
+        59, "Quantum Spin Liquids", CONDENSED_MATTER,
+        description="Simulates the behavior of quantum spin liquids.",
+        usage="Compare exact ground-state spin correlations of a Heisenberg chain of up to 24 sites with those of a Kitaev honeycomb cluster.",
+        application="Helps in understanding exotic phases of matter with potential applications in quantum computing.",
+        module="toe.sims.spin_liquids",
+        params=(
+            Param("sites", "Chain sites", 8, 24, 20, 2),
+            Param("anisotropy", "Ising anisotropy", 0.0, 2.0, 1.0, 0.1),
+        ),
+        dependencies=("scipy",),
+    ),
+    60: SimulationInfo(
+        60, "Quantum Eraser Experiment", QUANTUM_MECHANICS,
+        description="Simulates the quantum eraser experiment demonstrating the wave-particle duality.",
+        usage="View the interference pattern with and without erasure.",
+        application="Fundamental for understanding quantum measurement and interference.",
+    ),
+    61: SimulationInfo(
+        61, "Quantum Entropic Forces", CONDENSED_MATTER,
+        description="Simulates the concept of entropic forces in quantum systems.",
+        usage="View the relationship between entropy and force.",
+        application="Provides insights into emergent phenomena in statistical mechanics.",
+    ),
+    62: SimulationInfo(
+        62, "Quantum Foam", RELATIVITY,
+        description="Simulates the concept of quantum foam at very small scales.",
+        usage="View the fluctuating action density of compact U(1) gauge theory on a 128 x 128 lattice; weaker coupling smooths the foam.",
+        application="Provides insights into the nature of spacetime at the Planck scale.",
+        module="toe.sims.lattice_gauge",
+        params=(
+            Param("beta", "Coupling beta = 1/g^2", 0.5, 8.0, 2.0, 0.1),
+            Param("sweeps", "Sweeps", 20, 500, 100, 10),
+        ),
+        dependencies=("scipy",),
+        stochastic=True,
+    ),
+    63: SimulationInfo(
+        63, "Multiverse Collisions", COSMOLOGY,
+        description="Simulates collisions between different universes in the multiverse.",
+        usage="View the interaction pattern of colliding universes.",
+        application="Explores theoretical concepts in cosmology and high-energy physics.",
+    ),
+    64: SimulationInfo(
+        64, "Quantum Chromodynamic Jets", PARTICLES,
+        description="Simulates the formation of jets in quantum chromodynamics.",
+        usage="View the distribution of particles in a jet.",
+        application="Important for understanding high-energy particle collisions.",
+        polar=True,
+    ),
+    65: SimulationInfo(
+        65, "Chiral Anomaly", PARTICLES,
+        description="Simulates the effect of chiral anomaly in quantum field theory.",
+        usage="View the relationship between chiral current and magnetic field.",
+        application="Important for understanding anomalies in particle physics.",
+    ),
+    66: SimulationInfo(
+        66, "Axion Dark Matter", COSMOLOGY,
+        description="Simulates the behavior of axion dark matter.",
+        usage="View the density distribution of axion dark matter.",
+        application="Important for understanding dark matter candidates in cosmology.",
+        polar=True,
+    ),
+    67: SimulationInfo(
+        67, "Quantum Hamiltonian Simulation", QUANTUM_MECHANICS,
+        description="Simulates the time evolution of a quantum system under a given Hamiltonian.",
+        usage="Spread a particle along a chain of up to thousands of sites; add disorder to see it localize.",
+        application="Fundamental for understanding the dynamics of quantum systems.",
+        module="toe.sims.open_systems",
+        params=(
+            Param("sites", "Chain sites", 50, 4000, 400, 50),
+            Param("disorder", "Disorder strength", 0.0, 5.0, 0.0, 0.1),
+        ),
+        dependencies=("scipy",),
+        stochastic=True,
+    ),
+    68: SimulationInfo(
+        68, "Quantum Molecular Dynamics", QUANTUM_MECHANICS,
+        description="Simulates the dynamics of molecules using quantum mechanics.",
+        usage="Watch where a large ensemble of diffusing molecules ends up; the dashed circle is the RMS displacement.",
+        application="Important for understanding chemical reactions and molecular behavior.",
+        module="toe.sims.random_walks",
+        params=(
+            Param("walkers", "Molecules", 1000, 1_000_000, 100_000, 1000),
+            Param("steps", "Steps", 64, 10_000, 1024, 64),
+        ),
+        stochastic=True,
+    ),
+    69: SimulationInfo(
+        69, "Quantum Chaos", QUANTUM_MECHANICS,
+        description="Simulates chaotic behavior in quantum systems.",
+        usage="View the evolution of a quantum state in a chaotic system.",
+        application="Helps in understanding the interplay between chaos and quantum mechanics.",
+    ),
+    70: SimulationInfo(
+        70, "Cosmic String Simulation", COSMOLOGY,
+        description="Simulates the formation and dynamics of cosmic strings.",
+        usage="View the energy density around a cosmic string.",
+        application="Important for understanding topological defects in cosmology.",
+    ),
+    71: SimulationInfo(
+        71, "Quantum Topological Phases", CONDENSED_MATTER,
+        description="Simulates different topological phases in quantum systems.",
+        usage="View the edge states in topological phases.",
+        application="Important for understanding topological materials and their properties.",
+    ),
+    72: SimulationInfo(
+        72, "Majorana Fermions", CONDENSED_MATTER,
+        description="Simulates the behavior of Majorana fermions.",
+        usage="View the wave function of Majorana fermions.",
+        application="Important for understanding particles that are their own antiparticles.",
+    ),
+    73: SimulationInfo(
+        73, "Neutrino Oscillations", PARTICLES,
+        description="Simulates the oscillation of neutrinos between different flavors.",
+        usage="View three-flavour oscillation probabilities over energy and baseline through matter of the chosen density.",
+        application="Important for understanding the properties and behavior of neutrinos.",
+        module="toe.sims.neutrinos",
+        params=(
+            Param("initial", "Initial flavour (0 e, 1 mu, 2 tau)", 0, 2, 1, 1),
+            Param("final", "Final flavour (0 e, 1 mu, 2 tau)", 0, 2, 0, 1),
+            Param("density", "Matter density (g/cm^3)", 0.0, 13.0, 3.0, 0.1),
+            Param("delta", "CP phase (degrees)", 0.0, 360.0, 197.0, 1.0),
+            Param("antineutrino", "Antineutrinos (0 no, 1 yes)", 0, 1, 0, 1),
+        ),
+    ),
+    74: SimulationInfo(
+        74, "Quantum Spin Hall Effect", CONDENSED_MATTER,
+        description="Simulates the quantum spin Hall effect in materials.",
+        usage="View the edge states in the quantum spin Hall effect.",
+        application="Important for understanding spintronic devices and materials.",
+    ),
+    75: SimulationInfo(
+        75, "Sagnac Effect", RELATIVITY,
+        description="Simulates the Sagnac effect, demonstrating the rotation of space.",
+        usage="View the phase shift due to rotation.",
+        application="Important for understanding interferometry and rotation sensors.",
+        polar=True,
+    ),
+    76: SimulationInfo(
+        76, "Quantum Carpets", QUANTUM_MECHANICS,
+        description="Simulates the formation of quantum carpets in wave-packet dynamics.",
+        usage="View the interference pattern forming a quantum carpet.",
+        application="Helps in understanding wave interference and quantum mechanics.",
+    ),
+    77: SimulationInfo(
+        77, "Higgs Field Interaction", PARTICLES,
+        description="Simulates the interaction of particles with the Higgs field.",
+        usage="View the potential energy of the Higgs field.",
+        application="Essential for understanding mass generation in particles.",
+    ),
+    78: SimulationInfo(
+        78, "WIMP Detection Simulation", COSMOLOGY,
+        description="Simulates the detection of Weakly Interacting Massive Particles (WIMPs).",
+        usage="View the interaction rate of WIMPs.",
+        application="Important for dark matter research and detection experiments.",
+    ),
+    79: SimulationInfo(
+        79, "Primordial Black Holes", COSMOLOGY,
+        description="Simulates the formation and evolution of primordial black holes.",
+        usage="View the mass distribution of primordial black holes.",
+        application="Important for understanding early universe cosmology and dark matter candidates.",
+        stochastic=True,
+    ),
+    80: SimulationInfo(
+        80, "Quantum Fractals", QUANTUM_MECHANICS,
+        description="Simulates the formation of fractals in quantum systems.",
+        usage="Zoom into the Mandelbrot set; the image sharpens from coarse to fine as tiles are computed.",
+        application="Provides insights into the complex behavior of quantum systems.",
+        module="toe.sims.fractals",
+        params=(
+            Param("center_x", "Center (real part)", -2.0, 1.0, -0.5, 0.000001),
+            Param("center_y", "Center (imaginary part)", -1.5, 1.5, 0.0, 0.000001),
+            Param("zoom", "Zoom level (powers of two)", 0, 20, 0, 1),
+            Param("max_iter", "Iterations", 64, 2048, 256, 64),
+        ),
+    ),
+}
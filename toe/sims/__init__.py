@@ -0,0 +1 @@
+"""Simulation plugins, imported on demand by ``toe.registry.load``."""
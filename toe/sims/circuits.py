@@ -0,0 +1,131 @@
+"""Qubit circuits run on ``toe.engines.statevector``."""
+
+import numpy as np
+
+from toe.engines.statevector import H, X, Circuit, StateVector, Z, bits, ry, rz
+
+SHOTS = 100_000
+STATES = {'|0>': np.eye(2)[0], '|1>': np.eye(2)[1], '|+>': H[:, 0], '|->': H[:, 1]}
+
+
+def _spin(bit):
+    return 'Down' if bit else 'Up'
+
+
+def kernel_5(rng, angle=0.0):
+    # The singlet (|01> - |10>)/sqrt(2), with detector 2 rotated by ``angle`` degrees.
+    circuit = Circuit(2).x(1).h(0).cnot(0, 1).z(0).add("Ry", ry(-np.radians(angle)), 1)
+    outcomes = bits(circuit.run().sample(SHOTS, rng), 2)
+    outcomes = outcomes[rng.permutation(SHOTS)]
+    signs = 1 - 2 * outcomes
+    return {
+        "q1": _spin(outcomes[0, 0]), "q2": _spin(outcomes[0, 1]), "angle": angle,
+        "correlation": float((signs[:, 0] * signs[:, 1]).mean()),
+        "counts": np.bincount(2 * outcomes[:, 0] + outcomes[:, 1], minlength=4),
+    }
+
+
+def draw_5(ax, data):
+    ax.bar(['Up, Up', 'Up, Down', 'Down, Up', 'Down, Down'], data["counts"] / data["counts"].sum())
+    ax.set_ylabel("Fraction of shots")
+    ax.set_title(f"Entangled Spins, Detector 2 at {data['angle']:g}°")
+
+
+def report_5(data):
+    return [f"Particle 1: {data['q1']}", f"Particle 2: {data['q2']}",
+            f"Spin correlation over {SHOTS:,} pairs: {data['correlation']:+.3f} "
+            f"(quantum prediction {-np.cos(np.radians(data['angle'])):+.3f})"]
+
+
+def kernel_15(rng, qubits=16):
+    # The cat is a GHZ state: every qubit alive or every qubit dead, never a mixture.
+    qubits = int(qubits)
+    circuit = Circuit(qubits).h(0)
+    for q in range(qubits - 1):
+        circuit.cnot(q, q + 1)
+    indices = circuit.run().sample(SHOTS, rng)
+    dead = 2**qubits - 1
+    return {"cat_state": 'Dead' if indices[rng.integers(SHOTS)] == dead else 'Alive', "qubits": qubits,
+            "alive": int((indices == 0).sum()), "dead": int((indices == dead).sum())}
+
+
+def report_15(data):
+    mixed = SHOTS - data["alive"] - data["dead"]
+    return [f"Schrödinger's Cat is {data['cat_state']}",
+            f"{data['qubits']}-qubit cat over {SHOTS:,} looks: {data['alive']:,} alive, "
+            f"{data['dead']:,} dead, {mixed} in between"]
+
+
+def _random_bits(rng, qubits, shots):
+    circuit = Circuit(qubits)
+    for q in range(qubits):
+        circuit.h(q)
+    return bits(circuit.run().sample(shots, rng), qubits)[rng.permutation(shots)]
+
+
+def kernel_20(rng):
+    samples = _random_bits(rng, 8, SHOTS)
+    values = np.bincount(samples @ (1 << np.arange(7, -1, -1)), minlength=256) / SHOTS
+    entropy = -(values[values > 0] * np.log2(values[values > 0])).sum()
+    return {"bits": samples[0], "entropy": float(entropy)}
+
+
+def report_20(data):
+    return [f"Random Quantum Bits: {data['bits']}",
+            f"Shannon entropy over {SHOTS:,} bytes: {data['entropy']:.4f} of 8 bits"]
+
+
+def kernel_24(rng, qubits=12, depth=8):
+    # Layers of random single-qubit rotations and a brickwork of CNOTs.
+    qubits, depth = int(qubits), int(depth)
+    circuit = Circuit(qubits)
+    for layer in range(depth):
+        for q in range(qubits):
+            a, b, c = rng.uniform(0, 2 * np.pi, 3)
+            circuit.add("Rz", rz(a), q).add("Ry", ry(b), q).add("Rz", rz(c), q)
+        for q in range(layer % 2, qubits - 1, 2):
+            circuit.cnot(q, q + 1)
+    state = circuit.run()
+    probabilities = state.probabilities()
+    top = int(np.argmax(probabilities))
+    return {"scaled": (probabilities * 2**qubits).astype(np.float32), "gates": len(circuit.gates),
+            "passes": state.passes, "qubits": qubits, "top": bits([top], qubits)[0],
+            "top_probability": float(probabilities[top])}
+
+
+def draw_24(ax, data):
+    ax.hist(data["scaled"], bins=60, range=(0, 8), density=True, label="Simulated")
+    x = np.linspace(0, 8, 200)
+    ax.plot(x, np.exp(-x), label="Porter-Thomas e^-x")
+    ax.set_yscale('log')
+    ax.set_xlabel("2^n p(outcome)")
+    ax.legend()
+    ax.set_title(f"Random {data['qubits']}-Qubit Circuit Output Distribution")
+
+
+def report_24(data):
+    return [f"{data['gates']} gates ran as {data['passes']} passes over the state after fusion",
+            f"Most likely outcome |{''.join(map(str, data['top']))}> with p = {data['top_probability']:.3g}"]
+
+
+def kernel_29(rng):
+    label = rng.choice(list(STATES))
+    state = StateVector(3, np.complex128)
+    # Prepare the input on qubit 0 and a Bell pair shared by qubits 1 (Alice) and 2 (Bob).
+    psi = STATES[label]
+    state.apply(np.column_stack([psi, [-np.conj(psi[1]), np.conj(psi[0])]]), 0)
+    Circuit(3).h(1).cnot(1, 2).cnot(0, 1).h(0).run(state)
+    m0, m1 = state.measure(0, rng), state.measure(1, rng)
+    if m1:
+        state.apply(X, 2)
+    if m0:
+        state.apply(Z, 2)
+    fidelity = float(np.real(np.conj(psi) @ state.reduced_density(2) @ psi))
+    return {"state": label, "m0": m0, "m1": m1, "fidelity": fidelity}
+
+
+def report_29(data):
+    corrections = [name for name, bit in (("X", data["m1"]), ("Z", data["m0"])) if bit] or ["none"]
+    return [f"State Teleported: {data['state']}",
+            f"Alice measured {data['m0']}{data['m1']}; Bob applied {' and '.join(corrections)}",
+            f"Fidelity of Bob's qubit with the input: {data['fidelity']:.6f}"]
@@ -0,0 +1,51 @@
+"""Cosmic microwave background maps backed by ``toe.engines.gaussian_field``."""
+
+import numpy as np
+
+from toe.engines.gaussian_field import generate, power_spectrum, toy_cmb_spectrum
+
+# Maps are block-averaged down to at most this many pixels across for display.
+DISPLAY_PIXELS = 1024
+SPECTRUM_BINS = 40
+
+
+def _d_ell(ell, c_ell):
+    return ell * (ell + 1) * c_ell / (2 * np.pi)
+
+
+def kernel_56(rng, size=512, width=20):
+    size = int(size)
+    pixel_size = np.radians(width) / size
+    field = generate(toy_cmb_spectrum, size, pixel_size, rng)
+    lmax = min(3000, np.pi / pixel_size)
+    ell, measured = power_spectrum(field, pixel_size, bins=SPECTRUM_BINS, lmax=lmax)
+    factor = -(-size // DISPLAY_PIXELS)
+    shown = field[:size - size % factor, :size - size % factor]
+    shown = shown.reshape(len(shown) // factor, factor, -1, factor).mean(axis=(1, 3))
+    return {
+        "cmb": shown, "width": width, "size": size, "rms": float(field.std()),
+        "ell": ell, "measured": _d_ell(ell, measured), "model": _d_ell(ell, toy_cmb_spectrum(ell)),
+    }
+
+
+def draw_56(ax, data):
+    half = data["width"] / 2
+    image = ax.imshow(data["cmb"], cmap='RdBu_r', interpolation='nearest', extent=(-half, half, -half, half))
+    ax.figure.colorbar(image, ax=ax, label="Temperature (uK)")
+    ax.set_xlabel("Degrees")
+    inset = ax.inset_axes([0.02, 0.02, 0.35, 0.28])
+    inset.plot(data["ell"], data["model"], 'k-', lw=1)
+    inset.plot(data["ell"], data["measured"], 'o', ms=2)
+    inset.set_xticks([])
+    inset.set_yticks([])
+    inset.set_title("D_ell", fontsize=7, pad=2)
+    ax.set_title("Cosmic Microwave Background Fluctuations")
+
+
+def report_56(data):
+    arcmin = data["width"] * 60 / data["size"]
+    return [f"{data['size']}x{data['size']} pixels of {arcmin:.2f} arcmin, RMS {data['rms']:.1f} uK"]
+
+
+def series_56(data):
+    return {"x": data["ell"], "measured": data["measured"], "model": data["model"]}
@@ -0,0 +1,94 @@
+"""Bose-Einstein condensate ground states backed by ``toe.engines.gross_pitaevskii``."""
+
+import time
+
+import numpy as np
+
+from toe.engines.gross_pitaevskii import GroundStateSolver, thomas_fermi, thomas_fermi_radius, vortex_phase
+from toe.engines.schrodinger import grid, harmonic_potential
+from toe.paths import checkpoint_path
+
+MAX_ITERATIONS = 5000
+TIME_STEP = 0.01
+REDRAW = 250
+
+
+def _checkpoint(dimensions, size, interaction, vortices):
+    # None unless TOE_CHECKPOINT_DIR is set.
+    return checkpoint_path(f"gpe-{dimensions}d-{size}-{interaction:g}-{vortices}.npz")
+
+
+def frames_26(rng, dimensions=2, size=128, interaction=500.0, vortices=0):
+    dimensions, size, vortices = int(dimensions), int(size), int(vortices)
+    radius = thomas_fermi_radius(interaction, dimensions)
+    half = 1.6 * max(radius, 3.0)
+    axes, spacing = grid(size, -half, half, dimensions)
+    potential = np.broadcast_to(harmonic_potential(axes), (size,) * dimensions)
+    # One vortex sits at the centre; more are spaced around a ring at half the condensate radius.
+    ring = 0.5 * radius if vortices > 1 else 0.0
+    angles = 2 * np.pi * np.arange(vortices) / max(vortices, 1)
+    imprint = vortex_phase(axes, ring * np.column_stack([np.cos(angles), np.sin(angles)])) if vortices else None
+
+    solver = GroundStateSolver(np.sqrt(thomas_fermi(potential, interaction, spacing)), potential, spacing,
+                               interaction, TIME_STEP, imprint)
+    path = _checkpoint(dimensions, size, interaction, vortices)
+    resumed = solver.iteration if path and solver.load(path) else None
+    start, first = time.perf_counter(), solver.iteration
+    energies = []
+
+    def frame(converged):
+        density = solver.density()
+        # 3-D condensates are shown as column densities along the vortex axis.
+        column = density.sum(axis=2) * spacing if dimensions == 3 else density
+        elapsed = time.perf_counter() - start
+        return {"density": column, "half": half, "axis": axes[0], "energies": np.array(energies),
+                "converged": converged, "iteration": solver.iteration, "resumed": resumed,
+                "rate": (solver.iteration - first) / elapsed if elapsed else 0.0, "solver_bytes": solver.nbytes,
+                "dimensions": dimensions, "size": size, "interaction": interaction, "vortices": vortices}
+
+    for progress in solver.relax(max_iterations=MAX_ITERATIONS, checkpoint=path):
+        energies.append((progress.iteration, progress.energy))
+        if progress.iteration % REDRAW < 25 or progress.converged or progress.iteration >= MAX_ITERATIONS:
+            yield frame(progress.converged)
+    if not energies:
+        # A checkpoint already at the iteration cap leaves nothing to relax; show it as it stands.
+        energies.append((solver.iteration, solver.energy()))
+        yield frame(False)
+
+
+def kernel_26(rng, dimensions=2, size=128, interaction=500.0, vortices=0):
+    for data in frames_26(rng, dimensions, size, interaction, vortices):
+        pass
+    return data
+
+
+def draw_26(ax, data):
+    half = data["half"]
+    image = ax.imshow(data["density"].T, origin='lower', cmap='inferno', extent=(-half, half, -half, half))
+    ax.figure.colorbar(image, ax=ax, label="Column density" if data["dimensions"] == 3 else "Density")
+    ax.set_xlabel("x (trap lengths)")
+    ax.set_ylabel("y (trap lengths)")
+    energies = data["energies"]
+    if len(energies) > 1:
+        inset = ax.inset_axes([0.02, 0.02, 0.3, 0.24])
+        inset.semilogy(energies[:, 0], np.abs(energies[:, 1] - energies[-1, 1]) + 1e-12, lw=1)
+        inset.set_xticks([])
+        inset.set_yticks([])
+        inset.set_title("E - E_final", fontsize=7, pad=2)
+    state = "converged" if data["converged"] else f"iteration {data['iteration']}"
+    ax.set_title(f"Bose-Einstein Condensate Ground State ({state})")
+
+
+def report_26(data):
+    lines = [f"{data['dimensions']}-D trap on {data['size']}^{data['dimensions']} points, g = {data['interaction']:g}, "
+             f"vortices {data['vortices']}: E = {data['energies'][-1, 1]:.6f} per atom after "
+             f"{data['iteration']} iterations ({'converged' if data['converged'] else 'not converged'})",
+             f"{data['rate']:,.0f} iterations per second; solver arrays {data['solver_bytes'] / 2**20:.1f} MiB"]
+    if data["resumed"] is not None:
+        lines.append(f"Resumed from a checkpoint at iteration {data['resumed']}")
+    return lines
+
+
+def series_26(data):
+    middle = data["density"].shape[1] // 2
+    return {"x": data["axis"], "density": data["density"][:, middle]}
@@ -0,0 +1,68 @@
+"""Condensed Matter simulations."""
+
+import numpy as np
+
+from toe.expressions import CurveSpec
+
+
+def kernel_31(rng):
+    B = np.linspace(0, 10, 100)
+    R = B % 2
+    return {"B": B, "R": R}
+
+
+def draw_31(ax, data):
+    ax.plot(data["B"], data["R"])
+    ax.set_title("Quantum Hall Effect")
+
+
+def series_31(data):
+    return {"x": data["B"], "R": data["R"]}
+
+
+def kernel_32(rng):
+    x = np.linspace(0, 10, 100)
+    y = np.sin(x) + np.cos(2*x)
+    return {"x": x, "y": y}
+
+
+def draw_32(ax, data):
+    ax.plot(data["x"], data["y"])
+    ax.set_title("Edge States in Topological Insulators")
+
+
+def series_32(data):
+    return {"x": data["x"], "y": data["y"]}
+
+
+def kernel_46(rng):
+    levels = np.linspace(0, 10, 10)
+    energy = levels**2
+    return {"levels": levels, "energy": energy}
+
+
+def draw_46(ax, data):
+    ax.stem(data["levels"], data["energy"])
+    ax.set_title("Quantum Dot Energy Levels")
+
+
+def kernel_61(rng):
+    S = np.linspace(0, 10, 100)
+    F = np.gradient(S)
+    return {"S": S, "F": F}
+
+
+def draw_61(ax, data):
+    ax.plot(data["S"], data["F"])
+    ax.set_title("Quantum Entropic Forces")
+
+
+def series_61(data):
+    return {"x": data["S"], "F": data["F"]}
+
+
+SPECS = {
+    71: CurveSpec("sin(2*x)*cos(3*x)", "x", (0, 10), 1000, "Quantum Topological Phases"),
+    72: CurveSpec("exp(-x**2)*cos(x)", "x", (-10, 10), 1000, "Majorana Fermion Wave Function"),
+    74: CurveSpec("sin(2*x) + cos(x)", "x", (0, 10), 1000, "Quantum Spin Hall Effect"),
+}
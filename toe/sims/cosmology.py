@@ -0,0 +1,45 @@
+"""Cosmology and Astrophysics simulations."""
+
+import numpy as np
+
+from toe.expressions import CurveSpec
+
+
+def kernel_6(rng):
+    universes = ['Universe {}'.format(i) for i in range(1, 11)]
+    return {"chosen_universe": rng.choice(universes)}
+
+
+def report_6(data):
+    return [f"You are now in {data['chosen_universe']}!"]
+
+
+def kernel_66(rng):
+    theta = np.linspace(0, 2*np.pi, 1000)
+    density = np.abs(np.sin(4*theta))
+    return {"theta": theta, "density": density}
+
+
+def draw_66(ax, data):
+    ax.plot(data["theta"], data["density"])
+    ax.set_title("Axion Dark Matter Density")
+
+
+def kernel_79(rng):
+    mass = rng.normal(size=1000)
+    return {"mass": mass}
+
+
+def draw_79(ax, data):
+    ax.hist(data["mass"], bins=30)
+    ax.set_title("Primordial Black Holes Mass Distribution")
+
+
+SPECS = {
+    11: CurveSpec("exp(t)", "t", (0, 10), 100, "Cosmic Inflation"),
+    55: CurveSpec("sin(t)*exp(-gamma*t)", "t", (0, 10), 1000, "Quasar Emissions Light Curve", params=(("gamma", 0.1),)),
+    57: CurveSpec("exp(H*t)", "t", (0, 10), 100, "Effect of Dark Energy on Universal Expansion", params=(("H", 0.1),)),
+    63: CurveSpec("sin(x)*cos(x)", "x", (-10, 10), 1000, "Multiverse Collisions"),
+    70: CurveSpec("exp(-r)", "r", (0, 10), 1000, "Cosmic String Energy Density"),
+    78: CurveSpec("exp(-t)", "t", (0, 10), 1000, "WIMP Detection Simulation"),
+}
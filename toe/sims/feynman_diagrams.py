@@ -0,0 +1,52 @@
+"""Feynman diagram galleries backed by ``toe.engines.feynman``."""
+
+import numpy as np
+from matplotlib.collections import LineCollection
+
+from toe.engines.feynman import diagrams, gallery, vertex_count
+
+PAGE_SIZE = 200
+# Larger diagrams take more than a few seconds to enumerate.
+MAX_VERTICES = 8
+# Symmetry factors are only labelled on pages small enough to read them.
+LABEL_LIMIT = 48
+
+
+def kernel_18(rng, valence=3, externals=4, loops=1, page=1):
+    valence, externals, loops, page = int(valence), int(externals), int(loops), int(page)
+    vertices = vertex_count(valence, externals, loops)
+    found = diagrams(valence, externals, loops) if vertices and vertices <= MAX_VERTICES else ()
+    shown = found[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+    columns = max(1, int(np.ceil(np.sqrt(len(shown) * 4 / 3))))
+    points, segments, external, centres = gallery(shown, columns)
+    return {
+        "points": points, "segments": segments, "external": external, "centres": centres,
+        "symmetry": np.array([d.symmetry for d in shown], dtype=int),
+        "weight": float(sum(1 / d.symmetry for d in found)),
+        "count": len(found), "vertices": vertices, "too_large": bool(vertices and vertices > MAX_VERTICES),
+        "theory": f"phi^{valence}", "externals": externals, "loops": loops, "page": page,
+    }
+
+
+def draw_18(ax, data):
+    colours = np.where(data["external"][:, None], [0.85, 0.33, 0.1, 1.0], [0.12, 0.47, 0.71, 1.0])
+    ax.add_collection(LineCollection(data["segments"], colors=colours, linewidths=1))
+    ax.scatter(data["points"][:, 0], data["points"][:, 1], s=4, color='k', zorder=3)
+    if len(data["centres"]) <= LABEL_LIMIT:
+        for (x, y), factor in zip(data["centres"], data["symmetry"]):
+            ax.text(x, y - 1.15, f"1/{factor}", ha='center', va='top', fontsize=6)
+    if not len(data["centres"]):
+        ax.text(0.5, 0.5, "No diagrams on this page", ha='center', va='center', transform=ax.transAxes)
+    ax.autoscale_view()
+    ax.set_aspect('equal')
+    ax.set_axis_off()
+    ax.set_title("Feynman Diagrams: {}, {} external legs, {} loops".format(
+        data["theory"], data["externals"], data["loops"]))
+
+
+def report_18(data):
+    if data["too_large"]:
+        return [f"{data['vertices']} vertices is too many to enumerate here (limit {MAX_VERTICES})."]
+    pages = max(1, -(-data["count"] // PAGE_SIZE))
+    return [f"{data['count']} distinct connected diagrams, page {data['page']} of {pages}",
+            f"Sum of symmetry factors 1/S: {data['weight']:.6g}"]
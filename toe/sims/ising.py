@@ -0,0 +1,61 @@
+"""Quantum phase transitions backed by ``toe.engines.ising``."""
+
+import numpy as np
+
+from toe.engines.ising import SweepTask, sweep, transverse_field_couplings
+
+FIELDS = np.linspace(0.2, 2.0, 16)
+# Imaginary-time slices per unit of inverse temperature, and inverse temperature per site.
+SLICES_PER_BETA = 10
+BETA_PER_SITE = 1.0
+EQUILIBRATE = 100
+
+
+def frames_58(rng, length=16, samples=300):
+    # A transverse-field Ising chain at temperature ~1/L, mapped onto an L x M classical lattice.
+    length, samples = int(length), int(samples)
+    beta = BETA_PER_SITE * length
+    slices = int(SLICES_PER_BETA * beta)
+    seeds = rng.integers(0, 2**63, size=len(FIELDS))
+    tasks = [SweepTask((length, slices), transverse_field_couplings(field, 1, beta, slices), field,
+                       EQUILIBRATE, samples, True, int(seed)) for field, seed in zip(FIELDS, seeds)]
+    results = []
+    for estimates in sweep(tasks):
+        results.append(estimates)
+        results.sort(key=lambda r: r.control)
+        yield {"field": np.array([r.control for r in results]),
+               "magnetization": np.array([r.magnetization for r in results]),
+               "binder": np.array([r.binder for r in results]),
+               "susceptibility": np.array([r.susceptibility for r in results]),
+               "rate": float(np.mean([r.sweeps_per_second for r in results])),
+               "length": length, "slices": slices, "done": len(results)}
+
+
+def kernel_58(rng, length=16, samples=300):
+    for data in frames_58(rng, length, samples):
+        pass
+    return data
+
+
+def draw_58(ax, data):
+    ax.plot(data["field"], data["magnetization"], 'o-', label="<|m|>")
+    ax.plot(data["field"], data["binder"], 's-', label="Binder cumulant")
+    exact = np.linspace(FIELDS[0], 1, 200)
+    ax.plot(exact, (1 - exact**2)**0.125, 'k--', lw=1, label="Exact, infinite chain")
+    ax.axvline(1.0, color='gray', linestyle=':')
+    ax.set_xlim(FIELDS[0], FIELDS[-1])
+    ax.set_ylim(-0.1, 1.05)
+    ax.set_xlabel("Transverse field / coupling")
+    ax.legend()
+    ax.set_title(f"Transverse-Field Ising Chain, L = {data['length']}")
+
+
+def report_58(data):
+    peak = data["field"][np.argmax(data["susceptibility"])]
+    return [f"{data['done']} of {len(FIELDS)} fields on a {data['length']} x {data['slices']} Suzuki-Trotter lattice",
+            f"Susceptibility peaks at field {peak:.2f} (critical value 1 for an infinite chain)",
+            f"{data['rate']:,.0f} Metropolis + Wolff steps per second per field"]
+
+
+def series_58(data):
+    return {"x": data["field"], "magnetization": data["magnetization"], "binder": data["binder"]}
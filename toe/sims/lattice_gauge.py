@@ -0,0 +1,162 @@
+"""Lattice gauge theory backed by ``toe.engines.lattice_gauge``."""
+
+import time
+
+import numpy as np
+
+from toe.engines.lattice_gauge import GaugeField, SnapshotWriter
+from toe.paths import snapshot_path
+
+SNAPSHOT_EVERY = 10
+REDRAW = 10
+# Deconfinement coupling of SU(2) with four time slices.
+SU2_CRITICAL_BETA_NT4 = 2.30
+
+
+def _snapshots(name, beta, sweeps, field):
+    # None unless TOE_SNAPSHOT_DIR is set.
+    shape = "x".join(str(n) for n in field.shape)
+    path = snapshot_path(f"gauge-{name}-{shape}-{beta:g}-{sweeps}")
+    return SnapshotWriter(path, field, max(1, sweeps // SNAPSHOT_EVERY)) if path else None
+
+
+def _plane(density):
+    # Average over Euclidean time, then cut through the first site of any axes beyond two.
+    if density.ndim > 2:
+        density = density.mean(axis=0)
+    while density.ndim > 2:
+        density = density[..., 0]
+    return density
+
+
+def _frames(rng, name, group, shape, beta, sweeps):
+    field = GaugeField(group, shape, beta, rng)
+    writer = _snapshots(name, beta, sweeps, field)
+    history = []
+    start = time.perf_counter()
+    try:
+        for i in range(1, sweeps + 1):
+            field.sweep(rng)
+            history.append(field.measure(i))
+            if writer is not None and i % SNAPSHOT_EVERY == 0 and writer.written < len(writer.array):
+                writer.write(field)
+            if i % REDRAW == 0 or i == sweeps:
+                elapsed = time.perf_counter() - start
+                yield {"density": _plane(field.action_density()), "history": np.array(history),
+                       "rate": field.updates / elapsed if elapsed else 0.0,
+                       "acceptance": field.accepted / field.proposed,
+                       "snapshots": writer.written if writer else 0, "path": writer.path if writer else None,
+                       "beta": beta, "shape": field.shape, "done": i, "sweeps": sweeps}
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _equilibrium(history):
+    # Averages over the second half of the run.
+    return history[len(history) // 2:, 1:].mean(axis=0)
+
+
+def _draw_density(ax, data, cmap, label):
+    image = ax.imshow(data["density"], cmap=cmap, interpolation='nearest', origin='lower')
+    ax.figure.colorbar(image, ax=ax, label=label)
+    ax.set_xlabel("y")
+    ax.set_ylabel("x")
+
+
+def _inset_history(ax, data, column, label):
+    inset = ax.inset_axes([0.6, 0.64, 0.37, 0.27])
+    inset.plot(data["history"][:, 0], data["history"][:, column], lw=1)
+    inset.set_title(label, fontsize=7)
+    inset.tick_params(labelsize=6)
+
+
+def _footer(data):
+    lines = [f"{data['done']} of {data['sweeps']} sweeps on a {' x '.join(map(str, data['shape']))} lattice, "
+             f"{data['rate']:,.0f} link updates per second"]
+    if data["path"]:
+        lines.append(f"{data['snapshots']} configurations written to {data['path']}")
+    return lines
+
+
+def frames_27(rng, beta=2.6, sweeps=40):
+    # Finite temperature: four time slices against a 12^3 volume.
+    yield from _frames(rng, "qgp", "SU2", (4, 12, 12, 12), beta, int(sweeps))
+
+
+def kernel_27(rng, beta=2.6, sweeps=40):
+    for data in frames_27(rng, beta, sweeps):
+        pass
+    return data
+
+
+def draw_27(ax, data):
+    _draw_density(ax, data, 'hot', "Action density")
+    _inset_history(ax, data, 2, "|Polyakov loop| per sweep")
+    ax.set_title(f"Quark-Gluon Plasma: SU(2) at beta = {data['beta']:g}, Nt = {data['shape'][0]}")
+
+
+def report_27(data):
+    plaquette, polyakov = _equilibrium(data["history"])
+    phase = "deconfined (plasma)" if data["beta"] > SU2_CRITICAL_BETA_NT4 else "confined (hadronic)"
+    return [f"Average plaquette {plaquette:.4f}, |Polyakov loop| {polyakov:.4f}",
+            f"Expected phase: {phase}; the transition is at beta = {SU2_CRITICAL_BETA_NT4} for Nt = 4"] + _footer(data)
+
+
+def series_27(data):
+    return {"x": data["history"][:, 0], "plaquette": data["history"][:, 1], "polyakov": data["history"][:, 2]}
+
+
+def frames_36(rng, beta=2.3, sweeps=40):
+    yield from _frames(rng, "qcd", "SU2", (8, 8, 8, 8), beta, int(sweeps))
+
+
+def kernel_36(rng, beta=2.3, sweeps=40):
+    for data in frames_36(rng, beta, sweeps):
+        pass
+    return data
+
+
+def draw_36(ax, data):
+    _draw_density(ax, data, 'viridis', "Action density")
+    _inset_history(ax, data, 1, "Plaquette per sweep")
+    ax.set_title(f"SU(2) Yang-Mills Action Density, beta = {data['beta']:g}")
+
+
+def report_36(data):
+    plaquette, _ = _equilibrium(data["history"])
+    beta = data["beta"]
+    return [f"Average plaquette {plaquette:.4f} (strong coupling beta/4 = {beta / 4:.4f}, "
+            f"weak coupling 1 - 3/(4 beta) = {1 - 0.75 / beta:.4f})"] + _footer(data)
+
+
+def series_36(data):
+    return {"x": data["history"][:, 0], "plaquette": data["history"][:, 1]}
+
+
+def frames_62(rng, beta=2.0, sweeps=100):
+    yield from _frames(rng, "foam", "U1", (128, 128), beta, int(sweeps))
+
+
+def kernel_62(rng, beta=2.0, sweeps=100):
+    for data in frames_62(rng, beta, sweeps):
+        pass
+    return data
+
+
+def draw_62(ax, data):
+    _draw_density(ax, data, 'gray', "Action density")
+    ax.set_title(f"Quantum Foam: Compact U(1) Flux, beta = {data['beta']:g}")
+
+
+def report_62(data):
+    from scipy.special import i0e, i1e
+
+    plaquette, _ = _equilibrium(data["history"])
+    exact = i1e(data["beta"]) / i0e(data["beta"])
+    return [f"Average plaquette {plaquette:.4f} (exact in two dimensions I1/I0 = {exact:.4f})",
+            f"Metropolis acceptance {data['acceptance']:.0%}"] + _footer(data)
+
+
+def series_62(data):
+    return {"x": data["history"][:, 0], "plaquette": data["history"][:, 1]}
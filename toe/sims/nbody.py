@@ -0,0 +1,166 @@
+"""Gravitational N-body simulations backed by ``toe.engines.nbody``."""
+
+import numpy as np
+
+from toe.engines.nbody import (
+    BarnesHut, Leapfrog, ParticleMesh, Particles, SnapshotStream, cold_sphere, projection, rotation_curve,
+    shrinking_centre)
+from toe.paths import snapshot_path
+
+SNAPSHOT_EVERY = 20
+REDRAW = 20
+HALO_BOX = 4.0
+HALO_STEP = 0.025
+HALO_EXTENT = 1.5
+RADII = np.linspace(0.02, HALO_EXTENT, 60)
+BRANE_SEPARATION = 0.6
+BRANE_STEP = 0.02
+
+
+def _stream(name, particles, steps):
+    # None unless TOE_SNAPSHOT_DIR is set.
+    path = snapshot_path(f"nbody-{name}-{particles.count}-{steps}")
+    return SnapshotStream(path, particles, max(1, steps // SNAPSHOT_EVERY)) if path else None
+
+
+def _evolve(name, particles, solver, dt, steps, observe, trace=None):
+    # Yields observe(...) plus timings every REDRAW steps, calling trace(...) after every step and
+    # streaming snapshots as it goes when they are enabled.
+    integrator = Leapfrog(particles, solver, dt)
+    stream = _stream(name, particles, steps)
+    try:
+        for i in range(1, steps + 1):
+            integrator.step()
+            if trace is not None:
+                trace(particles, integrator)
+            if stream is not None and i % SNAPSHOT_EVERY == 0 and stream.written < len(stream.array):
+                stream.write(particles)
+            if i % REDRAW == 0 or i == steps:
+                data = observe(particles, integrator)
+                elapsed = integrator.force_time + integrator.integrate_time
+                data.update({"time": integrator.time, "done": i, "steps": steps, "count": particles.count,
+                             "force_time": integrator.force_time, "integrate_time": integrator.integrate_time,
+                             "rate": particles.count * i / elapsed if elapsed else 0.0,
+                             "snapshots": stream.written if stream else 0, "path": stream.path if stream else None})
+                yield data
+    finally:
+        if stream is not None:
+            stream.close()
+
+
+def _timing(data):
+    total = data["force_time"] + data["integrate_time"]
+    lines = [f"Forces {data['force_time']:.2f} s ({data['force_time'] / total:.0%}), "
+             f"integration {data['integrate_time']:.2f} s ({data['integrate_time'] / total:.0%}); "
+             f"{data['rate']:,.0f} particle steps per second"]
+    if data["path"]:
+        lines.append(f"{data['snapshots']} snapshots streamed to {data['path']}")
+    return lines
+
+
+def frames_8(rng, particles=100_000, cells=64, steps=120):
+    # Cold collapse of a slowly rotating uniform sphere into a virialized halo.
+    particles, cells, steps = int(particles), int(cells), int(steps)
+    body = cold_sphere(rng, particles, virial=0.1, spin=0.3)
+    mesh = ParticleMesh(cells, HALO_BOX)
+
+    def observe(p, integrator):
+        centre = shrinking_centre(p.positions, p.masses, HALO_EXTENT)
+        offset = p.positions - centre[:, None].astype(np.float32)
+        radius = np.sqrt(np.sum(offset**2, axis=0))
+        return {"density": projection(offset, p.masses, HALO_EXTENT, 200), "radii": RADII,
+                "circular": rotation_curve(offset, p.masses, np.zeros(3), RADII),
+                "half_mass": float(np.median(radius)), "cells": cells}
+
+    yield from _evolve("halo", body, mesh, HALO_STEP, steps, observe)
+
+
+def kernel_8(rng, particles=100_000, cells=64, steps=120):
+    for data in frames_8(rng, particles, cells, steps):
+        pass
+    return data
+
+
+def draw_8(ax, data):
+    density = np.log10(np.maximum(data["density"], data["density"][data["density"] > 0].min()))
+    image = ax.imshow(density.T, origin='lower', cmap='magma',
+                      extent=[-HALO_EXTENT, HALO_EXTENT, -HALO_EXTENT, HALO_EXTENT])
+    ax.figure.colorbar(image, ax=ax, label="log10 surface density")
+    ax.set_xlabel("x")
+    ax.set_ylabel("y")
+    ax.set_title(f"Dark Matter Halo from Cold Collapse, t = {data['time']:.2f}")
+    inset = ax.inset_axes([0.6, 0.1, 0.36, 0.28])
+    inset.plot(data["radii"], data["circular"], lw=1)
+    # Labels sit on the dark image.
+    inset.set_title("Rotation curve v_c(r)", fontsize=7, color='white')
+    inset.tick_params(labelsize=6, colors='white')
+
+
+def report_8(data):
+    peak = np.argmax(data["circular"])
+    return [f"{data['count']:,} particles on a {data['cells']}^3 mesh, step {data['done']} of {data['steps']}",
+            f"Peak circular velocity {data['circular'][peak]:.3f} at r = {data['radii'][peak]:.2f}; "
+            f"half-mass radius {data['half_mass']:.3f}"] + _timing(data)
+
+
+def series_8(data):
+    return {"x": data["radii"], "circular_velocity": data["circular"]}
+
+
+def _branes(rng, per_brane):
+    # Two rippled sheets of equal mass facing each other across z = 0, initially at rest.
+    x, y = rng.uniform(-1, 1, (2, 2 * per_brane))
+    side = np.repeat([1.0, -1.0], per_brane)
+    z = side * (BRANE_SEPARATION / 2 + 0.03 * np.sin(np.pi * x) * np.cos(np.pi * y))
+    return Particles(np.stack([x, y, z]), np.zeros((3, 2 * per_brane)), 1.0 / per_brane)
+
+
+def frames_51(rng, per_brane=1000, theta=0.6, steps=100):
+    per_brane, steps = int(per_brane), int(steps)
+    body = _branes(rng, per_brane)
+    tree = BarnesHut(theta=theta, softening=0.02)
+    times, separations = [], []
+
+    def trace(p, integrator):
+        times.append(integrator.time)
+        separations.append(float(p.positions[2, :per_brane].mean() - p.positions[2, per_brane:].mean()))
+
+    def observe(p, integrator):
+        return {"positions": p.positions[[0, 2]].copy(), "per_brane": per_brane, "theta": theta,
+                "times": np.array(times), "separations": np.array(separations),
+                "interactions": tree.interactions / p.count}
+
+    yield from _evolve("branes", body, tree, BRANE_STEP, steps, observe, trace)
+
+
+def kernel_51(rng, per_brane=1000, theta=0.6, steps=100):
+    for data in frames_51(rng, per_brane, theta, steps):
+        pass
+    return data
+
+
+def draw_51(ax, data):
+    n = data["per_brane"]
+    x, z = data["positions"]
+    ax.scatter(x[:n], z[:n], s=1, label="Brane 1")
+    ax.scatter(x[n:], z[n:], s=1, label="Brane 2")
+    ax.set_xlabel("x")
+    ax.set_ylabel("z (bulk direction)")
+    ax.legend(loc='upper left', markerscale=5)
+    ax.set_title(f"Colliding Branes under Self-Gravity, t = {data['time']:.2f}")
+    inset = ax.inset_axes([0.64, 0.7, 0.33, 0.26])
+    inset.plot(data["times"], data["separations"], lw=1)
+    inset.axhline(0, color='gray', lw=0.5)
+    inset.set_title("Separation", fontsize=7)
+    inset.tick_params(labelsize=6)
+
+
+def report_51(data):
+    return [f"{data['count']:,} particles in two branes, step {data['done']} of {data['steps']}",
+            f"Barnes-Hut opening angle {data['theta']:g}: {data['interactions']:.0f} interactions per particle "
+            f"per step instead of {data['count'] - 1:,}",
+            f"Brane separation {data['separations'][-1]:+.3f} (started at {BRANE_SEPARATION})"] + _timing(data)
+
+
+def series_51(data):
+    return {"x": data["times"], "separation": data["separations"]}
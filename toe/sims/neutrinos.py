@@ -0,0 +1,58 @@
+"""Neutrino oscillograms backed by ``toe.engines.neutrino``."""
+
+import time
+
+import numpy as np
+
+from toe.engines.neutrino import EARTH_DIAMETER, NUFIT, probabilities
+
+GRID = 1000
+LABELS = ("ν_e", "ν_μ", "ν_τ")
+# Reference experiments: (name, baseline in km, energy in GeV).
+EXPERIMENTS = (("T2K", 295.0, 0.6), ("NOvA", 810.0, 2.0), ("DUNE", 1300.0, 2.5))
+
+
+def kernel_73(rng, initial=1, final=0, density=3.0, delta=197.0, antineutrino=0):
+    initial, final, antineutrino = int(initial), int(final), bool(antineutrino)
+    params = NUFIT._replace(delta=float(delta))
+    energies = np.geomspace(0.2, 20.0, GRID)
+    baselines = np.linspace(10.0, EARTH_DIAMETER, GRID)
+    start = time.perf_counter()
+    grid = probabilities(energies, baselines, initial, params, density, antineutrino=antineutrino)
+    seconds = time.perf_counter() - start
+    column = np.searchsorted(baselines, EXPERIMENTS[-1][1])
+    points = [(name, probabilities([energy], [baseline], initial, params, density,
+                                   antineutrino=antineutrino)[final, 0, 0])
+              for name, baseline, energy in EXPERIMENTS]
+    return {"energies": energies, "baselines": baselines, "image": grid[final], "slice": grid[:, :, column],
+            "slice_baseline": baselines[column], "initial": initial, "final": final,
+            "antineutrino": antineutrino, "seconds": seconds, "points": points,
+            "unitarity": float(np.abs(grid.sum(axis=0) - 1).max())}
+
+
+def _label(data, flavour):
+    return LABELS[flavour].replace("ν", "anti-ν") if data["antineutrino"] else LABELS[flavour]
+
+
+def draw_73(ax, data):
+    energies, baselines = data["energies"], data["baselines"]
+    image = ax.imshow(data["image"], origin='lower', aspect='auto', cmap='magma', vmin=0, vmax=1,
+                      extent=[baselines[0], baselines[-1], np.log10(energies[0]), np.log10(energies[-1])])
+    ax.figure.colorbar(image, ax=ax, label="Probability")
+    ax.set_xlabel("Baseline (km)")
+    ax.set_ylabel("log10 Energy (GeV)")
+    ax.set_title(f"P({_label(data, data['initial'])} → {_label(data, data['final'])}) Oscillogram")
+
+
+def report_73(data):
+    lines = [f"{data['image'].size:,} grid points in {data['seconds'] * 1000:.0f} ms "
+             f"(max unitarity error {data['unitarity']:.1e})"]
+    lines += [f"{name}: P = {p:.4f}" for name, p in data["points"]]
+    return lines
+
+
+def series_73(data):
+    columns = {"x": data["energies"]}
+    for flavour, probability in enumerate(data["slice"]):
+        columns[f"P(→{_label(data, flavour)}) at {data['slice_baseline']:.0f} km"] = probability
+    return columns
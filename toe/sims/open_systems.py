@@ -0,0 +1,108 @@
+"""Closed and open quantum dynamics backed by ``toe.engines.open_systems``."""
+
+import numpy as np
+from matplotlib.colors import LogNorm
+from scipy import sparse
+
+from toe.engines.open_systems import EvolutionTask, evolve_many, evolve_mixed, evolve_pure
+
+SIGMA_X = np.array([[0, 1], [1, 0]], dtype=complex)
+SIGMA_Y = np.array([[0, -1j], [1j, 0]])
+SIGMA_Z = np.diag([1.0, -1.0]).astype(complex)
+# Measurement rates swept for the Zeno response curve.
+ZENO_RATES = np.logspace(-1, 3, 33)
+
+
+def _bloch(hamiltonian, collapse, rho0, t):
+    return evolve_mixed(hamiltonian, collapse, rho0, t, [SIGMA_X, SIGMA_Y, SIGMA_Z])
+
+
+def kernel_16(rng, gamma=5.0, omega=0.0):
+    # A qubit prepared in |+>, optionally driven about y, dephasing at rate gamma.
+    t = np.linspace(0, 2, 200)
+    x, y, z = _bloch(omega / 2 * SIGMA_Y, [np.sqrt(gamma / 2) * SIGMA_Z], np.full((2, 2), 0.5), t)
+    return {"t": t, "coherence": np.hypot(x, y), "excited": (1 - z) / 2, "purity": (1 + x**2 + y**2 + z**2) / 2}
+
+
+def draw_16(ax, data):
+    ax.plot(data["t"], data["coherence"], label='Coherence 2|rho_01|')
+    ax.plot(data["t"], data["excited"], label='Excited population')
+    ax.plot(data["t"], data["purity"], label='Purity')
+    ax.set_xlabel("t")
+    ax.legend()
+    ax.set_title("Quantum Decoherence Over Time")
+
+
+def series_16(data):
+    return {"x": data["t"], "coherence": data["coherence"], "excited": data["excited"], "purity": data["purity"]}
+
+
+def _zeno_task(rate, t):
+    # Rabi oscillation at one cycle per unit time, watched by a continuous z measurement.
+    return EvolutionTask(np.pi * SIGMA_X, [np.sqrt(rate / 2) * SIGMA_Z], np.diag([1.0, 0.0]), t, [SIGMA_Z])
+
+
+def kernel_30(rng, rate=20.0):
+    t = np.linspace(0, 2, 200)
+    watched, free = evolve_many([_zeno_task(rate, t), _zeno_task(0.0, t)])
+    final = evolve_many([_zeno_task(r, t[[0, -1]]) for r in ZENO_RATES])
+    return {
+        "t": t, "survival": (1 + watched[0]) / 2, "unwatched": (1 + free[0]) / 2, "rate": rate,
+        "rates": ZENO_RATES, "final": np.array([(1 + z[0, -1]) / 2 for z in final]),
+    }
+
+
+def draw_30(ax, data):
+    ax.plot(data["t"], data["survival"], label=f"Measured at rate {data['rate']:g}")
+    ax.plot(data["t"], data["unwatched"], '--', label="Unmeasured")
+    ax.set_xlabel("t")
+    ax.set_ylabel("Survival probability")
+    ax.legend(loc='lower left')
+    inset = ax.inset_axes([0.62, 0.12, 0.35, 0.3])
+    inset.semilogx(data["rates"], data["final"])
+    inset.set_title(f"P(t={data['t'][-1]:g}) vs rate", fontsize=7)
+    inset.tick_params(labelsize=6)
+    ax.set_title("Quantum Zeno Effect: Survival Probability")
+
+
+def report_30(data):
+    rate, omega = data["rate"], 2 * np.pi
+    if rate <= 2 * omega:
+        return ["Measurements are too rare to freeze the Rabi oscillation."]
+    return [f"Zeno regime: <sigma_z> decays at about Omega^2/rate = {omega**2 / rate:.3g} per unit time"]
+
+
+def series_30(data):
+    return {"x": data["t"], "survival": data["survival"], "unwatched": data["unwatched"]}
+
+
+def kernel_67(rng, sites=400, disorder=0.0):
+    # A particle hopping on a chain with random on-site energies, started on the middle site.
+    sites = int(sites)
+    energies = disorder * (rng.random(sites) - 0.5)
+    hopping = -np.ones(sites - 1)
+    hamiltonian = sparse.diags([hopping, energies, hopping], [-1, 0, 1], format='csr')
+    psi0 = np.zeros(sites)
+    psi0[sites // 2] = 1
+    t = np.linspace(0, sites / 4, 200)
+    states, _ = evolve_pure(hamiltonian, psi0, t)
+    density = (np.abs(states)**2).astype(np.float32)
+    return {"t": t, "psi": states[:, sites // 2], "density": density}
+
+
+def draw_67(ax, data):
+    sites = data["density"].shape[1]
+    ax.imshow(data["density"], aspect='auto', origin='lower', cmap='inferno', norm=LogNorm(1e-5, 1),
+              extent=(-(sites // 2), sites - sites // 2, data["t"][0], data["t"][-1]))
+    ax.set_xlabel("Site")
+    ax.set_ylabel("t")
+    ax.set_title("Quantum Hamiltonian Evolution")
+
+
+def report_67(data):
+    final = data["density"][-1].astype(np.float64)
+    return [f"Participation ratio at t={data['t'][-1]:g}: {1 / (final**2).sum():.1f} sites"]
+
+
+def series_67(data):
+    return {"x": data["t"], "Real Part": data["psi"].real, "Imaginary Part": data["psi"].imag}
@@ -0,0 +1,115 @@
+"""Particle Physics and Quantum Field Theory simulations."""
+
+import numpy as np
+
+from toe.expressions import CurveSpec
+
+
+def kernel_10(rng):
+    x = np.linspace(0, 10, 1000)
+    y = rng.normal(size=1000)
+    return {"x": x, "y": y}
+
+
+def draw_10(ax, data):
+    ax.plot(data["x"], data["y"])
+    ax.set_title("Quantum Field Fluctuations")
+
+
+def series_10(data):
+    return {"x": data["x"], "y": data["y"]}
+
+
+def kernel_12(rng):
+    particles = ['Squark', 'Slepton', 'Gluino', 'Neutralino']
+    return {"discovered_particle": rng.choice(particles)}
+
+
+def report_12(data):
+    return [f"Discovered Supersymmetry Particle: {data['discovered_particle']}"]
+
+
+def kernel_21(rng):
+    t = np.linspace(0, 10, 1000)
+    fluctuations = np.sin(t) + rng.normal(scale=0.1, size=1000)
+    return {"t": t, "fluctuations": fluctuations}
+
+
+def draw_21(ax, data):
+    ax.plot(data["t"], data["fluctuations"])
+    ax.set_title("Virtual Particles Fluctuations")
+
+
+def series_21(data):
+    return {"x": data["t"], "fluctuations": data["fluctuations"]}
+
+
+def kernel_38(rng):
+    qed = rng.normal(size=1000)
+    return {"qed": qed}
+
+
+def draw_38(ax, data):
+    ax.hist(data["qed"], bins=30)
+    ax.set_title("Quantum Electrodynamics")
+
+
+def kernel_42(rng, v=2.0):
+    x = np.linspace(0, 10, 1000)
+    radiation = np.sin(np.multiply.outer(v, x))
+    return {"x": x, "radiation": radiation}
+
+
+def draw_42(ax, data):
+    ax.plot(data["x"], data["radiation"])
+    ax.set_title("Cerenkov Radiation")
+
+
+def series_42(data):
+    return {"x": data["x"], "radiation": data["radiation"]}
+
+
+def kernel_43(rng):
+    x = np.linspace(0, 10, 1000)
+    vacuum_energy = rng.normal(size=1000)
+    return {"x": x, "vacuum_energy": vacuum_energy}
+
+
+def draw_43(ax, data):
+    ax.plot(data["x"], data["vacuum_energy"])
+    ax.set_title("Quantum Vacuum Energy Fluctuations")
+
+
+def series_43(data):
+    return {"x": data["x"], "vacuum_energy": data["vacuum_energy"]}
+
+
+def kernel_53(rng):
+    theta = np.linspace(0, 2*np.pi, 1000)
+    r = np.abs(np.sin(3*theta))
+    return {"theta": theta, "r": r}
+
+
+def draw_53(ax, data):
+    ax.plot(data["theta"], data["r"])
+    ax.set_title("Magnetic Monopole Field")
+
+
+def kernel_64(rng):
+    theta = np.linspace(0, 2*np.pi, 1000)
+    jet = np.abs(np.sin(3*theta))
+    return {"theta": theta, "jet": jet}
+
+
+def draw_64(ax, data):
+    ax.plot(data["theta"], data["jet"])
+    ax.set_title("Quantum Chromodynamic Jets")
+
+
+SPECS = {
+    22: CurveSpec("1/d**4", "d", (0.1, 10), 100, "Casimir Effect: Force vs. Distance"),
+    39: CurveSpec("x**2 - 10*x + 25", "x", (0, 10), 100, "Gauge Symmetry Breaking Potential"),
+    45: CurveSpec("x**4 - x**2", "x", (-2, 2), 100, "Symmetry Breaking Potential"),
+    65: CurveSpec("B**2", "B", (0, 10), 100, "Chiral Anomaly"),
+    77: CurveSpec("x**4 - 2*x**2", "x", (-2, 2), 100, "Higgs Field Interaction Potential"),
+}
@@ -0,0 +1,61 @@
+"""Quantum key distribution backed by ``toe.engines.qkd``."""
+
+import time
+
+import numpy as np
+
+from toe.engines.qkd import bb84, secret_fraction
+
+
+def _run(rng, photons, noise, eavesdrop):
+    start = time.perf_counter()
+    result = bb84(rng, int(photons), noise, eavesdrop)
+    return result, time.perf_counter() - start
+
+
+def kernel_28(rng, photons=1_000_000, noise=0.02):
+    result, seconds = _run(rng, photons, noise, 0.0)
+    return {"key": result.key[:16].tobytes().hex(), "key_bits": result.key_bits,
+            "qber": result.qber, "seconds": seconds, "photons": result.photons}
+
+
+def report_28(data):
+    if not data["key_bits"]:
+        return [f"No secure key: QBER {data['qber']:.2%} is too high"]
+    return [f"Generated Quantum Key: {data['key']}...",
+            f"{data['key_bits']:,} secret bits from {data['photons']:,} photons (QBER {data['qber']:.2%})",
+            f"{data['key_bits'] / data['seconds']:,.0f} key bits per second"]
+
+
+def kernel_47(rng, photons=2_000_000, noise=0.02, eavesdrop=0.0):
+    result, seconds = _run(rng, photons, noise, eavesdrop)
+    return {"photons": result.photons, "sifted": result.sifted, "sampled": result.sampled,
+            "qber": result.qber, "true_qber": result.true_qber, "chunk_qber": result.chunk_qber,
+            "fraction": result.secret_fraction, "key_bits": result.key_bits,
+            "key": result.key[:8].tobytes().hex(), "seconds": seconds,
+            "expected": noise + eavesdrop / 4 - noise * eavesdrop / 2}
+
+
+def draw_47(ax, data):
+    q = np.linspace(0, 0.15, 300)
+    ax.plot(q, secret_fraction(q), label="Secret bits per sifted bit")
+    ax.axvline(data["expected"], color='gray', linestyle='--', label="Expected QBER")
+    ax.scatter(data["chunk_qber"], secret_fraction(data["chunk_qber"]), s=12, color='red',
+               label="Chunk estimates", zorder=3)
+    ax.set_xlim(0, max(0.15, data["qber"] * 1.1))
+    ax.set_xlabel("Quantum bit error rate")
+    ax.set_ylabel("Secret key fraction")
+    ax.legend()
+    ax.set_title("BB84 Key Rate versus QBER")
+
+
+def report_47(data):
+    lines = [f"Photons sent: {data['photons']:,}; sifted: {data['sifted']:,}; announced for QBER: {data['sampled']:,}",
+             f"Estimated QBER: {data['qber']:.3%} (key bits {data['true_qber']:.3%}, expected {data['expected']:.3%})"]
+    if data["key_bits"]:
+        lines += [f"Quantum Key: {data['key']}... ({data['key_bits']:,} bits after privacy amplification)",
+                  f"{data['photons'] / data['seconds']:,.0f} photons and "
+                  f"{data['key_bits'] / data['seconds']:,.0f} key bits per second"]
+    else:
+        lines.append("Eavesdropping detected: no secure key can be distilled, the key is discarded")
+    return lines
@@ -0,0 +1,7 @@
+"""Quantum Information simulations."""
+
+from toe.expressions import CurveSpec
+
+SPECS = {
+    49: CurveSpec("exp(-t)", "t", (0, 10), 100, "Quantum Annealing Process"),
+}
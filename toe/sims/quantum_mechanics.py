@@ -0,0 +1,86 @@
+"""Quantum Mechanics simulations."""
+
+import numpy as np
+
+from toe.expressions import CurveSpec
+
+
+def kernel_14(rng, E=5.0):
+    # Rectangular barrier of height V and width a, in units where hbar**2 / 2m = 1.
+    V = 7.0
+    a = 1.0
+    E = np.asarray(E, dtype=float)
+    ka = np.sqrt(np.abs(V - E)) * a
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(E < V, np.sinh(ka)**2, np.sin(ka)**2)
+        transmission = 1 / (1 + V**2 * s / (4 * E * np.abs(V - E)))
+    transmission = np.where(E == V, 1 / (1 + V * a**2 / 4), transmission)
+    return {"E": E, "V": V, "tunnels": E > V, "transmission": transmission}
+
+
+def report_14(data):
+    if data["tunnels"]:
+        lines = ["Particle Tunnels Through the Barrier"]
+    else:
+        lines = ["Particle Reflects Back"]
+    return lines + [f"Transmission Probability: {float(data['transmission']):.4g}"]
+
+
+def kernel_25(rng):
+    x = np.linspace(-5, 5, 1000)
+    I = np.sin(x)**2
+    return {"x": x, "I": I}
+
+
+def draw_25(ax, data):
+    ax.plot(data["x"], data["I"])
+    ax.set_title("Interference Pattern in Double-Slit Experiment")
+
+
+def series_25(data):
+    return {"x": data["x"], "I": data["I"]}
+
+
+def kernel_40(rng):
+    return {"state": rng.choice(['Superposition', 'Entanglement', 'Collapse'])}
+
+
+def report_40(data):
+    return [f"Quantum Consciousness State: {data['state']}"]
+
+
+def kernel_41(rng):
+    x = np.linspace(-10, 10, 1000)
+    k = rng.uniform(1, 10)
+    wave_packet = np.exp(-(x**2)) * np.cos(k*x)
+    return {"x": x, "wave_packet": wave_packet}
+
+
+def draw_41(ax, data):
+    ax.plot(data["x"], data["wave_packet"])
+    ax.set_title("Quantum Wave Packet")
+
+
+def series_41(data):
+    return {"x": data["x"], "wave_packet": data["wave_packet"]}
+
+
+def kernel_60(rng):
+    x = np.linspace(-5, 5, 1000)
+    interference = np.sin(x)**2
+    return {"x": x, "interference": interference}
+
+
+def draw_60(ax, data):
+    ax.plot(data["x"], data["interference"])
+    ax.set_title("Quantum Eraser Interference Pattern")
+
+
+def series_60(data):
+    return {"x": data["x"], "interference": data["interference"]}
+
+
+SPECS = {
+    69: CurveSpec("sin(t**2)", "t", (0, 10), 1000, "Quantum Chaos"),
+    76: CurveSpec("sin(x**2)", "x", (-5, 5), 1000, "Quantum Carpets"),
+}
@@ -0,0 +1,86 @@
+"""Random-walk ensembles and quantum walks backed by ``toe.engines.walks``."""
+
+import numpy as np
+
+from toe.engines.walks import CHUNK_WALKERS, WORD_BITS, ensemble_walk, hadamard_walk
+
+
+def _progress(stats):
+    # Redraw after 1, 2, 4, ... chunks so large ensembles do not spend their time rendering.
+    for stats in stats:
+        chunks = -(-stats.walkers // CHUNK_WALKERS)
+        yield stats, chunks & (chunks - 1) == 0
+
+
+def frames_48(rng, walkers=100_000, steps=1024):
+    walkers, steps = int(walkers), int(steps)
+    quantum = hadamard_walk(steps, stride=WORD_BITS)
+    sites = quantum.positions[::2]
+    classical = ensemble_walk(rng, walkers, steps, radius=steps)
+    for stats, redraw in _progress(classical):
+        if redraw or stats.walkers == walkers:
+            yield {"sites": sites, "classical": stats.occupation, "quantum": quantum.probability[::2],
+                   "times": stats.times, "classical_msd": stats.msd, "quantum_times": quantum.times,
+                   "quantum_msd": quantum.msd, "walkers": stats.walkers, "steps": steps}
+
+
+def kernel_48(rng, walkers=100_000, steps=1024):
+    for data in frames_48(rng, walkers, steps):
+        pass
+    return data
+
+
+def draw_48(ax, data):
+    ax.plot(data["sites"], data["classical"], label=f"Classical ({data['walkers']:,} walkers)")
+    ax.plot(data["sites"], data["quantum"], label="Hadamard quantum walk")
+    ax.set_xlabel("Position")
+    ax.set_ylabel("Probability")
+    ax.legend(loc='upper left', fontsize=8)
+    inset = ax.inset_axes([0.68, 0.55, 0.3, 0.4])
+    inset.loglog(data["times"], data["classical_msd"])
+    inset.loglog(data["quantum_times"], data["quantum_msd"])
+    inset.set_title("<x²> vs t", fontsize=8)
+    inset.tick_params(labelsize=6)
+    ax.set_title(f"Quantum Random Walk after {data['steps']} steps")
+
+
+def report_48(data):
+    t = data["times"][-1]
+    return [f"Classical <x²>/t = {data['classical_msd'][-1] / t:.3f} (diffusive)",
+            f"Quantum <x²>/t² = {data['quantum_msd'][-1] / data['quantum_times'][-1]**2:.3f} (ballistic)"]
+
+
+def series_48(data):
+    return {"x": data["sites"], "classical": data["classical"], "quantum": data["quantum"]}
+
+
+def frames_68(rng, walkers=100_000, steps=1024):
+    walkers, steps = int(walkers), int(steps)
+    for stats, redraw in _progress(ensemble_walk(rng, walkers, steps, dim=2)):
+        if redraw or stats.walkers == walkers:
+            yield {"occupation": stats.occupation, "sites": stats.sites, "times": stats.times,
+                   "msd": stats.msd, "walkers": stats.walkers}
+
+
+def kernel_68(rng, walkers=100_000, steps=1024):
+    for data in frames_68(rng, walkers, steps):
+        pass
+    return data
+
+
+def draw_68(ax, data):
+    low, high = data["sites"][0] - 1, data["sites"][-1] + 1
+    ax.imshow(data["occupation"].T, origin='lower', cmap='magma', extent=(low, high, low, high))
+    angle = np.linspace(0, 2 * np.pi, 200)
+    radius = np.sqrt(data["msd"][-1])
+    ax.plot(radius * np.cos(angle), radius * np.sin(angle), 'c--', lw=1)
+    ax.set_title(f"Quantum Molecular Dynamics: {data['walkers']:,} molecules")
+
+
+def report_68(data):
+    t = data["times"][-1]
+    return [f"Mean squared displacement after {t} steps: {data['msd'][-1]:.1f} (diffusion predicts {2 * t})"]
+
+
+def series_68(data):
+    return {"x": data["times"], "msd": data["msd"]}
@@ -0,0 +1,73 @@
+"""Relativity and Gravity simulations."""
+
+import numpy as np
+
+from toe.expressions import CurveSpec
+
+
+def kernel_2(rng, v=0.5):
+    gamma = 1 / np.sqrt(1 - v**2)
+    return {"gamma": gamma, "v": v}
+
+
+def report_2(data):
+    return [f"Gamma Factor: {data['gamma']}"]
+
+
+def draw_2(ax, data):
+    ax.plot([0, 1], [0, data["gamma"]], label=f'v={data["v"]}c')
+    ax.set_title("Relativistic Time Dilation")
+    ax.set_xlabel("Proper Time")
+    ax.set_ylabel("Dilated Time")
+    ax.legend()
+
+
+def kernel_33(rng):
+    theta = np.linspace(0, 2*np.pi, 1000)
+    r = 1 + 0.3 * np.sin(3*theta)
+    return {"theta": theta, "r": r}
+
+
+def draw_33(ax, data):
+    ax.plot(data["theta"], data["r"])
+    ax.set_title("Wormhole Visualization")
+
+
+def kernel_44(rng):
+    lengths = np.logspace(-35, -33, 100)
+    forces = 1 / (lengths**2)
+    return {"lengths": lengths, "forces": forces}
+
+
+def draw_44(ax, data):
+    ax.plot(data["lengths"], data["forces"])
+    ax.set_title("Planck Scale Physics")
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel("Length (m)")
+    ax.set_ylabel("Force (N)")
+
+
+def kernel_52(rng):
+    r = np.linspace(1, 10, 1000)
+    ergosphere = r * np.sin(r)
+    return {"r": r, "ergosphere": ergosphere}
+
+
+def draw_52(ax, data):
+    ax.plot(data["r"], data["ergosphere"])
+    ax.set_title("Kerr Black Hole Ergosphere")
+
+
+def series_52(data):
+    return {"x": data["r"], "ergosphere": data["ergosphere"]}
+
+
+SPECS = {
+    4: CurveSpec("1/r**2", "r", (1, 10), 1000, "Gravitational Force Near a Black Hole"),
+    17: CurveSpec("T**2", "T", (1, 10), 100, "Entropic Gravity: Entropy vs. Temperature"),
+    34: CurveSpec("-1/r**2", "r", (1, 10), 1000, "Gravitational Repulsion Near a White Hole"),
+    37: CurveSpec("sin(k*x)", "x", (0, "2*pi"), 1000, "Gravitons in Quantum Gravity", params=(("k", 10),)),
+    54: CurveSpec("1/r**2", "r", (1, 10), 1000, "Hawking Radiation Intensity"),
+    75: CurveSpec("sin(2*theta)", "theta", (0, "2*pi"), 1000, "Sagnac Effect", plot="polar"),
+}
@@ -0,0 +1,48 @@
+"""Wave-function dynamics backed by ``toe.engines.schrodinger``."""
+
+import numpy as np
+
+from toe.engines.schrodinger import SplitStepSolver, box_eigenstate, box_potential, grid
+
+BOX_POINTS = 1024
+BOX_FRAMES = 61
+STEPS_PER_PERIOD = 20000
+
+
+def frames_1(rng, periods=1.0):
+    # Units hbar = m = 1 and a box of width 1 embedded in a wider periodic grid.
+    n = int(rng.integers(1, 6))
+    (x,), dx = grid(BOX_POINTS, -0.25, 1.25)
+    psi0 = (box_eigenstate(x, n, 0, 1) + box_eigenstate(x, n + 1, 0, 1)) / np.sqrt(2)
+    beat = np.pi**2 * (2 * n + 1) / 2
+    steps = int(round(periods * STEPS_PER_PERIOD))
+    stride = max(1, steps // (BOX_FRAMES - 1))
+    solver = SplitStepSolver(psi0, box_potential((x,), 0, 1), dx, 2 * np.pi / beat / STEPS_PER_PERIOD)
+
+    inside = (x >= 0) & (x <= 1)
+    density = np.empty((BOX_FRAMES, inside.sum()))
+    times = np.empty(BOX_FRAMES)
+    for i, frame in enumerate(solver.frames(stride, BOX_FRAMES)):
+        density[i] = np.abs(frame.psi[inside])**2
+        times[i] = frame.time * beat / (2 * np.pi)
+        if i % 15 == 0 or i == BOX_FRAMES - 1:
+            yield {"x": x[inside], "t": times[:i + 1].copy(), "density": density[:i + 1].copy(), "n": n}
+
+
+def kernel_1(rng, periods=1.0):
+    for data in frames_1(rng, periods):
+        pass
+    return data
+
+
+def draw_1(ax, data):
+    x, t = data["x"], data["t"]
+    ax.imshow(data["density"], aspect='auto', origin='lower', cmap='viridis',
+              extent=(x[0], x[-1], t[0], t[-1] if len(t) > 1 else 1))
+    ax.set_xlabel("Position in box")
+    ax.set_ylabel("Time (beat periods)")
+    ax.set_title("Quantum Particle in a Box (n={} + {})".format(data["n"], data["n"] + 1))
+
+
+def series_1(data):
+    return {"x": data["x"], "density": data["density"][-1]}
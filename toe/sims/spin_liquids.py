@@ -0,0 +1,107 @@
+"""Quantum spin liquids backed by ``toe.engines.exact_diagonalization``."""
+
+import functools
+import time
+
+import numpy as np
+
+from toe.engines.exact_diagonalization import (
+    basis, chain, ground_manifold, ground_states, hamiltonian, honeycomb, spin_correlations)
+
+# Ground-state energy per site of the infinite Heisenberg chain, 1/4 - ln 2.
+BETHE_ENERGY = 0.25 - np.log(2)
+KITAEV_CELLS = (3, 2)
+
+
+def _distances(sites, bonds, origin=0):
+    # Graph distance of every site from ``origin``, by breadth-first search over the bonds.
+    distance = np.full(sites, -1)
+    distance[origin] = 0
+    frontier = [origin]
+    while frontier:
+        following = []
+        for bond in bonds:
+            for a, b in ((bond.i, bond.j), (bond.j, bond.i)):
+                if a in frontier and distance[b] < 0:
+                    distance[b] = distance[a] + 1
+                    following.append(b)
+        frontier = following
+    return distance
+
+
+@functools.lru_cache(maxsize=1)
+def _kitaev():
+    bonds = honeycomb(*KITAEV_CELLS)
+    sites = 2 * KITAEV_CELLS[0] * KITAEV_CELLS[1]
+    levels = [ground_manifold(hamiltonian("kitaev", sites, bonds, parity=parity)) + (parity,) for parity in (0, 1)]
+    energy = min(level[0] for level in levels)
+    # Average over every parity sector that shares the lowest level.
+    ground = [level for level in levels if level[0] - energy <= 1e-8 * abs(energy)]
+    degeneracy = sum(vectors.shape[1] for _, vectors, _ in ground)
+    pairs = [(0, j) for j in range(sites)]
+    correlation = sum(vectors.shape[1] * spin_correlations(basis(sites, None, parity), vectors, pairs)
+                      for _, vectors, parity in ground) / degeneracy
+    distance = _distances(sites, bonds)
+    reach = np.arange(distance.max() + 1)
+    return {"kitaev_sites": sites, "kitaev_energy": energy / sites, "kitaev_degeneracy": degeneracy,
+            "kitaev_distance": reach,
+            "kitaev_correlation": np.array([correlation[distance == d].mean() for d in reach]),
+            "kitaev_beyond": float(np.abs(correlation[distance > 1]).max())}
+
+
+def kernel_59(rng, sites=20, anisotropy=1.0):
+    sites = int(sites)
+    half = sites // 2
+    # The chain's ground state has momentum 0 when N/2 is even and pi when it is odd.
+    momentum = 0 if half % 2 == 0 else half
+    bonds = chain(sites)
+    start = time.perf_counter()
+    ground_h = hamiltonian("heisenberg", sites, bonds, half, None, momentum, 1.0, anisotropy)
+    triplet_h = hamiltonian("heisenberg", sites, bonds, half + 1, None, (momentum + half) % sites, 1.0, anisotropy)
+    built = time.perf_counter()
+    energy, vectors = ground_manifold(ground_h)
+    triplet = ground_states(triplet_h)[0][0]
+    solved = time.perf_counter()
+    distances = np.arange(half + 1)
+    correlation = spin_correlations(basis(sites, half, None, momentum), vectors, [(0, r) for r in distances])
+    data = {"distance": distances, "correlation": correlation, "sites": sites, "anisotropy": anisotropy,
+            "momentum": momentum, "dimension": ground_h.shape[0], "energy": energy / sites, "gap": triplet - energy,
+            "build": built - start, "solve": solved - built, "cached": hamiltonian.cache_info().currsize}
+    data.update(_kitaev())
+    return data
+
+
+def draw_59(ax, data):
+    ax.plot(data["distance"], data["correlation"], 'o-', label=f"Heisenberg chain, N = {data['sites']}")
+    ax.plot(data["kitaev_distance"], data["kitaev_correlation"], 's--',
+            label=f"Kitaev honeycomb, {data['kitaev_sites']} sites")
+    ax.axhline(0, color='gray', lw=0.5)
+    ax.set_xlabel("Distance r (bonds)")
+    ax.set_ylabel("<S_0 . S_r>")
+    ax.legend(loc='lower right')
+    ax.set_title("Quantum Spin Liquid Correlation Functions")
+    inset = ax.inset_axes([0.58, 0.62, 0.38, 0.33])
+    r = data["distance"][1:]
+    inset.loglog(r, np.abs(data["correlation"][1:]), 'o', ms=3)
+    inset.loglog(r, np.abs(data["correlation"][1]) / r, 'k--', lw=1)
+    inset.set_title("|chain correlation| and 1/r", fontsize=7)
+    inset.tick_params(labelsize=6)
+
+
+def report_59(data):
+    sites, momentum = data["sites"], "0" if data["momentum"] == 0 else "pi"
+    energy = f"Ground-state energy per site {data['energy']:.6f}"
+    if data["anisotropy"] == 1:
+        energy += f" (Bethe ansatz, infinite chain: {BETHE_ENERGY:.6f})"
+    return [f"Chain sector S^z = 0, k = {momentum}: {data['dimension']:,} of {2**sites:,} states",
+            energy,
+            f"Gap to the lowest S^z = 1 state: {data['gap']:.4f}",
+            f"Kitaev honeycomb, {data['kitaev_sites']} sites: energy per site {data['kitaev_energy']:.6f}, "
+            f"{data['kitaev_degeneracy']}-fold degenerate; correlations beyond neighbours at most "
+            f"{data['kitaev_beyond']:.1e}",
+            f"Hamiltonians built in {data['build']:.2f} s and diagonalized in {data['solve']:.2f} s; "
+            f"{data['cached']} cached"]
+
+
+def series_59(data):
+    return {"x": data["distance"], "correlation": data["correlation"]}
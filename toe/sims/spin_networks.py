@@ -0,0 +1,48 @@
+"""Spin-network simulations backed by ``toe.engines.spin_network``."""
+
+import numpy as np
+from matplotlib.collections import LineCollection
+
+from toe.engines.spin_network import degree_distribution, return_probability, spectral_dimension, spin_network
+
+# Random-walk steps used to estimate the spectral dimension.
+WALK_STEPS = 100
+
+
+def kernel_13(rng, nodes=2000, degree=10):
+    graph_seed = int(rng.integers(2**32))
+    network = spin_network(graph_seed, int(nodes), float(degree))
+    sigma, dimension = spectral_dimension(return_probability(network.adjacency, rng, steps=WALK_STEPS))
+    return {
+        "positions": network.positions,
+        "edges": network.edges,
+        "spins": network.spins,
+        "degree_distribution": degree_distribution(network.adjacency),
+        "sigma": sigma,
+        "spectral_dimension": dimension,
+    }
+
+
+def draw_13(ax, data):
+    positions = data["positions"]
+    lines = LineCollection(positions[data["edges"]], array=data["spins"], cmap='viridis',
+                           linewidths=0.5, alpha=0.6)
+    ax.add_collection(lines)
+    ax.figure.colorbar(lines, ax=ax, label="Spin j")
+    if len(positions) <= 5000:
+        ax.scatter(positions[:, 0], positions[:, 1], s=2, c='k')
+    ax.autoscale_view()
+    ax.set_axis_off()
+    ax.set_title("Spin Networks in Loop Quantum Gravity")
+
+
+def report_13(data):
+    distribution = data["degree_distribution"]
+    mean_degree = np.arange(len(distribution)) @ distribution
+    dimension = data["spectral_dimension"]
+    return [f"{len(data['positions'])} nodes, {len(data['edges'])} edges, mean degree {mean_degree:.2f}",
+            f"Spectral dimension: {np.median(dimension[len(dimension) // 4:]):.2f}"]
+
+
+def series_13(data):
+    return {"x": data["sigma"], "spectral_dimension": data["spectral_dimension"]}
@@ -0,0 +1,43 @@
+"""String Theory and Beyond simulations."""
+
+import numpy as np
+
+from toe.expressions import CurveSpec
+
+
+def kernel_19(rng):
+    theta = np.linspace(0, 2*np.pi, 1000)
+    r = 1 + 0.5 * np.sin(5*theta)
+    return {"theta": theta, "r": r}
+
+
+def draw_19(ax, data):
+    ax.plot(data["theta"], data["r"])
+    ax.set_title("Noncommutative Geometry Visualization")
+
+
+def kernel_23(rng):
+    branes = ['D1', 'D3', 'D5', 'M2', 'M5']
+    return {"selected_brane": rng.choice(branes)}
+
+
+def report_23(data):
+    return [f"Selected Brane: {data['selected_brane']}"]
+
+
+def kernel_50(rng):
+    theta = np.linspace(0, 2*np.pi, 1000)
+    r = np.abs(np.sin(5*theta))
+    return {"theta": theta, "r": r}
+
+
+def draw_50(ax, data):
+    ax.plot(data["theta"], data["r"])
+    ax.set_title("AdS Space Representation")
+
+
+SPECS = {
+    3: CurveSpec("sin(5*x) + sin(7*x)", "x", (0, "2*pi"), 1000, "String Vibrations"),
+    7: CurveSpec("sinc(pi*x)", "x", (-5, 5), 1000, "Holographic Principle Representation"),
+    35: CurveSpec("sin(x) + cos(x)", "x", (0, 10), 1000, "Extra Dimensions in Kaluza-Klein Theory"),
+}
@@ -0,0 +1,81 @@
+"""Vectorized parameter sweeps over slider-driven simulations.
+
+A sweep calls a simulation's kernel once with every slider parameter replaced
+by an array of values, laid out as an open grid with ``np.ix_`` so that the
+kernel's own NumPy broadcasting produces the whole response surface with no
+Python loop over points. Kernels opt in by being written to broadcast (see
+``SimulationInfo.sweep``). Each output is returned with the grid axes first
+and the per-point shape after, e.g. ``(P, 1000)`` for a 1000-sample curve
+swept over ``P`` values.
+"""
+
+import io
+from collections import namedtuple
+
+import numpy as np
+
+from toe.registry import default_params
+from toe.rng import simulation_rng
+
+Sweep = namedtuple("Sweep", ["number", "params", "outputs"])
+
+
+def param_values(param, points=None):
+    """Grid of values for ``param``: every slider position, or ``points`` evenly spaced values."""
+    if points is None:
+        return np.round(np.arange(param.min, param.max + param.step / 2, param.step), 10)
+    return np.linspace(param.min, param.max, points)
+
+
+def sweep(sim, seed=0, **values):
+    """Evaluate ``sim`` over the outer product of the given parameter arrays.
+
+    Parameters not given are swept over every slider position.
+    """
+    rng = simulation_rng(seed, sim.number)
+    grids = {p.name: np.asarray(values[p.name], dtype=float) if p.name in values else param_values(p)
+             for p in sim.params}
+    names = list(grids)
+    open_grid = dict(zip(names, np.ix_(*(grids[name] for name in names))))
+    grid_shape = tuple(len(grids[name]) for name in names)
+    point = sim.kernel(rng, **default_params(sim))
+    surface = sim.kernel(rng, **open_grid)
+    outputs = {}
+    for key, value in surface.items():
+        point_shape = np.shape(point[key])
+        outputs[key] = np.broadcast_to(value, grid_shape + point_shape)
+    return Sweep(sim.number, grids, outputs)
+
+
+def nearest_index(sweep, **params):
+    return tuple(int(np.abs(sweep.params[name] - params[name]).argmin()) for name in sweep.params)
+
+
+def row(sweep, index):
+    """The kernel output at one grid point, as if the kernel had been called there."""
+    return {key: value[index] for key, value in sweep.outputs.items()}
+
+
+def to_npz(sweep):
+    buf = io.BytesIO()
+    arrays = {"param_" + name: values for name, values in sweep.params.items()}
+    arrays.update(sweep.outputs)
+    np.savez_compressed(buf, **arrays)
+    return buf.getvalue()
+
+
+def draw_surface(ax, sweep, output):
+    """Plot one output of a one-parameter sweep against the swept parameter."""
+    (name, values), = sweep.params.items()
+    surface = sweep.outputs[output]
+    if surface.ndim == 1:
+        ax.plot(values, surface)
+        ax.set_xlabel(name)
+        ax.set_ylabel(output)
+    else:
+        image = ax.imshow(surface.reshape(len(values), -1), aspect="auto", origin="lower",
+                          extent=(0, surface[0].size, values[0], values[-1]))
+        ax.figure.colorbar(image, ax=ax, label=output)
+        ax.set_xlabel("sample")
+        ax.set_ylabel(name)
+    ax.set_title("Simulation {}: {} over {}".format(sweep.number, output, name))